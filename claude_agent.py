@@ -7,8 +7,9 @@ with specific system prompts and working directories.
 import subprocess
 import json
 import re
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from config import CLAUDE_CLI_CONFIG
 from credit_checker import CreditChecker, InsufficientCreditsError
 
@@ -159,10 +160,84 @@ class ClaudeCodeAgent:
             # Don't disrupt execution if parsing fails
             pass
 
+    def _stream_process(
+        self,
+        cmd: list,
+        timeout: int,
+        stdout_lines: list,
+        log_sink: Optional[Callable[[str], None]] = None
+    ) -> subprocess.CompletedProcess:
+        """
+        Run Claude Code, handing each stdout line on as soon as it is produced
+
+        Lines are sanitized before they reach the terminal (verbose mode) or
+        log_sink. stderr is drained on a helper thread so neither pipe can
+        fill up and stall the child, and a timer kills it on timeout.
+
+        Args:
+            cmd: Command to run
+            timeout: Timeout in seconds
+            stdout_lines: List that receives the raw stdout lines
+            log_sink: Optional callback receiving each sanitized line
+
+        Returns:
+            CompletedProcess with the collected stdout and stderr
+
+        Raises:
+            subprocess.TimeoutExpired: If the process outlived the timeout
+        """
+        process = subprocess.Popen(
+            cmd,
+            cwd=str(self.workspace),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1  # Line buffered
+        )
+
+        stderr_chunks = []
+        stderr_thread = threading.Thread(
+            target=lambda: stderr_chunks.append(process.stderr.read()),
+            daemon=True
+        )
+        stderr_thread.start()
+
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            process.kill()
+
+        killer = threading.Timer(timeout, kill_on_timeout)
+        killer.start()
+        try:
+            for line in process.stdout:
+                stdout_lines.append(line)
+                sanitized_line = self._sanitize_log_output(line)
+                if self.verbose:
+                    print(sanitized_line, end='', flush=True)
+                if log_sink:
+                    log_sink(sanitized_line.rstrip('\n'))
+            return_code = process.wait()
+        finally:
+            killer.cancel()
+            stderr_thread.join()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        return subprocess.CompletedProcess(
+            args=cmd,
+            returncode=return_code,
+            stdout=''.join(stdout_lines),
+            stderr=''.join(stderr_chunks)
+        )
+
     def execute_task(
         self,
         task: str,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        log_sink: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
         """
         Execute a task using Claude Code
@@ -170,6 +245,8 @@ class ClaudeCodeAgent:
         Args:
             task: The task description/prompt
             timeout: Optional timeout in seconds (default: from config)
+            log_sink: Optional callback receiving each (sanitized) output line
+                as it is produced, e.g. to write it to the workflow log
 
         Returns:
             Dictionary with execution results:
@@ -208,7 +285,6 @@ class ClaudeCodeAgent:
 
         try:
             import time
-            import threading
             start_time = time.time()
 
             # Create stop event before defining the function that uses it
@@ -232,72 +308,22 @@ class ClaudeCodeAgent:
 
             try:
                 # Execute Claude Code as subprocess
-                if self.verbose:
-                    # Verbose mode: Stream output in real-time
-                    print(f"\n{'─'*60}")
-                    print(f"📡 VERBOSE MODE: Streaming Claude Code output...")
-                    print(f"{'─'*60}\n")
+                if self.verbose or log_sink:
+                    if self.verbose:
+                        print(f"\n{'─'*60}")
+                        print(f"📡 VERBOSE MODE: Streaming Claude Code output...")
+                        print(f"{'─'*60}\n")
 
-                    # Use Popen to stream output line by line
-                    process = subprocess.Popen(
-                        cmd,
-                        cwd=str(self.workspace),
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        bufsize=1  # Line buffered
-                    )
-
-                    # Collect output while streaming
                     stdout_lines = []
-                    stderr_lines = []
-
-                    import select
-                    import sys
-
-                    # Stream output in real-time
-                    while True:
-                        # Check if process has finished
-                        return_code = process.poll()
-
-                        # Read stdout
-                        if process.stdout:
-                            line = process.stdout.readline()
-                            if line:
-                                stdout_lines.append(line)
-                                # Print to terminal (sanitize first for security)
-                                sanitized_line = self._sanitize_log_output(line)
-                                print(sanitized_line, end='', flush=True)
-
-                        # Read stderr
-                        if process.stderr:
-                            err_line = process.stderr.readline()
-                            if err_line:
-                                stderr_lines.append(err_line)
-
-                        # Break if process finished and no more output
-                        if return_code is not None and not line and not err_line:
-                            break
-
-                        # Check timeout
-                        if time.time() - start_time > timeout:
-                            process.kill()
-                            raise subprocess.TimeoutExpired(cmd, timeout)
-
-                    # Create result object
-                    result = subprocess.CompletedProcess(
-                        args=cmd,
-                        returncode=return_code,
-                        stdout=''.join(stdout_lines),
-                        stderr=''.join(stderr_lines)
-                    )
+                    result = self._stream_process(cmd, timeout, stdout_lines, log_sink)
 
-                    print(f"\n{'─'*60}")
-                    print(f"📡 End of Claude Code output")
-                    print(f"{'─'*60}\n")
+                    if self.verbose:
+                        print(f"\n{'─'*60}")
+                        print(f"📡 End of Claude Code output")
+                        print(f"{'─'*60}\n")
 
-                    # Parse and display structured summary
-                    self._display_verbose_summary(stdout_lines)
+                        # Parse and display structured summary
+                        self._display_verbose_summary(stdout_lines)
                 else:
                     # Normal mode: Capture output silently
                     result = subprocess.run(
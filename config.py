@@ -42,6 +42,9 @@ WORKFLOW_CONFIG = {
     "require_tests_passing": True,  # Require tests to pass before PO review
     "max_agent_retries": 2,  # Maximum retries per agent on transient failures
     "retry_backoff_seconds": 5,  # Initial backoff time between retries (exponential)
+    # Run Security and Tester concurrently in git worktrees. The worktrees hold
+    # tracked files only: untracked deps (node_modules, venvs) are not present there
+    "parallel_review": False,
 }
 
 # Git user configuration
@@ -64,6 +67,7 @@ GITHUB_CONFIG = {
     "include_review_checklist": True, # Include comprehensive review checklist in PR
     "link_pr_to_issue": True,         # Link PRs back to originating issues
     "require_manual_review": True,    # Always require human review (no auto-merge)
+    "repository": os.getenv("GITHUB_REPOSITORY"),  # owner/repo; with GITHUB_TOKEN set, use the REST API instead of gh
 }
 
 # Deployment Configuration
@@ -20,10 +20,6 @@ import argparse
 from pathlib import Path
 from typing import Optional, Dict, Any
 import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
 from setup_github_repo import (
     check_gh_cli,
@@ -36,6 +32,32 @@ from setup_github_repo import (
 )
 
 
+def _get_client():
+    """
+    Create an Anthropic client, importing the SDK on first use
+
+    The anthropic package transitively imports httpx and pydantic, so it is
+    only loaded once a Claude call is actually needed.
+
+    Returns:
+        anthropic.Anthropic client
+    """
+    try:
+        import anthropic
+    except ImportError:
+        print("❌ anthropic package not installed")
+        print("   Install: pip install anthropic")
+        sys.exit(1)
+
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        print("❌ ANTHROPIC_API_KEY not found in environment")
+        print("   Create a .env file with: ANTHROPIC_API_KEY=your_key")
+        sys.exit(1)
+
+    return anthropic.Anthropic(api_key=api_key)
+
+
 def call_claude_api(prompt: str, system_prompt: str = None) -> str:
     """
     Call Claude API to enhance user story
@@ -47,17 +69,9 @@ def call_claude_api(prompt: str, system_prompt: str = None) -> str:
     Returns:
         Claude's response text
     """
-    try:
-        import anthropic
-
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            print("❌ ANTHROPIC_API_KEY not found in environment")
-            print("   Create a .env file with: ANTHROPIC_API_KEY=your_key")
-            sys.exit(1)
-
-        client = anthropic.Anthropic(api_key=api_key)
+    client = _get_client()
 
+    try:
         messages = [{"role": "user", "content": prompt}]
 
         kwargs = {
@@ -73,10 +87,6 @@ def call_claude_api(prompt: str, system_prompt: str = None) -> str:
 
         return response.content[0].text
 
-    except ImportError:
-        print("❌ anthropic package not installed")
-        print("   Install: pip install anthropic")
-        sys.exit(1)
     except Exception as e:
         print(f"❌ Error calling Claude API: {e}")
         sys.exit(1)
@@ -460,4 +470,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # Only read .env when the key isn't already exported
+    if not os.getenv("ANTHROPIC_API_KEY"):
+        from dotenv import load_dotenv
+        load_dotenv()
     sys.exit(main())
@@ -14,6 +14,12 @@ BLUE = '\033[0;34m'
 YELLOW = '\033[1;33m'
 RED = '\033[0;31m'
 NC = '\033[0m'  # No Color
+BAR = '=' * 60
+
+
+def _log(color: str, msg: str, end: str = "\n") -> None:
+    """Write one colored line to stdout in a single write"""
+    sys.stdout.write(f"{color}{msg}{NC}{end}")
 
 
 def parse_tasks_from_markdown(analysis_file: Path):
@@ -81,14 +87,14 @@ def create_github_issue(repo: str, task: dict) -> bool:
         if result.returncode == 0:
             # Extract issue number from output
             issue_url = result.stdout.strip()
-            print(f"{GREEN}✅ Created: #{issue_url.split('/')[-1]} - {title}{NC}")
+            _log(GREEN, f"✅ Created: #{issue_url.split('/')[-1]} - {title}")
             return True
         else:
-            print(f"{RED}❌ Failed to create '{title}': {result.stderr}{NC}")
+            _log(RED, f"❌ Failed to create '{title}': {result.stderr}")
             return False
 
     except Exception as e:
-        print(f"{RED}❌ Error creating issue '{title}': {e}{NC}")
+        _log(RED, f"❌ Error creating issue '{title}': {e}")
         return False
 
 
@@ -96,23 +102,24 @@ def main():
     analysis_file = Path("project_analysis.md")
 
     if not analysis_file.exists():
-        print(f"{RED}❌ Analysis file not found: {analysis_file}{NC}")
+        _log(RED, f"❌ Analysis file not found: {analysis_file}")
         print(f"Run: python analyze_project.py ~/Development/repos/ai-hedge-fund")
         sys.exit(1)
 
-    print(f"\n{BLUE}{'='*60}{NC}")
-    print(f"{BLUE}📝 Creating GitHub Issues from Analysis{NC}")
-    print(f"{BLUE}{'='*60}{NC}\n")
+    print()
+    _log(BLUE, BAR)
+    _log(BLUE, "📝 Creating GitHub Issues from Analysis")
+    _log(BLUE, BAR, end="\n\n")
 
     # Parse tasks
-    print(f"{BLUE}📋 Parsing tasks from {analysis_file}...{NC}\n")
+    _log(BLUE, f"📋 Parsing tasks from {analysis_file}...", end="\n\n")
     tasks = parse_tasks_from_markdown(analysis_file)
 
     if not tasks:
-        print(f"{RED}❌ No tasks found in analysis file{NC}")
+        _log(RED, "❌ No tasks found in analysis file")
         sys.exit(1)
 
-    print(f"{GREEN}Found {len(tasks)} tasks{NC}\n")
+    _log(GREEN, f"Found {len(tasks)} tasks", end="\n\n")
 
     # Get repository info
     try:
@@ -128,20 +135,20 @@ def main():
             import json
             repo_data = json.loads(result.stdout)
             repo = repo_data['nameWithOwner']
-            print(f"{BLUE}Repository: {repo}{NC}\n")
+            _log(BLUE, f"Repository: {repo}", end="\n\n")
         else:
-            print(f"{RED}❌ Could not determine repository{NC}")
+            _log(RED, "❌ Could not determine repository")
             sys.exit(1)
     except Exception as e:
-        print(f"{RED}❌ Error getting repository info: {e}{NC}")
+        _log(RED, f"❌ Error getting repository info: {e}")
         sys.exit(1)
 
     # Confirm with user
-    print(f"{YELLOW}About to create {len(tasks)} issues in {repo}{NC}")
+    _log(YELLOW, f"About to create {len(tasks)} issues in {repo}")
     response = input(f"Continue? [y/N]: ")
 
     if response.lower() != 'y':
-        print(f"{YELLOW}Cancelled{NC}")
+        _log(YELLOW, "Cancelled")
         sys.exit(0)
 
     print()
@@ -158,13 +165,14 @@ def main():
             failed += 1
 
     # Summary
-    print(f"\n{BLUE}{'='*60}{NC}")
-    print(f"{GREEN}✅ Created: {created} issues{NC}")
+    print()
+    _log(BLUE, BAR)
+    _log(GREEN, f"✅ Created: {created} issues")
     if failed > 0:
-        print(f"{RED}❌ Failed: {failed} issues{NC}")
-    print(f"{BLUE}{'='*60}{NC}\n")
+        _log(RED, f"❌ Failed: {failed} issues")
+    _log(BLUE, BAR, end="\n\n")
 
-    print(f"{GREEN}View issues at: https://github.com/{repo}/issues{NC}\n")
+    _log(GREEN, f"View issues at: https://github.com/{repo}/issues", end="\n\n")
 
 
 if __name__ == "__main__":
@@ -15,10 +15,60 @@ import sys
 import argparse
 from pathlib import Path
 import os
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Tool schema Claude calls once per task (structured output instead of a JSON blob)
+CREATE_ISSUE_TOOL = {
+    "name": "create_issue",
+    "description": "Record one concrete project task that will become a GitHub issue.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "title": {"type": "string", "description": "Clear, actionable title"},
+            "description": {"type": "string", "description": "User story, background, technical approach and key details"},
+            "acceptance_criteria": {"type": "array", "items": {"type": "string"}, "description": "3-5 specific, testable criteria"},
+            "edge_cases": {"type": "array", "items": {"type": "string"}, "description": "2-3 scenarios"},
+            "technical_notes": {"type": "string", "description": "Important considerations, constraints, or gotchas"},
+            "phase": {"type": "integer", "minimum": 1, "maximum": 4},
+            "phase_name": {"type": "string"},
+            "priority": {"type": "string", "enum": ["High", "Medium", "Low"]},
+            "complexity": {"type": "string", "enum": ["Simple", "Medium", "Complex"]},
+            "dependencies": {"type": "string", "description": "Comma-separated task titles or \"None\""}
+        },
+        "required": ["title", "description", "acceptance_criteria", "phase", "phase_name", "priority", "complexity"]
+    }
+}
+
+# Upper bound on create_issue round trips for one breakdown
+MAX_TOOL_TURNS = 40
+
+
+class TaskBreakdownError(RuntimeError):
+    """Claude's task breakdown came back incomplete or empty"""
+
+
+def _get_client():
+    """
+    Create an Anthropic client, importing the SDK on first use
+
+    The anthropic package transitively imports httpx and pydantic, so it is
+    only loaded once the task breakdown actually runs.
+
+    Returns:
+        anthropic.Anthropic client
+    """
+    try:
+        import anthropic
+    except ImportError:
+        print("❌ anthropic package not installed")
+        print("   Install: pip install anthropic")
+        sys.exit(1)
+
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        print("❌ ANTHROPIC_API_KEY not found in environment")
+        sys.exit(1)
+
+    return anthropic.Anthropic(api_key=api_key)
 
 
 def call_claude_for_task_breakdown(project_description: str) -> list:
@@ -30,17 +80,13 @@ def call_claude_for_task_breakdown(project_description: str) -> list:
 
     Returns:
         List of task dictionaries
-    """
-    try:
-        import anthropic
 
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            print("❌ ANTHROPIC_API_KEY not found in environment")
-            sys.exit(1)
-
-        client = anthropic.Anthropic(api_key=api_key)
+    Raises:
+        TaskBreakdownError: If the answer was cut off or contained no tasks
+    """
+    client = _get_client()
 
+    try:
         prompt = f"""Break down the following project into individual, concrete tasks that can be worked on.
 
 Project: {project_description}
@@ -68,72 +114,54 @@ For each task, create a DETAILED user story with:
 9. Estimated complexity (Simple/Medium/Complex)
 10. Dependencies on other tasks (if any)
 
-Format your response as a JSON array of task objects with these fields:
-- title: string
-- description: string (comprehensive as described above)
-- acceptance_criteria: array of strings (3-5 specific criteria)
-- edge_cases: array of strings (2-3 scenarios)
-- technical_notes: string (important considerations)
-- phase: number (1-4)
-- phase_name: string
-- priority: string ("High" | "Medium" | "Low")
-- complexity: string ("Simple" | "Medium" | "Complex")
-- dependencies: string (comma-separated task titles or "None")
-
-Example:
-[
-  {{
-    "title": "Setup Express.js backend with TypeScript",
-    "description": "As a developer, I want a properly configured Express.js backend with TypeScript so that we have a solid foundation for the API.\\n\\n**Background:** This is the foundation of our backend API. We need TypeScript for type safety and better developer experience.\\n\\n**Technical Approach:**\\n- Initialize Node.js project with TypeScript\\n- Configure Express.js with middleware\\n- Set up project structure (routes, controllers, models)\\n- Configure environment variables\\n\\n**Key Details:**\\n- Use Express 4.x with TypeScript 5.x\\n- Implement middleware: cors, helmet, express-validator\\n- Structure: src/routes, src/controllers, src/models, src/middleware\\n- Use dotenv for configuration",
-    "acceptance_criteria": [
-      "TypeScript compiles without errors",
-      "Express server starts on configured port",
-      "CORS is properly configured for frontend origin",
-      "Environment variables load from .env file",
-      "Basic health check endpoint returns 200 OK"
-    ],
-    "edge_cases": [
-      "Server fails to start if port is already in use",
-      "Environment variables missing - should show clear error",
-      "Invalid TypeScript configuration - should fail build"
-    ],
-    "technical_notes": "Use ts-node-dev for development hot reload. Ensure tsconfig.json has strict mode enabled. Configure nodemon to ignore build directory.",
-    "phase": 1,
-    "phase_name": "Foundation",
-    "priority": "High",
-    "complexity": "Medium",
-    "dependencies": "None"
-  }}
-]
-
-Return ONLY the JSON array, no other text."""
-
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=8000,  # Increased for detailed user stories
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        import json
-        response_text = response.content[0].text.strip()
-
-        # Extract JSON from response (handle markdown code blocks)
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
+Call the create_issue tool once for every task, in phase order. Once every task has been recorded, reply with a short plain-text confirmation."""
+
+        messages = [{"role": "user", "content": prompt}]
+        tasks = []
+        for turn in range(MAX_TOOL_TURNS):
+            response = client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=8000,  # Increased for detailed user stories
+                tools=[CREATE_ISSUE_TOOL],
+                # Force at least one task up front, then let Claude say when it is done
+                tool_choice={"type": "any"} if turn == 0 else {"type": "auto"},
+                messages=messages
+            )
 
-        tasks = json.loads(response_text)
-        return tasks
+            if response.stop_reason == "max_tokens":
+                raise TaskBreakdownError(
+                    f"Claude's answer hit the token limit after {len(tasks)} tasks - the breakdown is incomplete"
+                )
+
+            # Each tool_use block is one structured task - no JSON scraping needed
+            tool_results = []
+            for block in response.content:
+                if block.type == "tool_use":
+                    if block.name == CREATE_ISSUE_TOOL["name"]:
+                        tasks.append(block.input)
+                    tool_results.append({"type": "tool_result", "tool_use_id": block.id, "content": "Recorded"})
+
+            if response.stop_reason != "tool_use":
+                break
+
+            # Acknowledge the calls so Claude continues with the remaining tasks
+            messages.append({"role": "assistant", "content": response.content})
+            messages.append({"role": "user", "content": tool_results})
+        else:
+            raise TaskBreakdownError(
+                f"Claude was still creating tasks after {MAX_TOOL_TURNS} turns - the breakdown is incomplete"
+            )
 
-    except ImportError:
-        print("❌ anthropic package not installed")
-        print("   Install: pip install anthropic")
-        sys.exit(1)
+    except TaskBreakdownError:
+        raise
     except Exception as e:
         print(f"❌ Error calling Claude API: {e}")
         sys.exit(1)
 
+    if not tasks:
+        raise TaskBreakdownError("Claude returned no tasks for this project")
+    return tasks
+
 
 def ensure_label_exists(repo: str, name: str, description: str, color: str) -> None:
     """
@@ -346,7 +374,11 @@ def main():
 
     # Break down project into tasks
     print("🤖 Using Claude to break down project into tasks...")
-    tasks = call_claude_for_task_breakdown(project_description)
+    try:
+        tasks = call_claude_for_task_breakdown(project_description)
+    except TaskBreakdownError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
     print(f"   Found {len(tasks)} tasks")
     print("")
 
@@ -401,4 +433,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # Only read .env when the key isn't already exported
+    if not os.getenv("ANTHROPIC_API_KEY"):
+        from dotenv import load_dotenv
+        load_dotenv()
     main()
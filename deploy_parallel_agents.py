@@ -6,7 +6,7 @@ Deploys and manages multiple AI Scrum Master worker instances for parallel execu
 Supports local multi-process testing and distributed deployment scenarios.
 
 Usage:
-    # Deploy 3 parallel agents locally
+    # Deploy 3 parallel agents locally (they work through GitHub's ready-for-dev issues)
     python deploy_parallel_agents.py --workers 3 --mode local
 
     # Deploy with orchestrator service
@@ -18,23 +18,31 @@ Usage:
 
 import os
 import sys
+import json
 import time
+import queue
+import random
+import shutil
 import signal
 import argparse
 import logging
 import subprocess
+from logging.handlers import QueueHandler, QueueListener
 import multiprocessing
+from collections import deque, namedtuple
+from multiprocessing.connection import wait as wait_for_sentinels
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from orchestrator import Orchestrator
+from orchestrator import Orchestrator, WorkflowResult
+from git_manager import GitManager
 from github_integration import GitHubIntegration
-from config import GITHUB_CONFIG
+from config import GITHUB_CONFIG, CLAUDE_CLI_CONFIG, AGENT_ROLES, WORKFLOW_CONFIG
 
 # Configure logging
 logging.basicConfig(
@@ -43,6 +51,76 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Posted into each worker's queue by shutdown(); compared by value since
+# queue items are pickled across the process boundary
+SHUTDOWN_SENTINEL = "__shutdown__"
+
+# How long an idle worker blocks on its own queue before re-checking peers
+IDLE_POLL_S = 5.0
+
+# Grace period for workers to exit after the shutdown sentinel
+SHUTDOWN_GRACE_S = 5.0
+
+# Heartbeat limits: an idle worker beats at least every IDLE_POLL_S; a busy
+# one only between issues, so allow for a full worst-case workflow: every
+# iteration (the first plus each revision) runs all agents, Product Owner
+# included, plus a possible Tester re-run after a parallel-review conflict,
+# and each agent call may be retried with exponential backoff
+_MAX_RETRIES = WORKFLOW_CONFIG.get("max_agent_retries", 2)
+_AGENT_CALL_S = (
+    CLAUDE_CLI_CONFIG["timeout"] * (1 + _MAX_RETRIES)
+    + sum(WORKFLOW_CONFIG.get("retry_backoff_seconds", 5) * 2 ** i for i in range(_MAX_RETRIES))
+)
+HB_TIMEOUT_S = 3 * IDLE_POLL_S
+WORKFLOW_TIMEOUT_S = (
+    _AGENT_CALL_S * (len(AGENT_ROLES) + 1) * (WORKFLOW_CONFIG["max_revisions"] + 1)
+) * 1.25  # Margin for git, cleanup and the PR
+
+# Pre-initialized repository that per-issue workspaces are copied from
+TEMPLATE_WORKSPACE = "_template"
+
+# How often monitor_workers logs a one-line JSON summary
+SUMMARY_LOG_INTERVAL_S = 60.0
+
+# Mock test schedule: simulated seconds, and how often each worker picks up an issue
+SIM_TICKS = 10
+SIM_PICKUP_EVERY = 3
+SIM_COST_PER_ISSUE = 0.08
+
+# Status table pieces, built once and filled per refresh
+_STATUS_SYMBOLS = {
+    "running": "🟢",
+    "idle": "⚪",
+    "working": "🔵",
+    "failed": "🔴",
+    "stopped": "⚫"
+}
+_STATUS_HEADER = "\n" + "=" * 80 + "\nPARALLEL WORKERS STATUS - {ts}\n" + "=" * 80 + "\n"
+_STATUS_ROW = "{symbol} {worker_id:15s} | Status: {status:10s} | Completed: {completed:3d} | Cost: ${cost:7.2f}\n"
+_STATUS_FOOTER = "=" * 80 + "\n\n"
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """
+    copytree copy_function: hard-link immutable git objects, copy the rest
+
+    Files under .git/objects are never modified in place, so sharing them
+    between workspaces is safe. Working-tree files, the index and refs can
+    be rewritten in place and must stay private to each workspace.
+    """
+    if f"{os.sep}.git{os.sep}objects{os.sep}" in src:
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            # Cross-device or unsupported filesystem - fall back to a copy
+            pass
+    return shutil.copy2(src, dst)
+
+
+# Lightweight stand-in for a GitHub issue in the mock simulation
+MockIssue = namedtuple("MockIssue", "number title body")
+
 
 @dataclass
 class WorkerStatus:
@@ -73,7 +151,8 @@ class ParallelAgentManager:
         num_workers: int,
         mode: str = "local",
         orchestrator_url: Optional[str] = None,
-        workspace_base: Optional[Path] = None
+        workspace_base: Optional[Path] = None,
+        pin_cpus: bool = False
     ):
         """
         Initialize parallel agent manager
@@ -83,25 +162,66 @@ class ParallelAgentManager:
             mode: Deployment mode (local, distributed, test)
             orchestrator_url: Orchestrator service URL (for distributed mode)
             workspace_base: Base directory for worker workspaces
+            pin_cpus: Pin each local worker to its own CPU (Linux only)
         """
         self.num_workers = num_workers
         self.mode = mode
+        self.pin_cpus = pin_cpus
         self.orchestrator_url = orchestrator_url
         self.workspace_base = workspace_base or Path("./parallel_workspace")
         self.workspace_base.mkdir(parents=True, exist_ok=True)
 
         self.workers: Dict[str, WorkerStatus] = {}
         self.processes: Dict[str, multiprocessing.Process] = {}
-        self.shutdown_event = multiprocessing.Event()
 
-        logger.info(f"Parallel Agent Manager initialized")
-        logger.info(f"  Mode: {mode}")
-        logger.info(f"  Workers: {num_workers}")
-        logger.info(f"  Workspace: {self.workspace_base}")
+        # Local workers send log records here; one listener in this process
+        # writes them out, so workers never contend on stderr
+        self._log_queue = multiprocessing.Queue(-1)
+        self._log_listener: Optional[QueueListener] = None
+
+        # Bumped on every visible WorkerStatus change (see _bump) so the
+        # status table is only redrawn when something actually changed
+        self._state_version = 0
+        self._last_printed_version = -1
+
+        # Pre-initialized repository per-issue workspaces are copied from
+        # (set up by deploy_workers in local mode)
+        self._template_ws: Optional[Path] = None
+
+        # One private queue per worker (indexed by worker position); idle
+        # workers steal from peers instead of contending on a shared queue.
+        # Shutdown is delivered in-band as SHUTDOWN_SENTINEL.
+        self._queues: List[multiprocessing.Queue] = [
+            multiprocessing.Queue() for _ in range(num_workers)
+        ]
+
+        # Shared-memory heartbeat slots (time.monotonic(), 0 = never) and the
+        # issue each worker is on (0 = idle). One writer per slot, so no lock.
+        self._heartbeats = multiprocessing.Array('d', num_workers, lock=False)
+        self._current_issue = multiprocessing.Array('i', num_workers, lock=False)
+
+        # Per-worker totals, written by the worker and summed by the manager
+        self._completed = multiprocessing.Array('q', num_workers, lock=False)
+        self._cost = multiprocessing.Array('d', num_workers, lock=False)
+
+        logger.info("Parallel Agent Manager initialized")
+        logger.info("  Mode: %s", mode)
+        logger.info("  Workers: %d", num_workers)
+        logger.info("  Workspace: %s", self.workspace_base)
 
     def deploy_workers(self):
         """Deploy all worker instances"""
-        logger.info(f"Deploying {self.num_workers} workers...")
+        logger.info("Deploying %d workers...", self.num_workers)
+
+        if self.mode == "local":
+            # Initialize the git repository once; workers copy it per issue
+            self._template_ws = self.workspace_base / TEMPLATE_WORKSPACE
+            if not (self._template_ws / ".git").exists():
+                GitManager(self._template_ws).initialize_repository()
+
+        if self.mode == "distributed":
+            # Import once in the parent so forked workers inherit it
+            import worker.distributed_worker  # noqa: F401
 
         for i in range(self.num_workers):
             worker_id = f"worker-{i+1:02d}"
@@ -120,15 +240,14 @@ class ParallelAgentManager:
                 # Local multi-process mode
                 process = multiprocessing.Process(
                     target=self._run_local_worker,
-                    args=(worker_id, worker_workspace),
+                    args=(i, worker_id, worker_workspace),
                     name=worker_id
                 )
                 process.start()
                 self.processes[worker_id] = process
-                self.workers[worker_id].pid = process.pid
-                self.workers[worker_id].status = "idle"
+                self._bump(self.workers[worker_id], pid=process.pid, status="idle")
 
-                logger.info(f"  ✅ Started {worker_id} (PID: {process.pid})")
+                logger.info("  ✅ Started %s (PID: %s)", worker_id, process.pid)
 
             elif self.mode == "distributed":
                 # Distributed mode - launch worker connecting to orchestrator
@@ -142,67 +261,184 @@ class ParallelAgentManager:
                 )
                 process.start()
                 self.processes[worker_id] = process
-                self.workers[worker_id].pid = process.pid
-                self.workers[worker_id].status = "idle"
+                self._bump(self.workers[worker_id], pid=process.pid, status="idle")
 
-                logger.info(f"  ✅ Started {worker_id} (PID: {process.pid})")
+                logger.info("  ✅ Started %s (PID: %s)", worker_id, process.pid)
 
             elif self.mode == "test":
                 # Test mode - simulate workers
-                logger.info(f"  ✅ Simulated {worker_id}")
-                self.workers[worker_id].status = "idle"
+                logger.info("  ✅ Simulated %s", worker_id)
+                self._bump(self.workers[worker_id], status="idle")
+
+        if self.mode == "local" and self._log_listener is None:
+            # Started after the forks so no child inherits the listener thread
+            self._log_listener = QueueListener(
+                self._log_queue, *logging.getLogger().handlers, respect_handler_level=True
+            )
+            self._log_listener.start()
 
-        logger.info(f"✅ All {self.num_workers} workers deployed")
+        logger.info("✅ All %d workers deployed", self.num_workers)
 
-    def _run_local_worker(self, worker_id: str, workspace: Path):
+    def dispatch_issues(self, issues: List[Dict[str, Any]]):
         """
-        Run a local worker in its own process
+        Distribute issues round-robin across the workers' private queues
 
-        This worker polls for GitHub issues with 'ready-for-dev' label
-        and processes them independently.
+        Args:
+            issues: Issue dicts (number, title, body, labels)
         """
-        logger.info(f"[{worker_id}] Starting local worker...")
+        for i, issue in enumerate(issues):
+            self._queues[i % self.num_workers].put(issue)
+
+        logger.info("Dispatched %d issues across %d workers", len(issues), self.num_workers)
+
+    def dispatch_ready_issues(self, github: GitHubIntegration, label: str = 'ready-for-dev', limit: int = 10) -> int:
+        """
+        Fetch the ready-for-dev issues from GitHub and queue them for the workers
+
+        Args:
+            github: GitHub integration to list issues with
+            label: Label marking issues as ready for development
+            limit: Maximum number of issues to fetch
+
+        Returns:
+            Number of issues dispatched
+        """
+        issues = [
+            {'number': issue.number, 'title': issue.title, 'body': issue.body, 'labels': list(issue.labels)}
+            for issue in github.get_ready_issues(label, limit, include_body=True)
+        ]
+        if issues:
+            self.dispatch_issues(issues)
+        else:
+            logger.info("No issues labeled '%s' to dispatch", label)
+        return len(issues)
+
+    @staticmethod
+    def _worker_init(worker_id: str, log_queue: multiprocessing.Queue):
+        """
+        One-time setup for a local worker process
+
+        Runs once when the child starts so the per-issue path only pays for
+        the workflow itself. Orchestrator is imported at module scope, so the
+        child inherits it rather than importing it per issue.
+        """
+        # Hand log records to the manager's listener instead of writing stderr
+        root = logging.getLogger()
+        root.handlers.clear()
+        root.addHandler(QueueHandler(log_queue))
+
+        logger.info("[%s] Starting local worker...", worker_id)
 
         # Setup signal handlers
         signal.signal(signal.SIGTERM, lambda s, f: sys.exit(0))
         signal.signal(signal.SIGINT, lambda s, f: sys.exit(0))
 
+    @staticmethod
+    def _pin_to_cpu(worker_idx: int, worker_id: str):
+        """
+        Pin the current process to one CPU from its allowed set
+
+        Keeps the scheduler from migrating a worker between cores (and NUMA
+        nodes), so its heap stays local. Child processes (git, the Claude
+        CLI) inherit the affinity, and the kernel's first-touch policy keeps
+        their memory on the same node.
+        """
+        if not hasattr(os, "sched_setaffinity"):
+            logger.warning("[%s] CPU pinning not supported on this platform", worker_id)
+            return
+
+        cpus = sorted(os.sched_getaffinity(0))
+        core = cpus[worker_idx % len(cpus)]
+        os.sched_setaffinity(0, {core})
+        logger.info("[%s] Pinned to CPU %d", worker_id, core)
+
+    def _run_local_worker(self, worker_idx: int, worker_id: str, workspace: Path):
+        """
+        Run a local worker in its own process
+
+        The process is long-lived: it is initialized once and then handles
+        issues one after another. It drains its own issue queue first and
+        steals from peers once it runs dry. It exits when it receives
+        SHUTDOWN_SENTINEL.
+        """
+        self._worker_init(worker_id, self._log_queue)
+        if self.pin_cpus:
+            self._pin_to_cpu(worker_idx, worker_id)
+
         try:
-            while not self.shutdown_event.is_set():
-                # Check for available work
-                issue = self._fetch_next_issue(worker_id)
+            while True:
+                self._heartbeats[worker_idx] = time.monotonic()
+                issue = self._fetch_next_issue(worker_idx)
 
-                if not issue:
-                    # No work available - wait
-                    time.sleep(10)
-                    continue
+                if issue == SHUTDOWN_SENTINEL:
+                    logger.info("[%s] Shutdown requested", worker_id)
+                    break
 
-                # Process issue
-                logger.info(f"[{worker_id}] Processing issue #{issue['number']}: {issue['title']}")
+                if issue is None:
+                    # Timed out waiting - look for work to steal again
+                    continue
 
+                self._current_issue[worker_idx] = issue['number']
+                self._heartbeats[worker_idx] = time.monotonic()
                 try:
-                    # Create isolated workspace for this issue
-                    issue_workspace = workspace / f"issue-{issue['number']}"
-                    issue_workspace.mkdir(parents=True, exist_ok=True)
+                    result = self._process_one_issue(worker_id, workspace, issue)
+                finally:
+                    self._current_issue[worker_idx] = 0
 
-                    # Initialize orchestrator
-                    orchestrator = Orchestrator(workspace_dir=issue_workspace, verbose=False)
+                if result is not None:
+                    self._cost[worker_idx] += result.total_cost
+                    if result.approved:
+                        self._completed[worker_idx] += 1
 
-                    # Execute workflow
-                    user_story = f"{issue['title']}\n\n{issue.get('body', '')}"
-                    result = orchestrator.process_user_story(user_story)
+        except KeyboardInterrupt:
+            logger.info("[%s] Shutting down...", worker_id)
 
-                    if result.approved:
-                        logger.info(f"[{worker_id}] ✅ Issue #{issue['number']} approved (cost: ${result.total_cost:.4f})")
-                        # Mark complete (in real implementation, create PR)
-                    else:
-                        logger.warning(f"[{worker_id}] ❌ Issue #{issue['number']} not approved")
+    def _process_one_issue(
+        self,
+        worker_id: str,
+        workspace: Path,
+        issue: Dict[str, Any]
+    ) -> Optional[WorkflowResult]:
+        """
+        Run the full workflow for a single issue
+
+        Args:
+            worker_id: ID of the worker handling the issue
+            workspace: Worker's base workspace directory
+            issue: Issue dict (number, title, body)
 
-                except Exception as e:
-                    logger.error(f"[{worker_id}] Error processing issue #{issue['number']}: {e}", exc_info=True)
+        Returns:
+            WorkflowResult, or None if the workflow raised
+        """
+        logger.info("[%s] Processing issue #%d: %s", worker_id, issue['number'], issue['title'])
 
-        except KeyboardInterrupt:
-            logger.info(f"[{worker_id}] Shutting down...")
+        try:
+            # Create isolated workspace for this issue
+            issue_workspace = workspace / f"issue-{issue['number']}"
+            if self._template_ws is not None and not issue_workspace.exists():
+                # Start from the template repository instead of a fresh git init
+                shutil.copytree(self._template_ws, issue_workspace, copy_function=_link_or_copy)
+            else:
+                issue_workspace.mkdir(parents=True, exist_ok=True)
+
+            # Initialize orchestrator
+            orchestrator = Orchestrator(workspace_dir=issue_workspace, verbose=False)
+
+            # Execute workflow
+            user_story = f"{issue['title']}\n\n{issue.get('body', '')}"
+            result = orchestrator.process_user_story(user_story)
+
+            if result.approved:
+                logger.info("[%s] ✅ Issue #%d approved (cost: $%.4f)", worker_id, issue['number'], result.total_cost)
+                # Mark complete (in real implementation, create PR)
+            else:
+                logger.warning("[%s] ❌ Issue #%d not approved", worker_id, issue['number'])
+
+            return result
+
+        except Exception as e:
+            logger.error("[%s] Error processing issue #%d: %s", worker_id, issue['number'], e, exc_info=True)
+            return None
 
     def _run_distributed_worker(self, worker_id: str, workspace: Path, orchestrator_url: str):
         """
@@ -210,8 +446,8 @@ class ParallelAgentManager:
         """
         from worker.distributed_worker import DistributedWorker
 
-        logger.info(f"[{worker_id}] Starting distributed worker...")
-        logger.info(f"[{worker_id}] Orchestrator: {orchestrator_url}")
+        logger.info("[%s] Starting distributed worker...", worker_id)
+        logger.info("[%s] Orchestrator: %s", worker_id, orchestrator_url)
 
         # Set environment for this worker
         os.environ["WORKER_ID"] = worker_id
@@ -222,93 +458,254 @@ class ParallelAgentManager:
             worker = DistributedWorker(worker_id, orchestrator_url)
             worker.run()
         except KeyboardInterrupt:
-            logger.info(f"[{worker_id}] Shutting down...")
+            logger.info("[%s] Shutting down...", worker_id)
 
-    def _fetch_next_issue(self, worker_id: str) -> Optional[Dict[str, Any]]:
+    def _fetch_next_issue(self, worker_idx: int) -> Optional[Dict[str, Any]]:
         """
-        Fetch next available issue for worker (simple implementation)
+        Fetch next available issue for worker
+
+        Pops from the worker's own queue; when that is empty, tries the
+        other workers' queues in random order (work stealing) so uneven
+        issue durations don't leave workers idle while others have a backlog.
+        With nothing queued anywhere it blocks on its own queue, so an idle
+        worker uses no CPU and wakes as soon as work or shutdown arrives.
+
+        Args:
+            worker_idx: Index of the requesting worker
 
-        In production, this would use orchestrator service or distributed lock
+        Returns:
+            Issue dict, SHUTDOWN_SENTINEL, or None if nothing arrived within IDLE_POLL_S
         """
-        # This is a simplified implementation for local testing
-        # Real implementation would use orchestrator service
-        return None
+        own_queue = self._queues[worker_idx]
+        try:
+            return own_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+        victims = [i for i in range(self.num_workers) if i != worker_idx]
+        random.shuffle(victims)
+        for victim in victims:
+            try:
+                issue = self._queues[victim].get_nowait()
+            except queue.Empty:
+                continue
+            if issue == SHUTDOWN_SENTINEL:
+                # Not ours to consume - hand it back
+                self._queues[victim].put(issue)
+                continue
+            logger.info("[worker-%02d] Stole issue #%d from worker-%02d", worker_idx + 1, issue['number'], victim + 1)
+            return issue
+
+        try:
+            return own_queue.get(timeout=IDLE_POLL_S)
+        except queue.Empty:
+            return None
 
-    def monitor_workers(self, duration: int = 60):
+    def monitor_workers(
+        self,
+        duration: int = 60,
+        refresh_interval: float = 5.0,
+        force_redraw_interval: float = 0.0
+    ):
         """
         Monitor worker status for specified duration
 
+        Blocks on the worker processes' sentinels, so a crashed worker is
+        reported as soon as it exits instead of on the next polling tick.
+        Workers whose heartbeat goes stale are treated as hung and stopped.
+        The status table is only redrawn when a worker changed.
+
         Args:
             duration: Monitoring duration in seconds (0 = infinite)
+            refresh_interval: Seconds between status checks
+            force_redraw_interval: Redraw at least this often even without
+                changes (0 = only on change)
         """
-        logger.info(f"Monitoring workers for {duration}s...")
-
-        start_time = time.time()
+        logger.info("Monitoring workers for %ss...", duration)
+
+        start_time = time.monotonic()
+        last_redraw = last_summary = start_time
+        sentinels = {
+            process.sentinel: worker_id
+            for worker_id, process in self.processes.items()
+            if process.is_alive()
+        }
 
         try:
             while True:
-                # Check if duration exceeded
-                if duration > 0 and (time.time() - start_time) > duration:
-                    break
+                timeout = refresh_interval
+                if duration > 0:
+                    remaining = duration - (time.monotonic() - start_time)
+                    if remaining <= 0:
+                        break
+                    timeout = min(timeout, remaining)
 
                 # Print status
-                self._print_status()
+                now = time.monotonic()
+                self._refresh_from_workers()
+                force = force_redraw_interval > 0 and now - last_redraw >= force_redraw_interval
+                if self._print_status(force=force):
+                    last_redraw = now
+
+                if now - last_summary >= SUMMARY_LOG_INTERVAL_S:
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("%s", json.dumps(self.get_summary(), separators=(",", ":")))
+                    last_summary = now
+
+                # Sleep in the kernel until a worker exits or the redraw timer fires
+                if sentinels:
+                    ready = wait_for_sentinels(list(sentinels), timeout=timeout)
+                else:
+                    time.sleep(timeout)
+                    ready = []
 
                 # Check worker health
-                for worker_id, process in self.processes.items():
-                    if not process.is_alive():
-                        logger.warning(f"Worker {worker_id} died unexpectedly!")
-                        self.workers[worker_id].status = "failed"
+                for sentinel in ready:
+                    worker_id = sentinels.pop(sentinel)
+                    exitcode = self.processes[worker_id].exitcode
+                    if exitcode is not None and exitcode < 0:
+                        reason = f"killed by signal {-exitcode}"
+                    else:
+                        reason = f"exit code {exitcode}"
+                    logger.warning("Worker %s died unexpectedly (%s)!", worker_id, reason)
+                    self._bump(self.workers[worker_id], status="failed")
 
-                time.sleep(5)
+                for worker_id in self._stale_workers():
+                    process = self.processes[worker_id]
+                    sentinels.pop(process.sentinel, None)
+                    logger.warning("Worker %s stopped sending heartbeats - terminating", worker_id)
+                    self._bump(self.workers[worker_id], status="failed")
+                    process.terminate()
 
         except KeyboardInterrupt:
             logger.info("Monitoring interrupted")
 
-    def _print_status(self):
-        """Print current status of all workers"""
-        print("\n" + "="*80)
-        print(f"PARALLEL WORKERS STATUS - {datetime.now().strftime('%H:%M:%S')}")
-        print("="*80)
+    def _refresh_from_workers(self):
+        """Copy the workers' shared-memory slots into the WorkerStatus records"""
+        if self.mode != "local":
+            return
+
+        now_mono = time.monotonic()
+        now = datetime.now()
+        for idx, status in enumerate(self.workers.values()):
+            self._bump(status, issues_completed=self._completed[idx], total_cost=self._cost[idx])
+            beat = self._heartbeats[idx]
+            if beat:
+                status.last_heartbeat = now - timedelta(seconds=now_mono - beat)
+            if status.status in ("failed", "stopped"):
+                continue
+            issue_number = self._current_issue[idx]
+            self._bump(
+                status,
+                current_issue=issue_number or None,
+                status="working" if issue_number else "idle"
+            )
 
-        for worker_id, status in self.workers.items():
-            status_symbol = {
-                "running": "🟢",
-                "idle": "⚪",
-                "working": "🔵",
-                "failed": "🔴",
-                "stopped": "⚫"
-            }.get(status.status, "❓")
+    def _stale_workers(self) -> List[str]:
+        """
+        Find live workers whose heartbeat is older than allowed
 
-            print(f"{status_symbol} {worker_id:15s} | "
-                  f"Status: {status.status:10s} | "
-                  f"Completed: {status.issues_completed:3d} | "
-                  f"Cost: ${status.total_cost:7.2f}")
+        Returns:
+            IDs of workers that look hung
+        """
+        stale = []
+        now = time.monotonic()
+        for idx, (worker_id, status) in enumerate(self.workers.items()):
+            process = self.processes.get(worker_id)
+            beat = self._heartbeats[idx]
+            if process is None or not process.is_alive() or not beat or status.status == "failed":
+                continue
+            limit = WORKFLOW_TIMEOUT_S if self._current_issue[idx] else HB_TIMEOUT_S
+            if now - beat > limit:
+                stale.append(worker_id)
+        return stale
+
+    def _bump(self, worker: WorkerStatus, **changes):
+        """
+        Apply field changes to a worker, bumping the state version on any change
 
-        print("="*80 + "\n")
+        Args:
+            worker: WorkerStatus to update
+            **changes: Field names and their new values
+        """
+        for name, value in changes.items():
+            if getattr(worker, name) != value:
+                setattr(worker, name, value)
+                self._state_version += 1
+
+    def _print_status(self, force: bool = False) -> bool:
+        """
+        Print current status of all workers (one write per refresh)
+
+        Skipped when nothing changed since the last redraw.
+
+        Args:
+            force: Redraw even if nothing changed
+
+        Returns:
+            True if the table was printed
+        """
+        if not force and self._state_version == self._last_printed_version:
+            return False
+        self._last_printed_version = self._state_version
+
+        buf = [_STATUS_HEADER.format(ts=datetime.now().strftime('%H:%M:%S'))]
+        buf.extend(
+            _STATUS_ROW.format(
+                symbol=_STATUS_SYMBOLS.get(status.status, "❓"),
+                worker_id=worker_id,
+                status=status.status,
+                completed=status.issues_completed,
+                cost=status.total_cost
+            )
+            for worker_id, status in self.workers.items()
+        )
+        buf.append(_STATUS_FOOTER)
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
+        return True
 
     def shutdown(self):
         """Gracefully shutdown all workers"""
         logger.info("Shutting down all workers...")
 
-        self.shutdown_event.set()
-
-        # Terminate all processes
+        if self.mode == "local":
+            # Drop issues nobody has started, then ask each worker to exit
+            for work_queue in self._queues:
+                try:
+                    while True:
+                        work_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                work_queue.put(SHUTDOWN_SENTINEL)
+
+            # Give idle workers a moment to exit on their own
+            deadline = time.monotonic() + SHUTDOWN_GRACE_S
+            for process in self.processes.values():
+                process.join(timeout=max(0.0, deadline - time.monotonic()))
+
+        # Terminate whatever is still busy
         for worker_id, process in self.processes.items():
             if process.is_alive():
-                logger.info(f"  Stopping {worker_id}...")
+                logger.info("  Stopping %s...", worker_id)
                 process.terminate()
                 process.join(timeout=5)
 
                 if process.is_alive():
-                    logger.warning(f"  Force killing {worker_id}...")
+                    logger.warning("  Force killing %s...", worker_id)
                     process.kill()
                     process.join()
 
+        # Flush whatever the workers logged on their way out
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+
         logger.info("✅ All workers stopped")
 
     def get_summary(self) -> Dict[str, Any]:
         """Get summary statistics"""
+        self._refresh_from_workers()
         total_completed = sum(w.issues_completed for w in self.workers.values())
         total_cost = sum(w.total_cost for w in self.workers.values())
         active_workers = sum(1 for w in self.workers.values() if w.status in ["idle", "working"])
@@ -322,15 +719,19 @@ class ParallelAgentManager:
         }
 
 
-def run_parallel_test(num_workers: int, num_issues: int):
+def run_parallel_test(num_workers: int, num_issues: int, realtime: bool = False):
     """
     Run a parallel test with mock issues
 
+    The run is an event-driven simulation: the pickup schedule is computed
+    up front and status is only redrawn when a worker changes state.
+
     Args:
         num_workers: Number of parallel workers
         num_issues: Number of mock issues to process
+        realtime: Sleep between simulated ticks (for demos)
     """
-    logger.info(f"Running parallel test: {num_workers} workers, {num_issues} issues")
+    logger.info("Running parallel test: %d workers, %d issues", num_workers, num_issues)
 
     print("\n" + "="*80)
     print("PARALLEL AGENT TEST")
@@ -340,15 +741,10 @@ def run_parallel_test(num_workers: int, num_issues: int):
     print("="*80 + "\n")
 
     # Create mock issues
-    mock_issues = [
-        {
-            "number": i + 1,
-            "title": f"Test Feature #{i + 1}",
-            "body": f"Implement test feature number {i + 1}",
-            "labels": ["ready-for-dev", "test"]
-        }
-        for i in range(num_issues)
-    ]
+    mock_queue = deque(
+        MockIssue(n, f"Test Feature #{n}", f"Implement test feature number {n}")
+        for n in range(1, num_issues + 1)
+    )
 
     # Initialize manager
     manager = ParallelAgentManager(
@@ -363,19 +759,43 @@ def run_parallel_test(num_workers: int, num_issues: int):
         # Simulate processing
         print("\n🚀 Simulating parallel execution...\n")
 
-        for i in range(10):  # 10 second simulation
-            time.sleep(1)
-
-            # Simulate some workers completing issues
-            for worker in manager.workers.values():
-                if i % 3 == 0 and len(mock_issues) > 0:
-                    issue = mock_issues.pop(0)
-                    worker.issues_completed += 1
-                    worker.total_cost += 0.08  # Mock cost
-                    worker.status = "working"
+        # Every SIM_PICKUP_EVERY ticks each worker, in order, picks up the
+        # next issue while any remain; it is idle again on the following tick
+        pickups = [
+            (tick, worker_id)
+            for tick in range(0, SIM_TICKS, SIM_PICKUP_EVERY)
+            for worker_id in manager.workers
+        ][:len(mock_queue)]
+
+        events: Dict[int, Dict[str, MockIssue]] = {}
+        for tick, worker_id in pickups:
+            events.setdefault(tick, {})[worker_id] = mock_queue.popleft()
+            if tick + 1 < SIM_TICKS:
+                events.setdefault(tick + 1, {})
+
+        last_tick = 0
+        for tick in sorted(events):
+            if realtime:
+                time.sleep(tick - last_tick)
+                last_tick = tick
+
+            for worker_id, worker in manager.workers.items():
+                issue = events[tick].get(worker_id)
+                if issue is not None:
+                    manager._bump(
+                        worker,
+                        issues_completed=worker.issues_completed + 1,
+                        total_cost=worker.total_cost + SIM_COST_PER_ISSUE,
+                        current_issue=issue.number,
+                        status="working"
+                    )
                 else:
-                    worker.status = "idle"
+                    manager._bump(worker, current_issue=None, status="idle")
+
+            # No-op unless some worker changed
+            manager._print_status()
 
+        if not events:
             manager._print_status()
 
         # Print summary
@@ -430,12 +850,44 @@ def main():
         help="Duration to monitor workers in seconds (0 = infinite)"
     )
 
+    parser.add_argument(
+        "--force-redraw-interval",
+        type=float,
+        default=0.0,
+        help="Redraw the status table at least every N seconds, even without changes (default: only on change)"
+    )
+
     parser.add_argument(
         "--mock-issues",
         type=int,
         help="Number of mock issues to create for testing"
     )
 
+    parser.add_argument(
+        "--label",
+        default="ready-for-dev",
+        help="GitHub label of the issues local workers pick up (default: ready-for-dev)"
+    )
+
+    parser.add_argument(
+        "--issue-limit",
+        type=int,
+        default=10,
+        help="Maximum number of GitHub issues to dispatch to local workers (default: 10)"
+    )
+
+    parser.add_argument(
+        "--pin-cpus",
+        action="store_true",
+        help="Pin each local worker to its own CPU (Linux only)"
+    )
+
+    parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help="Pace the mock issue simulation in real time (for demos)"
+    )
+
     args = parser.parse_args()
 
     # Validate
@@ -444,7 +896,7 @@ def main():
 
     # Run test mode if mock issues specified
     if args.mock_issues:
-        run_parallel_test(args.workers, args.mock_issues)
+        run_parallel_test(args.workers, args.mock_issues, realtime=args.realtime)
         return
 
     # Deploy workers
@@ -452,15 +904,28 @@ def main():
         num_workers=args.workers,
         mode=args.mode,
         orchestrator_url=args.orchestrator_url,
-        workspace_base=Path(args.workspace) if args.workspace else None
+        workspace_base=Path(args.workspace) if args.workspace else None,
+        pin_cpus=args.pin_cpus
     )
 
     try:
         manager.deploy_workers()
 
+        # Local workers only process what is put in their queues
+        if args.mode == "local":
+            if GITHUB_CONFIG.get('enabled'):
+                manager.dispatch_ready_issues(
+                    GitHubIntegration(GITHUB_CONFIG), label=args.label, limit=args.issue_limit
+                )
+            else:
+                logger.warning("GitHub integration disabled - local workers have no issues to process")
+
         # Monitor
         if args.monitor_duration >= 0:
-            manager.monitor_workers(args.monitor_duration)
+            manager.monitor_workers(
+                args.monitor_duration,
+                force_redraw_interval=args.force_redraw_interval
+            )
 
         # Print summary
         summary = manager.get_summary()
@@ -478,5 +943,23 @@ def main():
         manager.shutdown()
 
 
+def _configure_start_method():
+    """
+    Pick the multiprocessing start method for worker processes
+
+    On Linux, fork lets workers inherit the already-imported orchestrator
+    stack instead of re-importing it in every child (Python 3.14 changes the
+    default to forkserver). Other platforms keep their default (spawn):
+    fork is unavailable on Windows and unsafe with macOS system frameworks.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            multiprocessing.set_start_method("fork")
+        except RuntimeError:
+            # Already chosen by whoever imported us
+            pass
+
+
 if __name__ == "__main__":
+    _configure_start_method()
     main()
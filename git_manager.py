@@ -4,10 +4,11 @@ GitManager - Handles git operations for the AI Scrum Master workflow
 Manages branch creation, switching, merging, and the overall git workflow
 for the sequential agent process.
 """
+import os
 import subprocess
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from config import (
     MAIN_BRANCH,
     ARCHITECT_BRANCH,
@@ -18,6 +19,16 @@ from config import (
 from utils import validate_branch_name, sanitize_commit_message
 
 
+# Upper bound on memoized get_branch_log results per GitManager
+LOG_CACHE_SIZE = 256
+
+# Upper bound on memoized list_files results per GitManager
+TREE_CACHE_SIZE = 64
+
+# Lines of git merge / merge-tree output that mention a conflict
+_CONFLICT_RE = re.compile(r'^.*conflict.*$', re.MULTILINE | re.IGNORECASE)
+
+
 class GitManager:
     """
     Manages git operations for the workspace
@@ -39,6 +50,35 @@ class GitManager:
         self.workspace = resolved_path
         self.workspace.mkdir(parents=True, exist_ok=True)
 
+        # Environment for every git child, built once: no optional lock
+        # files (e.g. status refreshing the index), never prompt, and
+        # untranslated output so messages like CONFLICT parse reliably
+        self._git_env = {
+            **os.environ,
+            "GIT_OPTIONAL_LOCKS": "0",
+            "GIT_TERMINAL_PROMPT": "0",
+            "LC_ALL": "C",
+        }
+
+        # Long-running `git cat-file --batch-check`, started on first use
+        self._catfile: Optional[subprocess.Popen] = None
+
+        # Resolved git directory (see _git_dir), found on first use
+        self._git_dir_path: Optional[Path] = None
+
+        # get_branch_log results keyed by (branch, tip SHA, max_commits);
+        # a moved tip yields a new key, so entries never go stale
+        self._log_cache: Dict[Tuple[str, str, int], List[str]] = {}
+
+        # list_files results: branch listings keyed by tree OID (immutable),
+        # the index listing keyed by the index file's stat
+        self._ls_tree_cache: Dict[str, List[str]] = {}
+        self._ls_files_cache: Optional[Tuple[Tuple[int, int, int], List[str]]] = None
+
+        # Branch names listed in packed-refs, keyed by the file's
+        # (st_mtime_ns, st_size, st_ino); git rewrites it via rename
+        self._packed_heads: Optional[Tuple[Tuple[int, int, int], FrozenSet[str]]] = None
+
     @staticmethod
     def _validate_workspace_path(path: Path) -> None:
         """
@@ -95,26 +135,251 @@ class GitManager:
 
     # _sanitize_commit_message now uses shared function from utils module
 
-    def _run_git(self, *args, check=True) -> subprocess.CompletedProcess:
+    def _run_git(self, *args, check=True, input=None) -> subprocess.CompletedProcess:
         """
         Run a git command in the workspace
 
         Args:
             *args: Git command arguments
             check: Whether to raise exception on failure
+            input: Optional text to feed to the command's stdin
 
         Returns:
             CompletedProcess result
         """
         cmd = ["git"] + list(args)
+        # Keep this call on CPython's vfork()/posix_spawn() fast path: no
+        # preexec_fn, user/group switching or process-group changes, which
+        # force a full fork() of the parent's address space
         return subprocess.run(
             cmd,
             cwd=str(self.workspace),
+            env=self._git_env,
+            input=input,
             capture_output=True,
             text=True,
             check=check
         )
 
+    def _catfile_proc(self) -> Optional[subprocess.Popen]:
+        """
+        Get the persistent `git cat-file --batch-check` process
+
+        Started lazily (the workspace may not be a repository yet) and
+        restarted if it has exited.
+
+        Returns:
+            Running Popen object, or None if it could not be started
+        """
+        if self._catfile is None or self._catfile.poll() is not None:
+            self.close()
+            try:
+                self._catfile = subprocess.Popen(
+                    ["git", "cat-file", "--batch-check=%(objectname) %(objecttype)"],
+                    cwd=str(self.workspace),
+                    env=self._git_env,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1
+                )
+            except OSError:
+                return None
+        return self._catfile
+
+    def _run_git_silent(self, *args) -> None:
+        """
+        Run a git command whose output isn't needed
+
+        stdout goes to /dev/null; stderr is kept (undecoded) only so a
+        failure still raises CalledProcessError carrying git's message.
+
+        Args:
+            *args: Git command arguments
+
+        Raises:
+            subprocess.CalledProcessError: If git exits non-zero
+        """
+        cmd = ["git"] + list(args)
+        result = subprocess.run(
+            cmd,
+            cwd=str(self.workspace),
+            env=self._git_env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        if result.returncode != 0:
+            raise subprocess.CalledProcessError(
+                result.returncode, cmd, stderr=result.stderr.decode(errors="replace")
+            )
+
+    def _batch_cat_file(self, queries: List[str]) -> Optional[List[str]]:
+        """
+        Look up several objects over the persistent cat-file pipe
+
+        All queries are written at once and answered in order, so N
+        lookups cost a single round trip and no fork. Objects and refs are
+        resolved per query, so changes made by agents running git in the
+        workspace are seen immediately.
+
+        Args:
+            queries: Object names, e.g. `refs/heads/main` or `<sha>^{tree}`
+
+        Returns:
+            One `<oid> <type>` (or `<query> missing`) line per query, or
+            None if the helper isn't available
+        """
+        # A newline would split a query in two and desynchronize the pipe
+        if any("\n" in query for query in queries):
+            return None
+
+        proc = self._catfile_proc()
+        if proc is None:
+            return None
+        try:
+            proc.stdin.write("".join(f"{query}\n" for query in queries))
+            proc.stdin.flush()
+            lines = [proc.stdout.readline() for _ in queries]
+        except (OSError, ValueError):
+            lines = []
+        if len(lines) == len(queries) and all(lines):
+            return [line.rstrip("\n") for line in lines]
+
+        # Helper died (e.g. not a repository yet)
+        self.close()
+        return None
+
+    def _ref_shas(self, names: List[str]) -> List[Optional[str]]:
+        """
+        Resolve local branches to their commit SHAs in one round trip
+
+        Args:
+            names: Branch names (without refs/heads/)
+
+        Returns:
+            Commit SHA for each branch, None where the branch doesn't exist
+        """
+        lines = self._batch_cat_file([f"refs/heads/{name}" for name in names])
+        if lines is None:
+            shas = []
+            for name in names:
+                result = self._run_git("rev-parse", "--verify", "--quiet", f"refs/heads/{name}", check=False)
+                shas.append(result.stdout.strip() if result.returncode == 0 else None)
+            return shas
+
+        shas = []
+        for line in lines:
+            fields = line.split()
+            shas.append(None if fields[-1] in ("missing", "ambiguous") else fields[0])
+        return shas
+
+    def _ref_sha(self, name: str) -> Optional[str]:
+        """
+        Resolve a local branch to its commit SHA
+
+        Args:
+            name: Branch name (without refs/heads/)
+
+        Returns:
+            Commit SHA, or None if the branch doesn't exist
+        """
+        return self._ref_shas([name])[0]
+
+    def _exists_ref(self, name: str) -> bool:
+        """
+        Check whether a local branch ref exists
+
+        Answered from the filesystem: a loose ref file, or an entry in
+        packed-refs. Layouts this doesn't understand (linked worktrees,
+        reftable) go through _ref_sha instead.
+
+        Args:
+            name: Branch name (without refs/heads/)
+
+        Returns:
+            True if the branch exists, False otherwise
+        """
+        git_dir = self._git_dir()
+        if git_dir is None or (git_dir / "commondir").exists() or (git_dir / "reftable").exists():
+            return self._ref_sha(name) is not None
+
+        if (git_dir / "refs" / "heads" / name).is_file():
+            return True
+        return name in self._packed_branches(git_dir)
+
+    def _packed_branches(self, git_dir: Path) -> FrozenSet[str]:
+        """
+        Branch names listed in packed-refs, re-read only when the file changes
+
+        Args:
+            git_dir: Repository git directory
+
+        Returns:
+            Set of branch names (without refs/heads/)
+        """
+        packed = git_dir / "packed-refs"
+        try:
+            st = packed.stat()
+        except FileNotFoundError:
+            return frozenset()
+
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if self._packed_heads is None or self._packed_heads[0] != key:
+            names = set()
+            with open(packed) as f:
+                for line in f:
+                    # Skip the header and peeled-tag lines
+                    if line[0] in "#^":
+                        continue
+                    ref = line.rstrip("\n").partition(" ")[2]
+                    if ref.startswith("refs/heads/"):
+                        names.add(ref[len("refs/heads/"):])
+            self._packed_heads = (key, frozenset(names))
+        return self._packed_heads[1]
+
+    def _git_dir(self) -> Optional[Path]:
+        """
+        Locate the repository's git directory without forking git
+
+        Handles both a regular `.git` directory and the `.git` file
+        (`gitdir: <path>`) used by worktrees and submodules.
+
+        Returns:
+            Path to the git directory, or None if the workspace isn't a repository root
+        """
+        if self._git_dir_path is None:
+            dot_git = self.workspace / ".git"
+            if dot_git.is_dir():
+                self._git_dir_path = dot_git
+            elif dot_git.is_file():
+                content = dot_git.read_text().strip()
+                if content.startswith("gitdir:"):
+                    gitdir = content[len("gitdir:"):].strip()
+                    self._git_dir_path = (self.workspace / gitdir).resolve()
+        return self._git_dir_path
+
+    def close(self) -> None:
+        """Stop the persistent git helper process"""
+        proc, self._catfile = self._catfile, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+
+    def __del__(self):
+        # getattr: __init__ may have raised before _catfile was set
+        if getattr(self, "_catfile", None) is not None:
+            self.close()
+
     def clone_repository(self, repo_url: str) -> None:
         """
         Clone a GitHub repository
@@ -156,8 +421,8 @@ class GitManager:
                 shutil.rmtree(temp_clone)
 
         # Configure git user
-        self._run_git("config", "user.name", GIT_CONFIG["user_name"])
-        self._run_git("config", "user.email", GIT_CONFIG["user_email"])
+        self._run_git_silent("config", "user.name", GIT_CONFIG["user_name"])
+        self._run_git_silent("config", "user.email", GIT_CONFIG["user_email"])
 
         print(f"✅ Repository cloned to {self.workspace}")
 
@@ -179,18 +444,18 @@ class GitManager:
         print(f"🔧 Initializing git repository at {self.workspace}...")
 
         # Initialize git repo
-        self._run_git("init")
+        self._run_git_silent("init")
 
         # Configure user
-        self._run_git("config", "user.name", GIT_CONFIG["user_name"])
-        self._run_git("config", "user.email", GIT_CONFIG["user_email"])
+        self._run_git_silent("config", "user.name", GIT_CONFIG["user_name"])
+        self._run_git_silent("config", "user.email", GIT_CONFIG["user_email"])
 
         # Create initial commit (needed for branches)
         readme = self.workspace / "README.md"
         readme.write_text("# AI Scrum Master Workspace\n\nThis workspace is managed by AI agents.\n")
 
-        self._run_git("add", "README.md")
-        self._run_git("commit", "-m", "Initial commit: Workspace initialized")
+        self._run_git_silent("add", "README.md")
+        self._run_git_silent("commit", "-m", "Initial commit: Workspace initialized")
 
         print(f"✅ Git repository initialized on branch '{MAIN_BRANCH}'")
 
@@ -212,13 +477,12 @@ class GitManager:
             self.checkout_branch(from_branch)
 
         # Check if branch already exists
-        result = self._run_git("branch", "--list", branch_name, check=False)
-        if result.stdout.strip():
+        if self._exists_ref(branch_name):
             print(f"⚠️  Branch '{branch_name}' already exists")
             return
 
         # Create and checkout new branch
-        self._run_git("checkout", "-b", branch_name)
+        self._run_git_silent("checkout", "-b", branch_name)
         print(f"✅ Created branch '{branch_name}'")
 
     def checkout_branch(self, branch_name: str) -> None:
@@ -230,16 +494,36 @@ class GitManager:
         """
         # Security: Validate branch name to prevent command injection
         self._validate_branch_name(branch_name)
-        self._run_git("checkout", branch_name)
+
+        # Already there: skip the checkout and its index refresh
+        if self.get_current_branch() == branch_name:
+            return
+
+        self._run_git_silent("checkout", branch_name)
         print(f"✅ Switched to branch '{branch_name}'")
 
     def get_current_branch(self) -> str:
         """
         Get the name of the current branch
 
+        Reads HEAD straight from the git directory, so it is always current
+        (agents switch branches too) and costs no fork.
+
         Returns:
-            Current branch name
+            Current branch name ("HEAD" when detached)
         """
+        git_dir = self._git_dir()
+        if git_dir is not None:
+            try:
+                head = (git_dir / "HEAD").read_text().strip()
+            except OSError:
+                head = ""
+            if head.startswith("ref: refs/heads/"):
+                return head[len("ref: refs/heads/"):]
+            if head:
+                # Detached HEAD holds a commit SHA
+                return "HEAD"
+
         result = self._run_git("rev-parse", "--abbrev-ref", "HEAD")
         return result.stdout.strip()
 
@@ -255,8 +539,7 @@ class GitManager:
         """
         # Security: Validate branch name to prevent command injection
         self._validate_branch_name(branch_name)
-        result = self._run_git("branch", "--list", branch_name, check=False)
-        return bool(result.stdout.strip())
+        return self._exists_ref(branch_name)
 
     def has_commits(self) -> bool:
         """
@@ -286,8 +569,8 @@ class GitManager:
             readme.write_text("# Project\n\nInitialized by AI Scrum Master\n")
 
         # Stage and commit
-        self._run_git("add", "README.md")
-        self._run_git("commit", "-m", "Initial commit")
+        self._run_git_silent("add", "README.md")
+        self._run_git_silent("commit", "-m", "Initial commit")
         print(f"✅ Initial commit created on branch '{MAIN_BRANCH}'")
 
     def commit_changes(self, message: str, allow_empty: bool = False) -> bool:
@@ -304,27 +587,32 @@ class GitManager:
         # Security: Sanitize commit message to prevent command injection
         message = sanitize_commit_message(message)
 
-        # Stage all changes
-        self._run_git("add", ".")
-
-        # Check if there are changes to commit
-        result = self._run_git("diff", "--cached", "--quiet", check=False)
-        has_changes = result.returncode != 0
-
-        if not has_changes and not allow_empty:
+        # One cheap status read decides whether there is anything to commit
+        status = self._run_git("status", "--porcelain=v1", "-z", check=False).stdout
+        if not status and not allow_empty:
             print("ℹ️  No changes to commit")
             return False
 
-        # Commit
-        cmd = ["commit", "-m", message]
+        # `commit -a` skips untracked files; mark them intent-to-add first
+        # so it stages them in the same process as the commit
+        if any(entry.startswith("??") for entry in status.split("\0")):
+            self._run_git_silent("add", "-N", ".")
+
+        cmd = ["commit", "-a", "-m", message]
         if allow_empty:
             cmd.append("--allow-empty")
-
         self._run_git(*cmd)
+
         print(f"✅ Committed: {message[:100]}{'...' if len(message) > 100 else ''}")
         return True
 
-    def merge_branch(self, source_branch: str, target_branch: str, message: Optional[str] = None) -> bool:
+    def merge_branch(
+        self,
+        source_branch: str,
+        target_branch: str,
+        message: Optional[str] = None,
+        use_merge_tree: bool = True
+    ) -> bool:
         """
         Merge source branch into target branch with automatic cleanup on failure
 
@@ -332,6 +620,8 @@ class GitManager:
             source_branch: Branch to merge from
             target_branch: Branch to merge into
             message: Optional custom merge message
+            use_merge_tree: Probe for conflicts with `git merge-tree` first
+                (git >= 2.38); disable to always merge in the working tree
 
         Returns:
             True if merge succeeded, False otherwise
@@ -340,13 +630,27 @@ class GitManager:
         self._validate_branch_name(source_branch)
         self._validate_branch_name(target_branch)
 
-        # Track original branch before merge to restore on failure
+        if use_merge_tree:
+            # Dry-run the merge in memory: conflicts are reported without
+            # checking anything out or leaving the repository mid-merge.
+            # Any other failure (older git, unrelated histories, missing
+            # branch) falls through to the regular merge, which reports it
+            probe = self._run_git("merge-tree", "--write-tree", target_branch, source_branch, check=False)
+            if probe.returncode == 1:
+                _, _, messages = probe.stdout.partition("\n\n")
+                self._report_merge_failure(source_branch, target_branch, messages.strip())
+                return False
+
+        # Track original branch before merge to restore on failure, and
+        # which branch we're on as we go, so cleanup needn't look it up again
         original_branch = self.get_current_branch()
+        current = original_branch
         merge_succeeded = False
 
         try:
             # Checkout target branch
             self.checkout_branch(target_branch)
+            current = target_branch
 
             # Merge source branch
             merge_msg = message or f"Merge {source_branch} into {target_branch}"
@@ -360,50 +664,27 @@ class GitManager:
                 return True
 
             except subprocess.CalledProcessError as e:
-                # Enhanced error messages showing what conflicted
                 error_output = e.stderr.strip() if e.stderr else ""
-
-                print(f"❌ Merge failed: {source_branch} → {target_branch}")
-
-                # Check if it's a merge conflict
-                if "CONFLICT" in error_output or "conflict" in error_output.lower():
-                    print("⚠️  Merge conflicts detected:")
-                    # Extract conflict information from git output
-                    for line in error_output.split('\n'):
-                        if 'CONFLICT' in line or 'conflict' in line.lower():
-                            print(f"   {line}")
-
-                    # Show how to fix
-                    print("\n💡 How to fix manually:")
-                    print(f"   1. git checkout {target_branch}")
-                    print(f"   2. git merge {source_branch}")
-                    print(f"   3. Resolve conflicts in the listed files")
-                    print(f"   4. git add <resolved-files>")
-                    print(f"   5. git commit")
-                else:
-                    # Other merge errors
-                    print(f"   Error details: {error_output}")
-
+                self._report_merge_failure(source_branch, target_branch, error_output)
                 return False
 
         finally:
-            # Ensure cleanup happens regardless of success or failure
-            # Check if repository is in MERGING state
-            merge_head = self.workspace / ".git" / "MERGE_HEAD"
-            if merge_head.exists():
-                print("🔄 Cleaning up failed merge state...")
-                try:
-                    # Abort the merge to restore clean state
-                    self._run_git("merge", "--abort", check=False)
-                    print("✅ Merge aborted, repository restored to clean state")
-                except subprocess.CalledProcessError as abort_error:
-                    print(f"⚠️  Could not abort merge: {abort_error.stderr}")
-                    print("⚠️  Repository may be in MERGING state - manual intervention needed")
-                    print(f"   Run: cd {self.workspace} && git merge --abort")
-
-                # Try to return to original branch only if merge failed
-                if not merge_succeeded:
-                    current = self.get_current_branch()
+            # A successful merge leaves nothing to clean up
+            if not merge_succeeded:
+                # Check if repository is in MERGING state
+                merge_head = (self._git_dir() or self.workspace / ".git") / "MERGE_HEAD"
+                if merge_head.exists():
+                    print("🔄 Cleaning up failed merge state...")
+                    try:
+                        # Abort the merge to restore clean state
+                        self._run_git("merge", "--abort", check=False)
+                        print("✅ Merge aborted, repository restored to clean state")
+                    except subprocess.CalledProcessError as abort_error:
+                        print(f"⚠️  Could not abort merge: {abort_error.stderr}")
+                        print("⚠️  Repository may be in MERGING state - manual intervention needed")
+                        print(f"   Run: cd {self.workspace} && git merge --abort")
+
+                    # Try to return to original branch
                     if current != original_branch:
                         try:
                             self.checkout_branch(original_branch)
@@ -412,6 +693,35 @@ class GitManager:
                             # Can't switch back, stay on target branch
                             print(f"⚠️  Could not return to '{original_branch}', staying on '{current}'")
 
+    def _report_merge_failure(self, source_branch: str, target_branch: str, error_output: str) -> None:
+        """
+        Print why a merge failed, listing conflicts when there are any
+
+        Args:
+            source_branch: Branch that was merged from
+            target_branch: Branch that was merged into
+            error_output: Output of the failed git merge or merge-tree
+        """
+        print(f"❌ Merge failed: {source_branch} → {target_branch}")
+
+        # Extract conflict information from git output (once per line)
+        conflict_lines = list(dict.fromkeys(_CONFLICT_RE.findall(error_output)))
+        if conflict_lines:
+            print("⚠️  Merge conflicts detected:")
+            for line in conflict_lines:
+                print(f"   {line}")
+
+            # Show how to fix
+            print("\n💡 How to fix manually:")
+            print(f"   1. git checkout {target_branch}")
+            print(f"   2. git merge {source_branch}")
+            print(f"   3. Resolve conflicts in the listed files")
+            print(f"   4. git add <resolved-files>")
+            print(f"   5. git commit")
+        else:
+            # Other merge errors
+            print(f"   Error details: {error_output}")
+
     def setup_workflow_branches(self) -> None:
         """
         Set up all branches needed for the workflow
@@ -423,23 +733,37 @@ class GitManager:
         """
         print("\n🔧 Setting up workflow branches...")
 
-        # Ensure we're on main
-        current = self.get_current_branch()
-        if current != MAIN_BRANCH:
+        # Each branch starts from the previous one. Resolve every start
+        # commit up front so the branches no longer depend on each other
+        chain = [
+            (ARCHITECT_BRANCH, MAIN_BRANCH),
+            (SECURITY_BRANCH, ARCHITECT_BRANCH),
+            (TESTER_BRANCH, SECURITY_BRANCH),
+        ]
+        main_sha, *existing_shas = self._ref_shas([MAIN_BRANCH] + [branch for branch, _ in chain])
+        tips = {MAIN_BRANCH: main_sha or MAIN_BRANCH}
+        to_create = []
+        for (branch, parent), existing in zip(chain, existing_shas):
+            if existing is not None:
+                print(f"⚠️  Branch '{branch}' already exists")
+                tips[branch] = existing
+            else:
+                tips[branch] = tips[parent]
+                to_create.append(branch)
+
+        # Create them all in one atomic ref transaction (no checkout, no
+        # index lock); `create` fails if a branch appeared in the meantime
+        if to_create:
+            self._run_git("update-ref", "--stdin", input="".join(
+                f"create refs/heads/{branch} {tips[branch]}\n" for branch in to_create
+            ))
+            for branch in to_create:
+                print(f"✅ Created branch '{branch}'")
+
+        # End up on main
+        if self.get_current_branch() != MAIN_BRANCH:
             self.checkout_branch(MAIN_BRANCH)
 
-        # Create architect branch from main
-        self.create_branch(ARCHITECT_BRANCH, from_branch=MAIN_BRANCH)
-
-        # Create security branch from architect
-        self.create_branch(SECURITY_BRANCH, from_branch=ARCHITECT_BRANCH)
-
-        # Create tester branch from security
-        self.create_branch(TESTER_BRANCH, from_branch=SECURITY_BRANCH)
-
-        # Return to main
-        self.checkout_branch(MAIN_BRANCH)
-
         print("✅ All workflow branches created")
 
     def reset_workflow_branches(self) -> None:
@@ -453,12 +777,8 @@ class GitManager:
         # Checkout main
         self.checkout_branch(MAIN_BRANCH)
 
-        # Delete existing branches
-        for branch in [TESTER_BRANCH, SECURITY_BRANCH, ARCHITECT_BRANCH]:
-            result = self._run_git("branch", "--list", branch, check=False)
-            if result.stdout.strip():
-                self._run_git("branch", "-D", branch)
-                print(f"  Deleted '{branch}'")
+        # Delete existing branches in one go
+        self.delete_branches([TESTER_BRANCH, SECURITY_BRANCH, ARCHITECT_BRANCH], force=True)
 
         # Recreate branches
         self.setup_workflow_branches()
@@ -475,6 +795,21 @@ class GitManager:
         """
         print("\n🔀 Merging workflow branches to main...")
 
+        # Common case: every merge in the chain is a fast-forward
+        if self._fast_forward_workflow():
+            print(f"✅ Fast-forwarded '{SECURITY_BRANCH}', '{ARCHITECT_BRANCH}' and '{MAIN_BRANCH}' to '{TESTER_BRANCH}'")
+            print("✅ All workflow branches merged to main")
+            return True
+
+        # Otherwise build the merges in the object database and move the
+        # refs once at the end, so the work tree is only rewritten once
+        merged = self._merge_workflow_in_memory()
+        if merged is not None:
+            if merged:
+                print("✅ All workflow branches merged to main")
+            return merged
+
+        # merge-tree unavailable: merge one branch at a time
         # Merge tester into security
         if not self.merge_branch(TESTER_BRANCH, SECURITY_BRANCH):
             return False
@@ -490,6 +825,114 @@ class GitManager:
         print("✅ All workflow branches merged to main")
         return True
 
+    def _fast_forward_workflow(self) -> bool:
+        """
+        Fast-forward security, architect and main to tester in one ref update
+
+        Only done when main, architect and security are all ancestors of
+        tester, i.e. when the three sequential merges would each be a
+        fast-forward and produce no merge commits.
+
+        Returns:
+            True if the branches were fast-forwarded, False if real merges are needed
+        """
+        chain = [MAIN_BRANCH, ARCHITECT_BRANCH, SECURITY_BRANCH, TESTER_BRANCH]
+        shas = self._ref_shas(chain)
+        if None in shas:
+            return False
+
+        tester_sha = shas[-1]
+        result = self._run_git("merge-base", "--independent", *shas, check=False)
+        if result.returncode != 0 or result.stdout.split() != [tester_sha]:
+            return False
+
+        self._land_workflow_refs({
+            branch: (tester_sha, old_sha)
+            for branch, old_sha in zip(chain[:-1], shas[:-1])
+        })
+        return True
+
+    def _merge_workflow_in_memory(self) -> Optional[bool]:
+        """
+        Run the tester -> security -> architect -> main merges without a work tree
+
+        Each step is a fast-forward, a no-op, or a `git merge-tree` merge
+        recorded with `git commit-tree`. A conflict at any step stops the
+        chain before any branch has moved.
+
+        Returns:
+            True if merged, False on conflict, None if merge-tree can't be
+            used (e.g. git older than 2.38) and regular merges are needed
+        """
+        chain = [
+            (TESTER_BRANCH, SECURITY_BRANCH),
+            (SECURITY_BRANCH, ARCHITECT_BRANCH),
+            (ARCHITECT_BRANCH, MAIN_BRANCH),
+        ]
+        branches = [TESTER_BRANCH, SECURITY_BRANCH, ARCHITECT_BRANCH, MAIN_BRANCH]
+        original = dict(zip(branches, self._ref_shas(branches)))
+        if None in original.values():
+            return None
+        tips = dict(original)
+
+        for source, target in chain:
+            source_sha, target_sha = tips[source], tips[target]
+            base = self._run_git("merge-base", target_sha, source_sha, check=False)
+            if base.returncode != 0:
+                return None
+            base_sha = base.stdout.strip()
+
+            if base_sha == source_sha:
+                # Already up to date
+                continue
+            if base_sha == target_sha:
+                tips[target] = source_sha
+                continue
+
+            result = self._run_git("merge-tree", "--write-tree", target_sha, source_sha, check=False)
+            if result.returncode == 1:
+                _, _, messages = result.stdout.partition("\n\n")
+                self._report_merge_failure(source, target, messages.strip())
+                return False
+            if result.returncode != 0:
+                return None
+
+            tree = result.stdout.split("\n", 1)[0]
+            merge_msg = sanitize_commit_message(f"Merge {source} into {target}")
+            commit = self._run_git("commit-tree", tree, "-p", target_sha, "-p", source_sha, "-m", merge_msg)
+            tips[target] = commit.stdout.strip()
+
+        self._land_workflow_refs({
+            branch: (tips[branch], original[branch])
+            for branch in tips if tips[branch] != original[branch]
+        })
+        for source, target in chain:
+            print(f"✅ Merged '{source}' into '{target}'")
+        return True
+
+    def _land_workflow_refs(self, updates: Dict[str, Tuple[str, str]]) -> None:
+        """
+        Move workflow branches to new commits and finish on main
+
+        Args:
+            updates: Branch name -> (new SHA, expected current SHA)
+        """
+        # Park HEAD on tester (which never moves) so no checked-out branch
+        # changes under the work tree
+        if self.get_current_branch() in updates:
+            self._run_git_silent("checkout", TESTER_BRANCH)
+
+        # Single atomic transaction, each update guarded by the SHA we read
+        if updates:
+            self._run_git("update-ref", "--stdin", input="".join(
+                f"update refs/heads/{branch} {new_sha} {old_sha}\n"
+                for branch, (new_sha, old_sha) in updates.items()
+            ))
+
+        # The only work tree rewrite
+        if self.get_current_branch() != MAIN_BRANCH:
+            self._run_git_silent("checkout", MAIN_BRANCH)
+
     def get_branch_log(self, branch: str, max_commits: int = 10) -> List[str]:
         """
         Get commit log for a branch
@@ -501,23 +944,22 @@ class GitManager:
         Returns:
             List of commit messages
         """
-        result = self._run_git("log", f"-{max_commits}", "--oneline", branch, check=False)
-        if result.returncode == 0:
-            return result.stdout.strip().split('\n') if result.stdout.strip() else []
-        return []
-
-    def branch_exists(self, branch_name: str) -> bool:
-        """
-        Check if a branch exists
+        # Local branches are memoized on their tip; anything else goes to git
+        tip = self._ref_sha(branch) if validate_branch_name(branch) else None
+        key = (branch, tip, max_commits)
+        if tip is not None and key in self._log_cache:
+            return list(self._log_cache[key])
 
-        Args:
-            branch_name: Name of the branch to check
+        result = self._run_git("log", f"-{max_commits}", "--oneline", branch, check=False)
+        if result.returncode != 0:
+            return []
+        log = result.stdout.strip().split('\n') if result.stdout.strip() else []
 
-        Returns:
-            True if branch exists, False otherwise
-        """
-        result = self._run_git("branch", "--list", branch_name, check=False)
-        return bool(result.stdout.strip())
+        if tip is not None:
+            if len(self._log_cache) >= LOG_CACHE_SIZE:
+                self._log_cache.clear()
+            self._log_cache[key] = log
+        return list(log)
 
     def branch_has_commits(self, branch_name: str, since_branch: str = "main") -> bool:
         """
@@ -533,9 +975,17 @@ class GitManager:
         if not self.branch_exists(branch_name):
             return False
 
+        # Same tip as the base means nothing new - both answered in one
+        # round trip over the cat-file pipe
+        tip, base_tip = self._ref_shas([branch_name, since_branch])
+        if tip is not None and tip == base_tip:
+            return False
+
         try:
-            result = self._run_git("rev-list", f"{since_branch}..{branch_name}", check=False)
-            return bool(result.stdout.strip())
+            # Exit 0: branch is an ancestor of the base (nothing new);
+            # 1: it isn't (has commits beyond base); anything else: error
+            result = self._run_git("merge-base", "--is-ancestor", branch_name, since_branch, check=False)
+            return result.returncode == 1
         except Exception as e:
             print(f"⚠️  Error checking branch commits: {e}")
             return False
@@ -559,7 +1009,7 @@ class GitManager:
 
         try:
             flag = "-D" if force else "-d"
-            self._run_git("branch", flag, branch_name)
+            self._run_git_silent("branch", flag, branch_name)
             print(f"✅ Deleted branch '{branch_name}'")
             return True
         except subprocess.CalledProcessError as e:
@@ -567,6 +1017,119 @@ class GitManager:
             print(f"⚠️  Failed to delete branch '{branch_name}'")
             return False
 
+    def delete_branches(self, branch_names: List[str], force: bool = False) -> List[str]:
+        """
+        Delete whichever of several branches exist, in a single git call
+
+        Existence is read from the ref files, and one `git branch -d/-D`
+        deletes them all (one process, so no contention on packed-refs).
+        git deletes what it can and fails if any branch could not go (e.g.
+        unmerged without force), so after a failure each ref is re-checked.
+
+        Args:
+            branch_names: Branches to delete
+            force: Force delete even if not merged
+
+        Returns:
+            The branches that were deleted
+        """
+        # Security: Validate branch names to prevent command injection
+        for branch_name in branch_names:
+            self._validate_branch_name(branch_name)
+
+        existing = [branch for branch in branch_names if self._exists_ref(branch)]
+        if not existing:
+            return []
+
+        try:
+            self._run_git_silent("branch", "-D" if force else "-d", *existing)
+            deleted = existing
+        except subprocess.CalledProcessError:
+            deleted = [branch for branch in existing if not self._exists_ref(branch)]
+
+        for branch in existing:
+            if branch in deleted:
+                print(f"✅ Deleted branch '{branch}'")
+            else:
+                # Security: Don't expose full error details to prevent information disclosure
+                print(f"⚠️  Failed to delete branch '{branch}'")
+        return deleted
+
+    def reset_branch(self, branch_name: str, target: str) -> None:
+        """
+        Point a branch at another branch's commit, discarding its own commits
+
+        Resets the working tree when the branch is checked out here, so it
+        works the same from the main checkout and from a worktree.
+
+        Args:
+            branch_name: Branch to reset
+            target: Branch whose commit it should point at
+        """
+        # Security: Validate branch names to prevent command injection
+        self._validate_branch_name(branch_name)
+        self._validate_branch_name(target)
+
+        if self.get_current_branch() == branch_name:
+            self._run_git_silent("reset", "--hard", target)
+        else:
+            self._run_git_silent("branch", "-f", branch_name, target)
+        print(f"✅ Reset '{branch_name}' to '{target}'")
+
+    def add_worktree(self, path: Path, branch_name: str, from_branch: str) -> "GitManager":
+        """
+        Check out a branch in a separate working tree
+
+        The branch is (re)created at from_branch, so an agent can work on it
+        while this checkout stays on another branch.
+
+        Args:
+            path: Directory for the new working tree (must not exist yet)
+            branch_name: Branch to create and check out there
+            from_branch: Branch to start it from
+
+        Returns:
+            GitManager for the new working tree
+        """
+        # Security: Validate branch names to prevent command injection
+        self._validate_branch_name(branch_name)
+        self._validate_branch_name(from_branch)
+
+        self._run_git_silent("worktree", "add", "-B", branch_name, str(path), from_branch)
+        print(f"✅ Checked out '{branch_name}' in worktree {path}")
+        return GitManager(path)
+
+    def remove_worktree(self, path: Path) -> None:
+        """
+        Remove a working tree added by add_worktree (its branch is kept)
+
+        Args:
+            path: Directory of the working tree
+        """
+        self._run_git("worktree", "remove", "--force", str(path), check=False)
+        self._run_git("worktree", "prune", check=False)
+
+    def rebase_onto(self, new_base: str, upstream: str) -> bool:
+        """
+        Move the current branch's commits since upstream onto new_base
+
+        Args:
+            new_base: Branch to replay the commits onto
+            upstream: Branch the commits were made on top of
+
+        Returns:
+            True if rebased, False on conflict (the rebase is aborted)
+        """
+        # Security: Validate branch names to prevent command injection
+        self._validate_branch_name(new_base)
+        self._validate_branch_name(upstream)
+
+        result = self._run_git("rebase", "--onto", new_base, upstream, check=False)
+        if result.returncode != 0:
+            self._run_git("rebase", "--abort", check=False)
+            return False
+        return True
+
     def list_files(self, branch_name: Optional[str] = None) -> List[str]:
         """
         List all tracked files in a branch
@@ -581,18 +1144,81 @@ class GitManager:
             if branch_name:
                 # Security: Validate branch name to prevent command injection
                 self._validate_branch_name(branch_name)
-                result = self._run_git("ls-tree", "-r", "--name-only", branch_name, check=False)
-            else:
-                result = self._run_git("ls-files", check=False)
-
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip().split('\n')
-            return []
+                return self._list_tree_files(branch_name)
+            return self._list_index_files()
         except Exception as e:
             # Security: Don't expose full error details
             print(f"⚠️  Error listing files")
             return []
 
+    def tree_sha(self, branch_name: str) -> Optional[str]:
+        """
+        Get the OID of a branch's root tree
+
+        Equal OIDs mean identical file contents, whatever the commits.
+
+        Args:
+            branch_name: Branch (or other revision)
+
+        Returns:
+            Tree OID, or None if it can't be resolved over the cat-file pipe
+        """
+        lines = self._batch_cat_file([f"{branch_name}^{{tree}}"])
+        fields = lines[0].split() if lines else []
+        return fields[0] if len(fields) == 2 and fields[1] == "tree" else None
+
+    def _list_tree_files(self, branch_name: str) -> List[str]:
+        """
+        List files in a branch, memoized on the branch's tree OID
+
+        Args:
+            branch_name: Branch (or other revision) to list
+
+        Returns:
+            List of file paths
+        """
+        tree = self.tree_sha(branch_name)
+        if tree is not None and tree in self._ls_tree_cache:
+            return list(self._ls_tree_cache[tree])
+
+        result = self._run_git("ls-tree", "-r", "--name-only", tree or branch_name, check=False)
+        if result.returncode != 0:
+            return []
+        files = result.stdout.strip().split('\n') if result.stdout.strip() else []
+
+        if tree is not None:
+            if len(self._ls_tree_cache) >= TREE_CACHE_SIZE:
+                self._ls_tree_cache.clear()
+            self._ls_tree_cache[tree] = files
+        return list(files)
+
+    def _list_index_files(self) -> List[str]:
+        """
+        List tracked files in the index, re-read only when the index changes
+
+        Returns:
+            List of file paths
+        """
+        git_dir = self._git_dir()
+        key = None
+        if git_dir is not None:
+            try:
+                st = (git_dir / "index").stat()
+                key = (st.st_mtime_ns, st.st_size, st.st_ino)
+            except FileNotFoundError:
+                pass
+        if key is not None and self._ls_files_cache is not None and self._ls_files_cache[0] == key:
+            return list(self._ls_files_cache[1])
+
+        result = self._run_git("ls-files", check=False)
+        if result.returncode != 0:
+            return []
+        files = result.stdout.strip().split('\n') if result.stdout.strip() else []
+
+        if key is not None:
+            self._ls_files_cache = (key, files)
+        return list(files)
+
     def __repr__(self) -> str:
         current = self.get_current_branch()
         return f"GitManager(workspace='{self.workspace}', current_branch='{current}')"
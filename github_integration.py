@@ -8,16 +8,222 @@ Handles:
 - PR-to-issue linking
 """
 
+import os
+import shutil
 import subprocess
 import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
+from pathlib import Path
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson parses gh's raw stdout bytes several times faster when installed;
+# its JSONDecodeError subclasses json's, so the except clauses still apply
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 from utils import validate_issue_number, validate_github_label, sanitize_github_text
 
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+
+# Issue fields the REST API path can produce (others go through gh)
+_REST_ISSUE_FIELDS = frozenset({'number', 'title', 'body', 'labels', 'state'})
+
+# PR URL that `gh pr create` prints when the PR already exists
+_PR_URL_RE = re.compile(r"https://github\.com/\S+/pull/\d+")
+
+# Upper bound on remembered ETag responses per GitHubIntegration
+ETAG_CACHE_SIZE = 256
+
+# Upper bound on remembered changed-file listings per GitHubIntegration
+DIFF_CACHE_SIZE = 16
+
+# Outside a session, a cached gh check unused for this long is re-run
+GH_IDLE_RECHECK_S = 300.0
+
+# How long begin_session() trusts a gh auth check before re-running it
+SESSION_TTL_S = 3600.0
+
+# Connection pool for the REST session; _run_concurrently issues a few calls at once
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 8
+
+# Gateway errors worth retrying (idempotent methods only, so POSTs never repeat)
+_HTTP_RETRY = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504), raise_on_status=False)
+
+# owner/name form accepted for the REST repository setting
+_REPOSITORY_RE = re.compile(r'[\w.-]+/[\w.-]+')
+
+# gh --json field names (they end up on the command line)
+_ISSUE_FIELD_RE = re.compile(r'[a-zA-Z]+')
+
+# Rows of the PR body's agent metrics table, in workflow_result.agents order
+_METRICS_AGENTS = (
+    ("Architect", "✅"),
+    ("Security", "✅"),
+    ("Tester", "✅"),
+    ("Product Owner", "✅ APPROVED"),
+)
+
+# Node IDs needed to link a new PR to its issue in one mutation
+_LINK_IDS_QUERY = """
+query($owner: String!, $name: String!, $issue: Int!) {
+  repository(owner: $owner, name: $name) {
+    issue(number: $issue) { id }
+    needsReview: label(name: "needs-review") { id }
+    inProgress: label(name: "in-progress") { id }
+  }
+}
+"""
+
+# Label the PR, comment on the issue and move it to needs-review at once
+_LINK_PR_MUTATION = """
+mutation($pr: ID!, $issue: ID!, $body: String!, $needsReview: [ID!]!, $inProgress: [ID!]!) {
+  labelPr: addLabelsToLabelable(input: {labelableId: $pr, labelIds: $needsReview}) { clientMutationId }
+  comment: addComment(input: {subjectId: $issue, body: $body}) { clientMutationId }
+  unlabel: removeLabelsFromLabelable(input: {labelableId: $issue, labelIds: $inProgress}) { clientMutationId }
+  label: addLabelsToLabelable(input: {labelableId: $issue, labelIds: $needsReview}) { clientMutationId }
+}
+"""
+
+# Static skeleton of the PR body; _generate_pr_body fills it with format_map
+_PR_BODY_TEMPLATE = """## 🤖 AI-Generated Feature Implementation
+
+{issue_line}
+
+### What Changed
+{user_story}
+
+---
+
+## ⚠️ HUMAN REVIEW CHECKLIST
+
+Before merging, please verify:
+
+### Code Quality
+- [ ] Code follows project style guidelines
+- [ ] No test artifacts left behind (test.html, temp.js, etc.)
+- [ ] No unnecessary files renamed or deleted
+- [ ] Comments are clear and helpful
+- [ ] Error handling is appropriate
+
+### Functionality
+- [ ] Feature works as described{issue_suffix}
+- [ ] No breaking changes to existing features
+- [ ] Edge cases are handled properly
+- [ ] User experience is intuitive
+
+### Security
+- [ ] No XSS vulnerabilities
+- [ ] No SQL injection risks
+- [ ] Input validation is present
+- [ ] Authentication/authorization works correctly
+- [ ] No sensitive data exposed
+
+### Testing
+- [ ] All automated tests pass ✓
+- [ ] Manual testing completed
+- [ ] Tested on multiple browsers (if frontend)
+- [ ] Tested edge cases manually
+- [ ] Performance is acceptable
+
+### Documentation
+- [ ] README updated if needed
+- [ ] API documentation updated if needed
+- [ ] User-facing changes documented
+
+---
+
+## 📊 AI Agent Metrics
+
+| Agent | Cost | Duration | Status |
+|-------|------|----------|--------|
+{metrics_rows}
+
+**Total Cost:** ${total_cost:.2f}
+**Total Duration:** {total_minutes:.1f} minutes
+**Revisions:** {revision_count}
+
+---
+
+## 📁 Files Changed
+
+```
+{files_changed}
+```
+
+---
+
+## 🔄 Next Steps
+
+1. ✅ Review code changes above
+2. ✅ Complete the checklist
+3. ✅ Merge to `{base_branch}` branch{merge_note}
+4. ✅ Test on staging environment
+5. ✅ Create production release when ready
+
+---
+
+🤖 Generated by AI Scrum Master v2.2
+⚠️  **IMPORTANT:** {warning}
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class Issue:
+    """An issue from the ready-for-dev queue (see get_ready_issues)"""
+    number: int
+    title: str
+    labels: Tuple[str, ...]
+    body: str = ""
+
+
+def _gh_logged_in_locally() -> bool:
+    """
+    Check gh's own config for a github.com login without spawning gh
+
+    gh records each host it's logged in to in hosts.yml (the token itself
+    may live in the system keyring). Finding github.com there with gh on
+    PATH is as good an answer as `gh auth status` for deciding whether to
+    try gh at all, without its process start and network round trip. A
+    token revoked since login is not detected; gh calls will fail instead.
+
+    Returns:
+        True if gh is installed and hosts.yml lists github.com
+    """
+    if shutil.which('gh') is None:
+        return False
+
+    config_dir = os.getenv('GH_CONFIG_DIR')
+    if not config_dir:
+        config_dir = Path(os.getenv('XDG_CONFIG_HOME') or Path.home() / '.config') / 'gh'
+    try:
+        hosts = (Path(config_dir) / 'hosts.yml').read_text()
+    except OSError:
+        return False
+    return re.search(r'^github\.com:', hosts, re.MULTILINE) is not None
+
 
 class GitHubIntegration:
-    """GitHub integration using GitHub CLI (gh)"""
+    """
+    GitHub integration using GitHub CLI (gh)
+
+    When a token (config 'token' or GITHUB_TOKEN) and a repository (config
+    'repository', "owner/repo") are both available, issue and PR calls go
+    through one keep-alive HTTPS session to the REST API instead of
+    spawning gh for every call.
+    """
 
     def __init__(self, config: Dict[str, Any], workspace_dir: Optional[Any] = None):
         """
@@ -32,6 +238,37 @@ class GitHubIntegration:
         self.include_checklist = config.get('include_review_checklist', True)
         self.workspace_dir = str(workspace_dir) if workspace_dir else None
 
+        self.repository = config.get('repository')
+        if self.repository and not _REPOSITORY_RE.fullmatch(self.repository):
+            raise ValueError(f"Security: Invalid repository format: {self.repository}")
+
+        # Persistent REST client, only when we can address the API directly
+        self._http: Optional[requests.Session] = None
+        token = config.get('token') or os.getenv('GITHUB_TOKEN')
+        if token and self.repository:
+            self._http = requests.Session()
+            self._http.mount("https://", HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                max_retries=_HTTP_RETRY,
+            ))
+            self._http.headers.update({
+                "Authorization": f"token {token}",
+                "Accept": "application/vnd.github.v3+json",
+            })
+        # Last (ETag, parsed body) per GET, for conditional requests
+        self._etag_cache: Dict[Tuple[str, Tuple], Tuple[str, Any]] = {}
+        # Changed-files listing per (HEAD, base) commit pair, see _changed_files
+        self._diff_cache: Dict[Tuple[str, ...], str] = {}
+
+        # gh install/auth state, checked once per instance (see refresh())
+        # and when it was last consulted
+        self._gh_ok: Optional[bool] = None
+        self._gh_last_used = 0.0
+        # Session window (see begin_session): monotonic expiry and length
+        self._session_expires: Optional[float] = None
+        self._session_ttl_s = SESSION_TTL_S
+
     @staticmethod
     def _validate_issue_number(issue_number: int) -> None:
         """
@@ -70,28 +307,288 @@ class GitHubIntegration:
 
     def check_gh_cli_installed(self) -> bool:
         """Check if GitHub CLI is installed and authenticated"""
+        now = time.monotonic()
+        if self._session_expires is not None:
+            if now >= self._session_expires:
+                # Session window elapsed: check again and start a new window
+                self._gh_ok = None
+                self._session_expires = now + self._session_ttl_s
+        elif now - self._gh_last_used >= GH_IDLE_RECHECK_S:
+            # Long idle (e.g. a daemon between tasks): don't trust an old answer
+            self._gh_ok = None
+        self._gh_last_used = now
+
+        if self._gh_ok is not None:
+            return self._gh_ok
+
+        # A logged-in gh config answers the question without running gh;
+        # otherwise let `gh auth status` decide (it also knows GH_TOKEN etc.)
+        if _gh_logged_in_locally():
+            self._gh_ok = True
+            return True
+
         try:
-            result = subprocess.run(
-                ['gh', 'auth', 'status'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+            returncode, _, _ = self._run_gh('auth', 'status')
+            self._gh_ok = returncode == 0
+        except FileNotFoundError:
+            self._gh_ok = False
+        except subprocess.TimeoutExpired:
+            # Possibly transient, so don't remember it
             return False
+        return self._gh_ok
+
+    def refresh(self) -> None:
+        """Forget the cached gh CLI check, e.g. after running `gh auth login`"""
+        self._gh_ok = None
+
+    def begin_session(self, ttl_s: float = SESSION_TTL_S) -> bool:
+        """
+        Check gh auth once and trust the result for a whole workflow session
+
+        For long-running processes: the check is re-run at most once per
+        ttl_s instead of being trusted for the lifetime of the instance.
+
+        Args:
+            ttl_s: Seconds before the auth state is checked again
+
+        Returns:
+            True if GitHub CLI is installed and authenticated
+        """
+        self.refresh()
+        self._session_ttl_s = ttl_s
+        self._session_expires = time.monotonic() + ttl_s
+        return self.check_gh_cli_installed()
+
+    def end_session(self) -> None:
+        """End the session started by begin_session and forget the auth state"""
+        self._session_expires = None
+        self.refresh()
+
+    def _api(self, method: str, path: str, timeout: float = 10, **kwargs) -> requests.Response:
+        """
+        Call the REST API for this repository over the persistent session
+
+        Args:
+            method: HTTP method
+            path: Path below /repos/{owner}/{repo}
+            timeout: Request timeout in seconds
+            **kwargs: Passed through to requests (params, json, ...)
+
+        Returns:
+            Response object
+        """
+        return self._http.request(
+            method, f"{GITHUB_API_URL}/repos/{self.repository}{path}", timeout=timeout, **kwargs
+        )
+
+    def _graphql(self, query: str, variables: Dict[str, Any], timeout: float = 10) -> Optional[Dict]:
+        """
+        Run a GraphQL query or mutation over the persistent session
+
+        Args:
+            query: GraphQL document
+            variables: Values for the document's variables
+            timeout: Request timeout in seconds
+
+        Returns:
+            The response's data, or None if the request reported errors
+        """
+        response = self._http.request(
+            'POST', GITHUB_GRAPHQL_URL, timeout=timeout, json={'query': query, 'variables': variables}
+        )
+        if response.status_code != 200:
+            return None
+        payload = response.json()
+        if payload.get('errors'):
+            return None
+        return payload.get('data')
+
+    def _get_json(self, path: str, params: Optional[Dict] = None, timeout: float = 10) -> Optional[Any]:
+        """
+        GET a REST resource, revalidating the previous response by ETag
+
+        An unchanged resource comes back as 304 with no body (and doesn't
+        count against the rate limit); the previously parsed payload is
+        returned instead. Callers must not mutate the result.
+
+        Args:
+            path: Path below /repos/{owner}/{repo}
+            params: Query parameters
+            timeout: Request timeout in seconds
+
+        Returns:
+            Parsed JSON, or None if the request didn't succeed
+        """
+        key = (path, tuple(sorted((params or {}).items())))
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+
+        response = self._api('GET', path, timeout=timeout, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        if response.status_code != 200:
+            return None
+
+        payload = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            if len(self._etag_cache) >= ETAG_CACHE_SIZE:
+                self._etag_cache.clear()
+            self._etag_cache[key] = (etag, payload)
+        return payload
+
+    @staticmethod
+    def _issue_from_api(item: Dict, fields) -> Dict:
+        """
+        Convert a REST issue object to the shape `gh --json` returns
+
+        Args:
+            item: Issue object from the REST API
+            fields: Fields to keep
+
+        Returns:
+            Issue dict with the requested fields
+        """
+        issue = {
+            'number': item['number'],
+            'title': item['title'],
+            'body': item.get('body') or '',
+            'labels': [
+                {'name': label['name'], 'description': label.get('description') or '', 'color': label.get('color', '')}
+                for label in item.get('labels', [])
+            ],
+            'state': item['state'].upper(),
+        }
+        return {field: issue[field] for field in fields}
+
+    def _run_gh(
+        self,
+        *args: str,
+        timeout: float = 5,
+        text: bool = False,
+        stderr: bool = False
+    ) -> Tuple[int, Any, Any]:
+        """
+        Run a gh CLI command in the workspace
+
+        Args:
+            *args: gh arguments, e.g. ('issue', 'view', '42')
+            timeout: Seconds before subprocess.TimeoutExpired is raised
+            text: Decode output to str instead of returning bytes
+            stderr: Capture stderr too (otherwise it is discarded)
+
+        Returns:
+            (returncode, stdout, stderr), with stderr None unless captured
+        """
+        result = subprocess.run(
+            ['gh', *args],
+            cwd=self.workspace_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE if stderr else subprocess.DEVNULL,
+            text=text,
+            timeout=timeout
+        )
+        return result.returncode, result.stdout, result.stderr if stderr else None
+
+    def _edit_labels(self, issue_number: int, remove: str, add: str, timeout: float = 10) -> None:
+        """
+        Replace one label on an issue or PR with another
+
+        Args:
+            issue_number: Issue or PR number
+            remove: Label to remove
+            add: Label to add
+        """
+        if self._http is not None:
+            self._api('DELETE', f'/issues/{issue_number}/labels/{quote(remove)}', timeout=timeout)
+            self._api('POST', f'/issues/{issue_number}/labels', json={'labels': [add]}, timeout=timeout)
+            return
+
+        self._run_gh(
+            'issue', 'edit', str(issue_number),
+            '--remove-label', remove,
+            '--add-label', add,
+            timeout=timeout
+        )
+
+    def _comment(self, issue_number: int, body: str, timeout: float = 5) -> None:
+        """
+        Add a comment to an issue or PR
+
+        Args:
+            issue_number: Issue or PR number
+            body: Comment text (markdown)
+        """
+        if self._http is not None:
+            self._api('POST', f'/issues/{issue_number}/comments', json={'body': body}, timeout=timeout)
+            return
+
+        self._run_gh('issue', 'comment', str(issue_number), '--body', body, timeout=timeout)
 
-    def get_ready_issues(self, label='ready-for-dev', limit=10) -> List[Dict]:
+    @staticmethod
+    def _run_concurrently(*calls) -> None:
+        """
+        Run independent gh/API calls in parallel and wait for all of them
+
+        Args:
+            *calls: Zero-argument callables
+
+        Raises:
+            The first exception raised by any call
+        """
+        with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+            futures = [pool.submit(call) for call in calls]
+        for future in futures:
+            future.result()
+
+    def get_ready_issues(self, label='ready-for-dev', limit=10, include_body=False) -> List[Issue]:
         """
         Get issues labeled as ready for development
 
         Args:
             label: GitHub label to filter by
             limit: Maximum number of issues to return
+            include_body: Also fetch issue bodies (otherwise use get_issue_details)
+
+        Returns:
+            List of Issues, with label names only and body "" unless requested
+        """
+        fields = ('number', 'title', 'body', 'labels') if include_body else ('number', 'title', 'labels')
+        return [
+            Issue(
+                number=item['number'],
+                title=item['title'],
+                labels=tuple(entry['name'] for entry in item.get('labels') or ()),
+                body=item.get('body') or "",
+            )
+            for item in self.list_ready_issues(label, limit, fields=fields)
+        ]
+
+    def list_ready_issues(
+        self,
+        label='ready-for-dev',
+        limit=10,
+        fields=('number', 'title', 'labels')
+    ) -> List[Dict]:
+        """
+        List issues labeled as ready for development, fetching only some fields
+
+        Bodies are left out by default since they can be large; fetch the
+        one for the chosen issue with get_issue_details().
+
+        Args:
+            label: GitHub label to filter by
+            limit: Maximum number of issues to return
+            fields: Issue fields to request from gh
 
         Returns:
-            List of issue dicts with number, title, body, labels
+            List of issue dicts with the requested fields
         """
+        # Security: Field names end up on the gh command line
+        for field in fields:
+            if not _ISSUE_FIELD_RE.fullmatch(field):
+                raise ValueError(f"Security: Invalid issue field: {field}")
+
         # Security: Validate label to prevent command injection
         self._validate_label(label)
 
@@ -99,6 +596,27 @@ class GitHubIntegration:
         if not isinstance(limit, int) or limit <= 0 or limit > 100:
             raise ValueError(f"Security: Invalid limit value: {limit}")
 
+        if self._http is not None and _REST_ISSUE_FIELDS.issuperset(fields):
+            try:
+                items = self._get_json('/issues', params={
+                    'labels': label, 'state': 'open', 'per_page': limit
+                })
+                if items is None:
+                    # Security: Don't expose full error details
+                    print(f"⚠️  Failed to fetch issues")
+                    return []
+                # The issues endpoint also lists pull requests
+                return [
+                    self._issue_from_api(item, fields)
+                    for item in items if 'pull_request' not in item
+                ]
+            except requests.RequestException:
+                print("⚠️  GitHub API request failed")
+                return []
+            except ValueError:
+                print(f"⚠️  Failed to parse GitHub response")
+                return []
+
         if not self.check_gh_cli_installed():
             print("⚠️  GitHub CLI not installed or not authenticated")
             print("   Install: brew install gh")
@@ -106,15 +624,16 @@ class GitHubIntegration:
             return []
 
         try:
-            result = subprocess.run([
-                'gh', 'issue', 'list',
+            returncode, stdout, _ = self._run_gh(
+                'issue', 'list',
                 '--label', label,
-                '--json', 'number,title,body,labels',
-                '--limit', str(limit)
-            ], capture_output=True, text=True, timeout=10)
+                '--json', ','.join(fields),
+                '--limit', str(limit),
+                timeout=10
+            )
 
-            if result.returncode == 0:
-                return json.loads(result.stdout)
+            if returncode == 0:
+                return _json_loads(stdout)
             else:
                 # Security: Don't expose full error details
                 print(f"⚠️  Failed to fetch issues")
@@ -142,27 +661,14 @@ class GitHubIntegration:
         self._validate_issue_number(issue_number)
 
         try:
-            # Remove ready-for-dev label
-            subprocess.run([
-                'gh', 'issue', 'edit', str(issue_number),
-                '--remove-label', 'ready-for-dev'
-            ], capture_output=True, timeout=5)
-
-            # Add in-progress label
-            subprocess.run([
-                'gh', 'issue', 'edit', str(issue_number),
-                '--add-label', 'in-progress'
-            ], capture_output=True, timeout=5)
-
-            # Add comment
-            subprocess.run([
-                'gh', 'issue', 'comment', str(issue_number),
-                '--body', '🤖 AI Scrum Master is now working on this feature...'
-            ], capture_output=True, timeout=5)
-
+            # The label swap and the comment are independent: run them side by side
+            self._run_concurrently(
+                lambda: self._edit_labels(issue_number, 'ready-for-dev', 'in-progress'),
+                lambda: self._comment(issue_number, '🤖 AI Scrum Master is now working on this feature...'),
+            )
             return True
 
-        except subprocess.TimeoutExpired:
+        except (subprocess.TimeoutExpired, requests.RequestException):
             print(f"⚠️  Timeout updating issue #{issue_number}")
             return False
 
@@ -173,40 +679,32 @@ class GitHubIntegration:
         Returns:
             The base branch name to use for PR
         """
-        # Check if staging branch exists
+        # One listing of local branches answers both checks below
         try:
             result = subprocess.run(
-                ['git', 'rev-parse', '--verify', self.base_branch],
+                ['git', 'for-each-ref', '--format=%(refname:short)', 'refs/heads/'],
                 cwd=self.workspace_dir,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
                 timeout=5
             )
-
-            if result.returncode == 0:
-                print(f"✓ Base branch '{self.base_branch}' exists")
-                return self.base_branch
-
+            branches = set(result.stdout.split()) if result.returncode == 0 else set()
         except subprocess.TimeoutExpired:
-            pass
+            branches = set()
+
+        # Check if staging branch exists
+        if self.base_branch in branches:
+            print(f"✓ Base branch '{self.base_branch}' exists")
+            return self.base_branch
 
         # Staging branch doesn't exist - check if we should create it or use main
         print(f"⚠️  Base branch '{self.base_branch}' doesn't exist")
 
         # Check if main branch exists
-        try:
-            main_check = subprocess.run(
-                ['git', 'rev-parse', '--verify', 'main'],
-                cwd=self.workspace_dir,
-                capture_output=True,
-                timeout=5
-            )
-
-            if main_check.returncode == 0:
-                print(f"→ Using 'main' as base branch instead")
-                return 'main'
-
-        except subprocess.TimeoutExpired:
-            pass
+        if 'main' in branches:
+            print(f"→ Using 'main' as base branch instead")
+            return 'main'
 
         # Default to main
         print("→ Defaulting to 'main' as base branch")
@@ -231,52 +729,50 @@ class GitHubIntegration:
         if issue_number is not None:
             self._validate_issue_number(issue_number)
 
-        if not self.check_gh_cli_installed():
+        if self._http is None and not self.check_gh_cli_installed():
             raise Exception(
                 "GitHub CLI not installed or authenticated. "
                 "Run: gh auth login"
             )
 
-        # Ensure base branch exists and get the actual base to use
-        actual_base_branch = self._ensure_base_branch_exists()
+        # The head branch doesn't depend on the base branch or the PR body,
+        # so look it up while those git calls run
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            head_future = pool.submit(self._get_head_branch)
 
-        # Generate PR title - sanitize user story
-        sanitized_story = sanitize_github_text(workflow_result.user_story, max_length=200)
-        pr_title = f"Feature: {sanitized_story[:60]}"
-        if len(sanitized_story) > 60:
-            pr_title += "..."
+            # Ensure base branch exists and get the actual base to use
+            actual_base_branch = self._ensure_base_branch_exists()
 
-        # Generate PR body with checklist (pass actual base branch)
-        pr_body = self._generate_pr_body(workflow_result, issue_number, actual_base_branch)
+            # Sanitize the user story once for both the title and the body
+            sanitized_story = sanitize_github_text(workflow_result.user_story)
+            pr_title = f"Feature: {sanitized_story[:60]}"
+            if len(sanitized_story) > 60:
+                pr_title += "..."
 
-        # Get current branch name (feature branch created by tester)
-        try:
-            branch_result = subprocess.run(
-                ['git', 'branch', '--show-current'],
-                cwd=self.workspace_dir,
-                capture_output=True,
-                text=True,
-                timeout=5
+            # Generate PR body with checklist (pass actual base branch)
+            pr_body = self._generate_pr_body(
+                workflow_result, issue_number, actual_base_branch, story=sanitized_story
             )
-            head_branch = branch_result.stdout.strip()
 
-        except subprocess.TimeoutExpired:
-            print("⚠️  Could not determine current branch")
-            head_branch = "HEAD"
+            head_branch = head_future.result()
+
+        if self._http is not None:
+            return self._create_pr_api(pr_title, pr_body, actual_base_branch, head_branch, issue_number)
 
         # Create PR
         try:
-            result = subprocess.run([
-                'gh', 'pr', 'create',
+            returncode, stdout, error_msg = self._run_gh(
+                'pr', 'create',
                 '--title', pr_title,
                 '--body', pr_body,
                 '--base', actual_base_branch,
                 '--head', head_branch,
-                '--label', 'needs-review'
-            ], cwd=self.workspace_dir, capture_output=True, text=True, timeout=30)
+                '--label', 'needs-review',
+                timeout=30, text=True, stderr=True
+            )
 
-            if result.returncode == 0:
-                pr_url = result.stdout.strip()
+            if returncode == 0:
+                pr_url = stdout.strip()
                 print(f"\n✅ Pull request created: {pr_url}")
 
                 # Link PR back to issue if provided
@@ -285,155 +781,266 @@ class GitHubIntegration:
 
                 return pr_url
             else:
-                error_msg = result.stderr
                 if "already exists" in error_msg:
                     print(f"⚠️  PR already exists for branch {head_branch}")
-                    # Try to get existing PR URL
-                    existing_pr = subprocess.run([
-                        'gh', 'pr', 'list',
+                    # gh includes the existing PR's URL in its error
+                    url_match = _PR_URL_RE.search(error_msg)
+                    if url_match:
+                        return url_match.group(0)
+
+                    # Otherwise ask for it
+                    # (gh extracts the URL itself, so there's no JSON to parse)
+                    list_rc, list_out, _ = self._run_gh(
+                        'pr', 'list',
                         '--head', head_branch,
                         '--json', 'url',
-                        '--limit', '1'
-                    ], cwd=self.workspace_dir, capture_output=True, text=True, timeout=5)
+                        '--jq', '.[0].url // empty',
+                        '--limit', '1',
+                        text=True
+                    )
 
-                    if existing_pr.returncode == 0:
-                        prs = json.loads(existing_pr.stdout)
-                        if prs:
-                            return prs[0]['url']
+                    if list_rc == 0 and list_out.strip():
+                        return list_out.strip()
 
                 raise Exception(f"PR creation failed: {error_msg}")
 
         except subprocess.TimeoutExpired:
             raise Exception("PR creation timed out")
 
-    def _generate_pr_body(
+    def _create_pr_api(
         self,
-        workflow_result: Any,
-        issue_number: Optional[int],
-        base_branch: str = None
-    ) -> str:
-        """Generate PR body with review checklist"""
-
-        # Use provided base branch or fall back to configured one
-        if base_branch is None:
-            base_branch = self.base_branch
+        title: str,
+        body: str,
+        base_branch: str,
+        head_branch: str,
+        issue_number: Optional[int]
+    ) -> Optional[str]:
+        """
+        Create the pull request through the REST API
 
-        # Calculate agent metrics
-        architect = workflow_result.agents[0]
-        security = workflow_result.agents[1]
-        tester = workflow_result.agents[2]
-        po = workflow_result.agents[3]
+        Args:
+            title: PR title
+            body: PR body
+            base_branch: Branch to merge into
+            head_branch: Branch with the changes
+            issue_number: Optional GitHub issue number to link
 
-        # Get file changes from git
+        Returns:
+            PR URL
+        """
         try:
-            diff_result = subprocess.run(
-                ['git', 'diff', '--name-status', base_branch],
-                cwd=self.workspace_dir,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            files_changed = diff_result.stdout.strip()
-        except subprocess.TimeoutExpired:
-            files_changed = "(Could not determine changed files)"
-
-        body = f"""## 🤖 AI-Generated Feature Implementation
+            # The issue/label node IDs for the GraphQL link don't depend on
+            # the PR, so look them up while it's being created
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                ids_future = pool.submit(self._link_ids, issue_number) if issue_number else None
+                response = self._api('POST', '/pulls', timeout=30, json={
+                    'title': title, 'body': body, 'base': base_branch, 'head': head_branch
+                })
+
+            if response.status_code == 201:
+                pr = response.json()
+                pr_url = pr['html_url']
+                print(f"\n✅ Pull request created: {pr_url}")
 
-{f"**Related Issue:** #{issue_number}" if issue_number else ""}
+                ids = ids_future.result() if ids_future else None
+                if ids:
+                    # PR label, issue comment and issue label swap in one request
+                    self._link_pr_graphql(issue_number, pr, ids)
+                    return pr_url
 
-### What Changed
-{workflow_result.user_story}
-
----
+                self._api('POST', f"/issues/{pr['number']}/labels", json={'labels': ['needs-review']})
 
-## ⚠️ HUMAN REVIEW CHECKLIST
+                # Link PR back to issue if provided
+                if issue_number:
+                    self._link_pr_to_issue(issue_number, pr_url)
 
-Before merging, please verify:
+                return pr_url
 
-### Code Quality
-- [ ] Code follows project style guidelines
-- [ ] No test artifacts left behind (test.html, temp.js, etc.)
-- [ ] No unnecessary files renamed or deleted
-- [ ] Comments are clear and helpful
-- [ ] Error handling is appropriate
+            error_msg = response.text
+            if "already exists" in error_msg:
+                print(f"⚠️  PR already exists for branch {head_branch}")
+                # Try to get existing PR URL
+                owner = self.repository.split('/')[0]
+                existing = self._api('GET', '/pulls', params={
+                    'head': f"{owner}:{head_branch}", 'state': 'open', 'per_page': 1
+                })
+                if existing.status_code == 200 and existing.json():
+                    return existing.json()[0]['html_url']
 
-### Functionality
-- [ ] Feature works as described{f" in issue #{issue_number}" if issue_number else ""}
-- [ ] No breaking changes to existing features
-- [ ] Edge cases are handled properly
-- [ ] User experience is intuitive
+            raise Exception(f"PR creation failed: {error_msg}")
 
-### Security
-- [ ] No XSS vulnerabilities
-- [ ] No SQL injection risks
-- [ ] Input validation is present
-- [ ] Authentication/authorization works correctly
-- [ ] No sensitive data exposed
-
-### Testing
-- [ ] All automated tests pass ✓
-- [ ] Manual testing completed
-- [ ] Tested on multiple browsers (if frontend)
-- [ ] Tested edge cases manually
-- [ ] Performance is acceptable
+        except requests.Timeout:
+            raise Exception("PR creation timed out")
+        except requests.RequestException as e:
+            raise Exception(f"PR creation failed: {e}")
 
-### Documentation
-- [ ] README updated if needed
-- [ ] API documentation updated if needed
-- [ ] User-facing changes documented
+    def _get_head_branch(self) -> str:
+        """
+        Get the current branch name (the feature branch created by tester)
 
----
+        Returns:
+            Branch name, or "HEAD" if it couldn't be determined
+        """
+        try:
+            branch_result = subprocess.run(
+                ['git', 'branch', '--show-current'],
+                cwd=self.workspace_dir,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=5
+            )
+            return branch_result.stdout.strip()
 
-## 📊 AI Agent Metrics
+        except subprocess.TimeoutExpired:
+            print("⚠️  Could not determine current branch")
+            return "HEAD"
 
-| Agent | Cost | Duration | Status |
-|-------|------|----------|--------|
-| Architect | ${architect['cost_usd']:.3f} | {architect['duration_ms']/1000:.1f}s | ✅ |
-| Security | ${security['cost_usd']:.3f} | {security['duration_ms']/1000:.1f}s | ✅ |
-| Tester | ${tester['cost_usd']:.3f} | {tester['duration_ms']/1000:.1f}s | ✅ |
-| Product Owner | ${po['cost_usd']:.3f} | {po['duration_ms']/1000:.1f}s | ✅ APPROVED |
+    def _generate_pr_body(
+        self,
+        workflow_result: Any,
+        issue_number: Optional[int],
+        base_branch: str = None,
+        story: Optional[str] = None
+    ) -> str:
+        """Generate PR body with review checklist (story: pre-sanitized user story)"""
 
-**Total Cost:** ${workflow_result.total_cost:.2f}
-**Total Duration:** {workflow_result.total_duration_ms/1000/60:.1f} minutes
-**Revisions:** {workflow_result.revision_count}
+        # Use provided base branch or fall back to configured one
+        if base_branch is None:
+            base_branch = self.base_branch
+        if story is None:
+            story = sanitize_github_text(workflow_result.user_story)
+
+        # Precompute the conditional fragments and the metrics table rows
+        issue_line = f"**Related Issue:** #{issue_number}" if issue_number else ""
+        issue_suffix = f" in issue #{issue_number}" if issue_number else ""
+        is_main = base_branch == "main"
+        metrics_rows = "\n".join(
+            f"| {name} | ${agent['cost_usd']:.3f} | {agent['duration_ms']/1000:.1f}s | {status} |"
+            for (name, status), agent in zip(_METRICS_AGENTS, workflow_result.agents)
+        )
 
----
+        # Get file changes from git
+        try:
+            files_changed = self._changed_files(base_branch)
+        except subprocess.TimeoutExpired:
+            files_changed = "(Could not determine changed files)"
 
-## 📁 Files Changed
+        return _PR_BODY_TEMPLATE.format_map({
+            "issue_line": issue_line,
+            "user_story": story,
+            "issue_suffix": issue_suffix,
+            "metrics_rows": metrics_rows,
+            "total_cost": workflow_result.total_cost,
+            "total_minutes": workflow_result.total_duration_ms / 1000 / 60,
+            "revision_count": workflow_result.revision_count,
+            "files_changed": files_changed,
+            "base_branch": base_branch,
+            "merge_note": "" if is_main else " (NOT main)",
+            "warning": ("Thoroughly test before deploying to production" if is_main
+                        else "Merge to staging first, then to main after validation"),
+        })
+
+    def _changed_files(self, base_branch: str) -> str:
+        """
+        List files changed on HEAD relative to base_branch, one per line
 
-```
-{files_changed}
-```
+        Resolving the two commits is cheap; the tree diff is what costs,
+        so its result is remembered per (HEAD, base) commit pair. Commit
+        IDs never change meaning, so a cached entry can't go stale.
+        """
+        revs = subprocess.run(
+            ['git', 'rev-parse', 'HEAD^{commit}', f'{base_branch}^{{commit}}'],
+            cwd=self.workspace_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=5
+        )
+        key = tuple(revs.stdout.split()) if revs.returncode == 0 else None
+        if key in self._diff_cache:
+            return self._diff_cache[key]
+
+        diff_result = subprocess.run(
+            ['git', 'diff', '--name-status', '--no-renames', '-z', base_branch, 'HEAD'],
+            cwd=self.workspace_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=5
+        )
+        # -z output alternates status and path: "M\0a.py\0A\0b.py\0"
+        parts = iter(diff_result.stdout.split('\0'))
+        files_changed = "\n".join(f"{status}\t{path}" for status, path in zip(parts, parts) if path)
+
+        if key is not None and diff_result.returncode == 0:
+            if len(self._diff_cache) >= DIFF_CACHE_SIZE:
+                self._diff_cache.clear()
+            self._diff_cache[key] = files_changed
+        return files_changed
+
+    def _link_ids(self, issue_number: int) -> Optional[Dict[str, str]]:
+        """
+        Look up the node IDs _link_pr_graphql needs
 
----
+        Args:
+            issue_number: GitHub issue number
 
-## 🔄 Next Steps
+        Returns:
+            Dict with issue, needs_review and in_progress IDs, or None if
+            the issue or either label is missing or the lookup failed
+        """
+        owner, name = self.repository.split('/')
+        try:
+            data = self._graphql(_LINK_IDS_QUERY, {'owner': owner, 'name': name, 'issue': issue_number})
+        except (requests.RequestException, ValueError):
+            return None
 
-1. ✅ Review code changes above
-2. ✅ Complete the checklist
-3. ✅ Merge to `{base_branch}` branch{" (NOT main)" if base_branch != "main" else ""}
-4. ✅ Test on staging environment
-5. ✅ Create production release when ready
+        repo = (data or {}).get('repository') or {}
+        if not (repo.get('issue') and repo.get('needsReview') and repo.get('inProgress')):
+            return None
+        return {
+            'issue': repo['issue']['id'],
+            'needs_review': repo['needsReview']['id'],
+            'in_progress': repo['inProgress']['id'],
+        }
 
----
+    def _link_pr_graphql(self, issue_number: int, pr: Dict[str, Any], ids: Dict[str, str]) -> None:
+        """
+        Label a new PR and link it back to its issue in one GraphQL mutation
 
-🤖 Generated by AI Scrum Master v2.2
-⚠️  **IMPORTANT:** {"Merge to staging first, then to main after validation" if base_branch != "main" else "Thoroughly test before deploying to production"}
-"""
-        return body
+        Does what the needs-review label POST plus _link_pr_to_issue do over
+        REST. A failed mutation isn't retried over REST since part of it may
+        already have been applied (a second comment would be noise).
 
-    def _link_pr_to_issue(self, issue_number: int, pr_url: str) -> None:
-        """Link PR back to issue with comment"""
-        # Security: Validate issue number
+        Args:
+            issue_number: GitHub issue number
+            pr: Pull request as returned by the REST API
+            ids: Node IDs from _link_ids
+        """
         self._validate_issue_number(issue_number)
 
+        try:
+            data = self._graphql(_LINK_PR_MUTATION, {
+                'pr': pr['node_id'],
+                'issue': ids['issue'],
+                'body': self._link_comment(pr['html_url']),
+                'needsReview': [ids['needs_review']],
+                'inProgress': [ids['in_progress']],
+            })
+        except (requests.RequestException, ValueError):
+            data = None
+
+        if data is None:
+            print(f"⚠️  Could not link PR to issue #{issue_number}")
+
+    @staticmethod
+    def _link_comment(pr_url: str) -> str:
+        """Comment posted on an issue once its PR exists"""
         # Security: Sanitize PR URL to prevent injection
         pr_url = sanitize_github_text(pr_url, max_length=500)
 
-        try:
-            subprocess.run([
-                'gh', 'issue', 'comment', str(issue_number),
-                '--body', f"""✅ **Pull request created:** {pr_url}
+        return f"""✅ **Pull request created:** {pr_url}
 
 Please review and test before merging to staging.
 
@@ -444,16 +1051,22 @@ Please review and test before merging to staging.
 4. Approve and merge to staging
 5. Perform UAT on staging environment
 """
-            ], capture_output=True, timeout=5)
 
-            # Update label
-            subprocess.run([
-                'gh', 'issue', 'edit', str(issue_number),
-                '--remove-label', 'in-progress',
-                '--add-label', 'needs-review'
-            ], capture_output=True, timeout=5)
+    def _link_pr_to_issue(self, issue_number: int, pr_url: str) -> None:
+        """Link PR back to issue with comment"""
+        # Security: Validate issue number
+        self._validate_issue_number(issue_number)
+
+        link_comment = self._link_comment(pr_url)
 
-        except subprocess.TimeoutExpired:
+        try:
+            # Comment and label update don't depend on each other
+            self._run_concurrently(
+                lambda: self._comment(issue_number, link_comment),
+                lambda: self._edit_labels(issue_number, 'in-progress', 'needs-review', timeout=5),
+            )
+
+        except (subprocess.TimeoutExpired, requests.RequestException):
             print(f"⚠️  Could not link PR to issue #{issue_number}")
 
     def get_issue_details(self, issue_number: int) -> Optional[Dict]:
@@ -469,14 +1082,23 @@ Please review and test before merging to staging.
         # Security: Validate issue number to prevent command injection
         self._validate_issue_number(issue_number)
 
+        if self._http is not None:
+            try:
+                item = self._get_json(f'/issues/{issue_number}', timeout=5)
+                if item is None:
+                    return None
+                return self._issue_from_api(item, ('number', 'title', 'body', 'labels', 'state'))
+            except (requests.RequestException, ValueError):
+                return None
+
         try:
-            result = subprocess.run([
-                'gh', 'issue', 'view', str(issue_number),
+            returncode, stdout, _ = self._run_gh(
+                'issue', 'view', str(issue_number),
                 '--json', 'number,title,body,labels,state'
-            ], capture_output=True, text=True, timeout=5)
+            )
 
-            if result.returncode == 0:
-                return json.loads(result.stdout)
+            if returncode == 0:
+                return _json_loads(stdout)
             else:
                 return None
 
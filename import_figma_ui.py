@@ -3,37 +3,37 @@
 Helper script to import Figma UI with protection
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from ui_protector import UIProtectionOrchestrator
 
+# Calculator keypad, in grid order (label, type, columns spanned); shared
+# by the Figma source and the generated UI so the two can't drift apart
+_BUTTONS = (
+    ('AC', 'function', 1), ('±', 'function', 1), ('%', 'function', 1), ('÷', 'operator', 1),
+    ('7', 'number', 1), ('8', 'number', 1), ('9', 'number', 1), ('×', 'operator', 1),
+    ('4', 'number', 1), ('5', 'number', 1), ('6', 'number', 1), ('-', 'operator', 1),
+    ('1', 'number', 1), ('2', 'number', 1), ('3', 'number', 1), ('+', 'operator', 1),
+    ('0', 'number', 2), ('.', 'number', 1), ('=', 'operator', 1),
+)
+
+
+def _button_rows(indent: str) -> str:
+    """Render _BUTTONS as TypeScript array entries, a blank line between grid rows"""
+    lines = []
+    for i, (label, kind, span) in enumerate(_BUTTONS):
+        if i and i % 4 == 0:
+            lines.append("")
+        lines.append(f"{indent}{{ label: '{label}', type: '{kind}', span: {span} }},")
+    return "\n".join(lines)
+
+
 # Your Figma-generated UI code
 figma_code = """import { motion } from 'motion/react';
 
 export function Calculator() {
   const buttons = [
-    { label: 'AC', type: 'function', span: 1 },
-    { label: '±', type: 'function', span: 1 },
-    { label: '%', type: 'function', span: 1 },
-    { label: '÷', type: 'operator', span: 1 },
-
-    { label: '7', type: 'number', span: 1 },
-    { label: '8', type: 'number', span: 1 },
-    { label: '9', type: 'number', span: 1 },
-    { label: '×', type: 'operator', span: 1 },
-
-    { label: '4', type: 'number', span: 1 },
-    { label: '5', type: 'number', span: 1 },
-    { label: '6', type: 'number', span: 1 },
-    { label: '-', type: 'operator', span: 1 },
-
-    { label: '1', type: 'number', span: 1 },
-    { label: '2', type: 'number', span: 1 },
-    { label: '3', type: 'number', span: 1 },
-    { label: '+', type: 'operator', span: 1 },
-
-    { label: '0', type: 'number', span: 2 },
-    { label: '.', type: 'number', span: 1 },
-    { label: '=', type: 'operator', span: 1 },
+{button_rows}
   ];
 
   return (
@@ -89,31 +89,10 @@ export function Calculator() {
     </motion.div>
   );
 }
-"""
-
-# Workspace directory
-workspace = Path.home() / "Development/repos/calculator-app-by-ai"
-
-# Create UI protection orchestrator
-orchestrator = UIProtectionOrchestrator(workspace)
-
-print("🎨 Importing Figma UI with protection...")
-print("=" * 60)
-
-# We'll manually create the protected UI file and logic stub
-# since the Figma code has UI and empty onClick handlers mixed together
-
-# Create components directory
-components_dir = workspace / "src/components"
-components_dir.mkdir(parents=True, exist_ok=True)
+""".replace("{button_rows}", _button_rows("    "))
 
-# Create lib directory for logic
-lib_dir = workspace / "src/lib"
-lib_dir.mkdir(parents=True, exist_ok=True)
-
-# Write protected UI file
-ui_file = components_dir / "CalculatorUI.tsx"
-ui_content = """// 🔒 UI-PROTECTED
+# Protected UI component: the Figma design with its handlers turned into props
+_UI_CONTENT = """// 🔒 UI-PROTECTED
 // This file contains visual design from Figma
 // DO NOT modify className, styles, animations, or layout
 // Only data flow (props, handlers) can be changed
@@ -131,33 +110,12 @@ interface CalculatorUIProps {
   onButtonClick: (button: Button) => void;
 }
 
-export function CalculatorUI({ display, onButtonClick }: CalculatorUIProps) {
-  const buttons: Button[] = [
-    { label: 'AC', type: 'function', span: 1 },
-    { label: '±', type: 'function', span: 1 },
-    { label: '%', type: 'function', span: 1 },
-    { label: '÷', type: 'operator', span: 1 },
-
-    { label: '7', type: 'number', span: 1 },
-    { label: '8', type: 'number', span: 1 },
-    { label: '9', type: 'number', span: 1 },
-    { label: '×', type: 'operator', span: 1 },
-
-    { label: '4', type: 'number', span: 1 },
-    { label: '5', type: 'number', span: 1 },
-    { label: '6', type: 'number', span: 1 },
-    { label: '-', type: 'operator', span: 1 },
-
-    { label: '1', type: 'number', span: 1 },
-    { label: '2', type: 'number', span: 1 },
-    { label: '3', type: 'number', span: 1 },
-    { label: '+', type: 'operator', span: 1 },
-
-    { label: '0', type: 'number', span: 2 },
-    { label: '.', type: 'number', span: 1 },
-    { label: '=', type: 'operator', span: 1 },
-  ];
+// Static, so built once at module load rather than on every render
+const BUTTONS: readonly Button[] = [
+{button_rows}
+];
 
+export function CalculatorUI({ display, onButtonClick }: CalculatorUIProps) {
   return (
     <motion.div
       initial={{ opacity: 0, scale: 0.9 }}
@@ -179,7 +137,7 @@ export function CalculatorUI({ display, onButtonClick }: CalculatorUIProps) {
 
         {/* Buttons Grid */}
         <div className="grid grid-cols-4 gap-3">
-          {buttons.map((button, index) => (
+          {BUTTONS.map((button, index) => (
             <motion.button
               key={index}
               whileHover={{ scale: 1.05 }}
@@ -213,17 +171,10 @@ export function CalculatorUI({ display, onButtonClick }: CalculatorUIProps) {
 }
 
 export type { Button, CalculatorUIProps };
-"""
-
-ui_file.write_text(ui_content)
-print(f"✅ Created protected UI file: {ui_file}")
+""".replace("{button_rows}", _button_rows("  "))
 
-# Mark as protected
-orchestrator.protector.mark_as_protected(ui_file)
-
-# Create logic stub
-logic_file = lib_dir / "calculatorLogic.ts"
-logic_content = """// ✅ MODIFIABLE: Agents can change business logic here
+# Calculator engine stub for agents to implement
+_LOGIC_CONTENT = """// ✅ MODIFIABLE: Agents can change business logic here
 // This file contains the calculator engine - AI agents will implement this
 
 export type Operator = '+' | '-' | '×' | '÷' | null;
@@ -262,12 +213,8 @@ export class CalculatorEngine {
 }
 """
 
-logic_file.write_text(logic_content)
-print(f"📝 Created logic stub: {logic_file}")
-
-# Create container component
-container_file = components_dir / "Calculator.tsx"
-container_content = """// Container component that connects UI to logic
+# Container wiring the UI to the engine
+_CONTAINER_CONTENT = """// Container component that connects UI to logic
 import { useState, useRef } from 'react';
 import { CalculatorUI, type Button } from './CalculatorUI';
 import { CalculatorEngine } from '../lib/calculatorLogic';
@@ -287,12 +234,8 @@ export function Calculator() {
 }
 """
 
-container_file.write_text(container_content)
-print(f"🔗 Created container component: {container_file}")
-
-# Create package.json
-package_file = workspace / "package.json"
-package_content = """{
+# package.json
+_PACKAGE_CONTENT = """{
   "name": "calculator-app",
   "version": "1.0.0",
   "type": "module",
@@ -309,12 +252,8 @@ package_content = """{
 }
 """
 
-package_file.write_text(package_content)
-print(f"📦 Created package.json: {package_file}")
-
-# Create README
-readme_file = workspace / "README.md"
-readme_content = """# Calculator App with UI Protection
+# README.md
+_README_CONTENT = """# Calculator App with UI Protection
 
 This calculator uses Figma-designed UI that is protected from modification.
 
@@ -344,8 +283,48 @@ cd ~/Development/repos/ai-scrum-master-v2
 ```
 """
 
-readme_file.write_text(readme_content)
-print(f"📖 Created README: {readme_file}")
+# Workspace directory
+workspace = Path.home() / "Development/repos/calculator-app-by-ai"
+
+# Create UI protection orchestrator
+orchestrator = UIProtectionOrchestrator(workspace)
+
+print("🎨 Importing Figma UI with protection...")
+print("=" * 60)
+
+# We'll manually create the protected UI file and logic stub
+# since the Figma code has UI and empty onClick handlers mixed together
+
+# Create components directory
+components_dir = workspace / "src/components"
+components_dir.mkdir(parents=True, exist_ok=True)
+
+# Create lib directory for logic
+lib_dir = workspace / "src/lib"
+lib_dir.mkdir(parents=True, exist_ok=True)
+
+# Output files
+ui_file = components_dir / "CalculatorUI.tsx"
+logic_file = lib_dir / "calculatorLogic.ts"
+container_file = components_dir / "Calculator.tsx"
+package_file = workspace / "package.json"
+readme_file = workspace / "README.md"
+
+# The files don't depend on each other, so write them all at once
+outputs = [
+    (ui_file, _UI_CONTENT, "✅ Created protected UI file"),
+    (logic_file, _LOGIC_CONTENT, "📝 Created logic stub"),
+    (container_file, _CONTAINER_CONTENT, "🔗 Created container component"),
+    (package_file, _PACKAGE_CONTENT, "📦 Created package.json"),
+    (readme_file, _README_CONTENT, "📖 Created README"),
+]
+with ThreadPoolExecutor(max_workers=len(outputs)) as pool:
+    list(pool.map(lambda output: output[0].write_text(output[1]), outputs))
+for path, _, message in outputs:
+    print(f"{message}: {path}")
+
+# Mark as protected
+orchestrator.protector.mark_as_protected(ui_file)
 
 print("\n" + "=" * 60)
 print("✅ Figma UI Import Complete!")
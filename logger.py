@@ -3,11 +3,125 @@ Logging Module for AI Scrum Master
 
 Provides comprehensive logging of workflow execution for debugging and monitoring.
 """
+import atexit
+import gzip
 import logging
 import json
+import os
+import queue
+import tempfile
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, Dict, Any
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List
+
+_BAR = "=" * 60
+
+# Shared by every WorkflowLogger's handlers; formatters hold no per-handler state
+_FILE_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_CONSOLE_FORMATTER = logging.Formatter('%(message)s')
+
+# Fresh agent entries are copies of this: copying a ready-built dict is
+# cheaper than building the nine-key literal, and shares the key strings
+_AGENT_TEMPLATE: Dict[str, Any] = {
+    "agent": None,
+    "start_time": None,
+    "end_time": None,
+    "task": None,
+    "success": None,
+    "cost_usd": 0.0,
+    "duration_ms": 0,
+    "num_turns": 0,
+    "error": None
+}
+_AGENT_END_FIELDS = ("agent", "success", "cost_usd", "duration_ms", "num_turns", "error")
+
+
+def _iso(ns: Optional[int]) -> Optional[str]:
+    """Format a time.time_ns() timestamp as ISO 8601 (UTC)"""
+    if ns is None:
+        return None
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
+
+def _atomic_write_json_gz(path: Path, data: Dict[str, Any]):
+    """
+    Write data to path as gzipped compact JSON, atomically
+
+    The file is written to a temp file in the same directory, synced, and
+    renamed over path, so a crash mid-write never leaves a truncated file.
+    Repetitive JSON gzips to a few percent of its size.
+    """
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as tmp:
+        try:
+            with gzip.GzipFile(path.name, 'wb', compresslevel=3, fileobj=tmp) as gz:
+                gz.write(json.dumps(data, separators=(",", ":")).encode())
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    os.replace(tmp.name, path)
+
+
+def _is_event(record: logging.LogRecord) -> bool:
+    """Whether a record is a structured event rather than a log line"""
+    return hasattr(record, "event")
+
+
+class _EventLogHandler(logging.Handler):
+    """Appends structured events (records with an `event` dict) to a JSONL file"""
+
+    def __init__(self, path: Path):
+        super().__init__()
+        self.stream = open(path, "a", buffering=1 << 16)
+        self.addFilter(_is_event)
+
+    def emit(self, record: logging.LogRecord):
+        self.stream.write(json.dumps(record.event, separators=(",", ":")) + "\n")
+
+    def flush(self):
+        with self.lock:
+            self.stream.flush()
+
+    def close(self):
+        with self.lock:
+            self.stream.close()
+        super().close()
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that doesn't flush after every record (see _DrainingQueueListener)"""
+
+    def emit(self, record: logging.LogRecord):
+        # StreamHandler.emit, minus its flush() per record
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _DrainingQueueListener(QueueListener):
+    """
+    QueueListener that flushes its handlers whenever the queue runs dry
+
+    A burst of records becomes one write() per file instead of one per
+    record, while anything logged before an idle moment is still on disk
+    for `tail -f` and survives a crash.
+    """
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self.queue.get(block)
 
 
 class WorkflowLogger:
@@ -16,34 +130,39 @@ class WorkflowLogger:
 
     Features:
     - Console and file logging
-    - Structured JSON logs for analysis
+    - Append-only JSONL event log, plus a gzipped JSON summary on close
     - Agent-specific log tracking
     - Cost and performance metrics
     - Error tracking
     """
 
-    def __init__(self, log_dir: Optional[Path] = None, workflow_id: Optional[str] = None):
+    def __init__(self, log_dir: Optional[Path] = None, workflow_id: Optional[str] = None,
+                 console: Optional[bool] = None):
         """
         Initialize workflow logger
 
         Args:
             log_dir: Directory for log files (default: ./logs)
             workflow_id: Unique ID for this workflow (default: timestamp)
+            console: Echo log lines to the console (default: on, unless
+                AI_SCRUM_NO_CONSOLE is set)
         """
         self.log_dir = Path(log_dir) if log_dir else Path("logs")
-        self.log_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate workflow ID
         self.workflow_id = workflow_id or datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # Log files
         self.log_file = self.log_dir / f"workflow_{self.workflow_id}.log"
-        self.json_log_file = self.log_dir / f"workflow_{self.workflow_id}.json"
+        self.json_log_file = self.log_dir / f"workflow_{self.workflow_id}.json.gz"
+        self.events_log_file = self.log_dir / f"workflow_{self.workflow_id}.jsonl"
 
-        # Structured log data
+
+        # Structured log data. Timestamps are time.time_ns() integers,
+        # formatted as ISO strings only when the JSON summary is written.
         self.workflow_data = {
             "workflow_id": self.workflow_id,
-            "start_time": datetime.now().isoformat(),
+            "start_time": time.time_ns(),
             "end_time": None,
             "user_story": None,
             "agents": [],
@@ -53,149 +172,238 @@ class WorkflowLogger:
             "status": "running",
             "errors": []
         }
+        # Entries of workflow_data["agents"] not yet ended, per agent
+        self._active: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
 
         # Setup Python logging
         self.logger = logging.getLogger(f"workflow_{self.workflow_id}")
         self.logger.setLevel(logging.DEBUG)
 
         # File handler
-        file_handler = logging.FileHandler(self.log_file)
+        try:
+            file_handler = _BufferedFileHandler(self.log_file)
+        except FileNotFoundError:
+            # Only the first workflow in a fresh log directory pays for mkdir
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            file_handler = _BufferedFileHandler(self.log_file)
         file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        file_handler.setFormatter(file_formatter)
-
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_formatter = logging.Formatter('%(message)s')
-        console_handler.setFormatter(console_formatter)
-
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
-
-        self.logger.info(f"=== Workflow {self.workflow_id} Started ===")
+        file_handler.setFormatter(_FILE_FORMATTER)
+        file_handler.addFilter(lambda record: not _is_event(record))
+
+        # Event log: one JSON line per event; rewriting the whole JSON on
+        # every event made a workflow's log writes quadratic in its length
+        event_handler = _EventLogHandler(self.events_log_file)
+
+        # File and event log writes happen on a listener thread, so logging
+        # costs the workflow a queue put instead of a write(). The console
+        # stays inline to keep its order with the orchestrator's print()s.
+        self._queue = queue.SimpleQueue()
+        self._listener = _DrainingQueueListener(self._queue, file_handler, event_handler, respect_handler_level=True)
+        self._listener.start()
+        self._closed = False
+        self._handlers = [QueueHandler(self._queue)]
+        if console is None:
+            console = not os.getenv("AI_SCRUM_NO_CONSOLE")
+        if console:
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(logging.INFO)
+            console_handler.setFormatter(_CONSOLE_FORMATTER)
+            self._handlers.append(console_handler)
+        for handler in self._handlers:
+            self.logger.addHandler(handler)
+        # Don't lose queued records if the workflow ends without completing
+        atexit.register(self.close)
+
+        self.logger.info("=== Workflow %s Started ===", self.workflow_id)
+        self._emit("workflow_start", ts=self.workflow_data["start_time"], workflow_id=self.workflow_id)
 
     def log_user_story(self, user_story: str):
         """Log the user story being implemented"""
         self.workflow_data["user_story"] = user_story
-        self.logger.info(f"User Story: {user_story[:200]}...")
-        self._save_json()
+        self.logger.info("User Story: %.200s...", user_story)
+        self._emit("user_story", user_story=user_story)
 
     def log_agent_start(self, agent_name: str, task: str):
         """Log when an agent starts execution"""
-        agent_data = {
-            "agent": agent_name,
-            "start_time": datetime.now().isoformat(),
-            "end_time": None,
-            "task": task,
-            "success": None,
-            "cost_usd": 0.0,
-            "duration_ms": 0,
-            "num_turns": 0,
-            "error": None
-        }
+        agent_data = _AGENT_TEMPLATE.copy()
+        agent_data["agent"] = agent_name
+        agent_data["start_time"] = time.time_ns()
+        agent_data["task"] = task
         self.workflow_data["agents"].append(agent_data)
-        self.logger.info(f"\n{'='*60}")
-        self.logger.info(f"🤖 {agent_name} Agent Starting")
-        self.logger.info(f"{'='*60}")
-        self.logger.info(f"Task: {task[:150]}...")
-        self._save_json()
+        self._active[agent_name].append(agent_data)
+        self.logger.info("\n%s", _BAR)
+        self.logger.info("🤖 %s Agent Starting", agent_name)
+        self.logger.info(_BAR)
+        self.logger.info("Task: %.150s...", task)
+        self._emit("agent_start", ts=agent_data["start_time"], agent=agent_name, task=task)
 
     def log_agent_end(self, agent_name: str, result: Dict[str, Any]):
         """Log when an agent completes execution"""
-        # Find the most recent agent entry
-        for agent_data in reversed(self.workflow_data["agents"]):
-            if agent_data["agent"] == agent_name and agent_data["end_time"] is None:
-                agent_data["end_time"] = datetime.now().isoformat()
-                agent_data["success"] = result.get("success", False)
-                agent_data["cost_usd"] = result.get("cost_usd", 0.0)
-                agent_data["duration_ms"] = result.get("duration_ms", 0)
-                agent_data["num_turns"] = result.get("num_turns", 0)
-                agent_data["error"] = result.get("error")
-
-                # Update totals
-                self.workflow_data["total_cost"] += agent_data["cost_usd"]
-                self.workflow_data["total_duration_ms"] += agent_data["duration_ms"]
-
-                # Log result
-                if result.get("success"):
-                    self.logger.info(f"✅ {agent_name} completed successfully")
-                    self.logger.info(f"   Cost: ${agent_data['cost_usd']:.4f} | Duration: {agent_data['duration_ms']/1000:.1f}s | Turns: {agent_data['num_turns']}")
-                else:
-                    error = result.get("error", "Unknown error")
-                    self.logger.error(f"❌ {agent_name} failed: {error}")
-                    agent_data["error"] = error
-                    self.workflow_data["errors"].append(f"{agent_name}: {error}")
-
-                break
-
-        self._save_json()
+        # Most recent run of this agent that hasn't ended yet
+        runs = self._active.get(agent_name)
+        if not runs:
+            return
+        data = self.workflow_data
+        agent_data = runs.pop()
+        success = result.get("success", False)
+        cost = result.get("cost_usd", 0.0)
+        duration_ms = result.get("duration_ms", 0)
+        agent_data["end_time"] = time.time_ns()
+        agent_data["success"] = success
+        agent_data["cost_usd"] = cost
+        agent_data["duration_ms"] = duration_ms
+        agent_data["num_turns"] = result.get("num_turns", 0)
+
+        # Update totals
+        data["total_cost"] += cost
+        data["total_duration_ms"] += duration_ms
+
+        # Log result
+        if success:
+            agent_data["error"] = result.get("error")
+            self.logger.info("✅ %s completed successfully", agent_name)
+            self.logger.info(
+                "   Cost: $%.4f | Duration: %.1fs | Turns: %s",
+                cost, duration_ms / 1000, agent_data["num_turns"]
+            )
+        else:
+            error = agent_data["error"] = result.get("error", "Unknown error")
+            self.logger.error("❌ %s failed: %s", agent_name, error)
+            data["errors"].append(f"{agent_name}: {error}")
+
+        self._emit(
+            "agent_end",
+            ts=agent_data["end_time"],
+            **{key: agent_data[key] for key in _AGENT_END_FIELDS}
+        )
 
     def log_revision(self, revision_num: int, reason: str):
         """Log when a revision is requested"""
         self.workflow_data["revision_count"] = revision_num
-        self.logger.info(f"\n{'='*60}")
-        self.logger.info(f"🔄 REVISION #{revision_num}")
-        self.logger.info(f"Reason: {reason[:200]}...")
-        self.logger.info(f"{'='*60}\n")
-        self._save_json()
+        self.logger.info("\n%s", _BAR)
+        self.logger.info("🔄 REVISION #%s", revision_num)
+        self.logger.info("Reason: %.200s...", reason)
+        self.logger.info("%s\n", _BAR)
+        self._emit("revision", revision=revision_num, reason=reason)
 
     def log_decision(self, decision: str, details: Optional[str] = None):
         """Log Product Owner decision"""
         self.workflow_data["po_decision"] = decision
-        self.logger.info(f"\n👔 Product Owner Decision: {decision}")
+        self.logger.info("\n👔 Product Owner Decision: %s", decision)
         if details:
-            self.logger.info(f"Details: {details[:300]}...")
-        self._save_json()
+            self.logger.info("Details: %.300s...", details)
+        self._emit("decision", decision=decision, details=details)
 
     def log_error(self, error: str):
         """Log an error"""
         self.workflow_data["errors"].append(error)
-        self.logger.error(f"❌ Error: {error}")
-        self._save_json()
+        self.logger.error("❌ Error: %s", error)
+        self._emit("error", error=error)
 
     def log_workflow_complete(self, status: str = "completed"):
         """Log workflow completion"""
-        self.workflow_data["end_time"] = datetime.now().isoformat()
-        self.workflow_data["status"] = status
-
-        self.logger.info(f"\n{'='*60}")
-        self.logger.info(f"📊 WORKFLOW COMPLETE")
-        self.logger.info(f"{'='*60}")
-        self.logger.info(f"Status: {status}")
-        self.logger.info(f"Total Cost: ${self.workflow_data['total_cost']:.4f}")
-        self.logger.info(f"Total Duration: {self.workflow_data['total_duration_ms']/1000:.1f}s")
-        self.logger.info(f"Revisions: {self.workflow_data['revision_count']}")
-        if self.workflow_data['errors']:
-            self.logger.info(f"Errors: {len(self.workflow_data['errors'])}")
-        self.logger.info(f"{'='*60}\n")
-        self.logger.info(f"Log file: {self.log_file}")
-        self.logger.info(f"JSON log: {self.json_log_file}")
-
-        self._save_json()
+        data = self.workflow_data
+        data["end_time"] = time.time_ns()
+        data["status"] = status
+
+        self.logger.info("\n%s", _BAR)
+        self.logger.info("📊 WORKFLOW COMPLETE")
+        self.logger.info(_BAR)
+        self.logger.info("Status: %s", status)
+        self.logger.info("Total Cost: $%.4f", data["total_cost"])
+        self.logger.info("Total Duration: %.1fs", data["total_duration_ms"] / 1000)
+        self.logger.info("Revisions: %s", data["revision_count"])
+        if data["errors"]:
+            self.logger.info("Errors: %d", len(data["errors"]))
+        self.logger.info("%s\n", _BAR)
+        self.logger.info("Log file: %s", self.log_file)
+        self.logger.info("JSON log: %s", self.json_log_file)
+        self.logger.info("Event log: %s", self.events_log_file)
+
+        self._emit("workflow_complete", ts=data["end_time"], status=status)
+        self.close()
+
+    def _emit(self, event: str, ts: Optional[int] = None, **payload):
+        """Queue one event for the JSONL event log (ts in epoch nanoseconds)"""
+        self._queue.put_nowait(logging.makeLogRecord({
+            "levelno": logging.INFO,
+            "event": {"ts": ts or time.time_ns(), "event": event, **payload},
+        }))
+
+    def flush(self):
+        """Wait for queued records to be written, then flush the log files"""
+        if self._closed:
+            return
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.flush()
+        self._listener.start()
+
+    def close(self):
+        """
+        Write out everything queued, save the JSON summary and release the log files
+
+        The summary is dumped once here rather than after every event. A
+        workflow that never completes still gets one (with status "running")
+        when the process exits.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        # The log directory may already be gone by exit (e.g. a temp dir)
+        if self.log_dir.is_dir():
+            self._save_json()
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+        for handler in self._handlers:
+            self.logger.removeHandler(handler)
+        atexit.unregister(self.close)
 
     def _save_json(self):
-        """Save structured log data to JSON file"""
-        with open(self.json_log_file, 'w') as f:
-            json.dump(self.workflow_data, f, indent=2)
+        """Save the aggregated workflow data to the gzipped JSON summary file"""
+        data = {
+            **self.workflow_data,
+            "start_time": _iso(self.workflow_data["start_time"]),
+            "end_time": _iso(self.workflow_data["end_time"]),
+            "agents": [
+                {**agent, "start_time": _iso(agent["start_time"]), "end_time": _iso(agent["end_time"])}
+                for agent in self.workflow_data["agents"]
+            ],
+        }
+        _atomic_write_json_gz(self.json_log_file, data)
 
     def get_summary(self) -> Dict[str, Any]:
         """Get workflow summary"""
+        data = self.workflow_data
         return {
             "workflow_id": self.workflow_id,
-            "status": self.workflow_data["status"],
-            "total_cost": self.workflow_data["total_cost"],
-            "total_duration_s": self.workflow_data["total_duration_ms"] / 1000,
-            "revisions": self.workflow_data["revision_count"],
-            "errors": len(self.workflow_data["errors"]),
-            "agents_executed": len(self.workflow_data["agents"]),
+            "status": data["status"],
+            "total_cost": data["total_cost"],
+            "total_duration_s": data["total_duration_ms"] / 1000,
+            "revisions": data["revision_count"],
+            "errors": len(data["errors"]),
+            "agents_executed": len(data["agents"]),
             "log_file": str(self.log_file),
-            "json_log": str(self.json_log_file)
+            "json_log": str(self.json_log_file),
+            "events_log": str(self.events_log_file)
         }
 
 
+def load_workflow(path: Path) -> Dict[str, Any]:
+    """
+    Load a workflow's JSON summary (workflow_<id>.json.gz)
+
+    Args:
+        path: Path to the summary file
+
+    Returns:
+        The workflow data, with timestamps as ISO strings
+    """
+    with gzip.open(path, 'rt') as f:
+        return json.load(f)
+
+
 def create_logger(workflow_id: Optional[str] = None) -> WorkflowLogger:
     """
     Create a new workflow logger
@@ -4,6 +4,7 @@ AI Scrum Master - Main CLI
 
 Multi-agent development system powered by Claude Code
 """
+import io
 import sys
 import argparse
 from pathlib import Path
@@ -12,16 +13,19 @@ from orchestrator import Orchestrator, WorkflowResult
 from config import VERSION, validate_config
 from utils import sanitize_user_input
 
+_BAR = "=" * 60
+
 
 def print_banner():
     """Print welcome banner"""
     version_line = f"AI SCRUM MASTER v{VERSION}"
     subtitle = "Claude Code Multi-Agent System"
-    print(f"""
+    sys.stdout.write(f"""
 ╔═══════════════════════════════════════════════════════════╗
 ║{version_line:^61}║
 ║{subtitle:^61}║
 ╚═══════════════════════════════════════════════════════════╝
+
 """)
 
 
@@ -42,22 +46,20 @@ def get_multiline_input(prompt: str = "> ") -> str:
     Returns:
         Complete user input as a single string (sanitized)
     """
-    lines = []
-    first_line = True
+    buf = io.StringIO()
+    line_prompt = prompt
     consecutive_blank_lines = 0
 
     while True:
         try:
-            if first_line:
-                line = input(prompt).rstrip()
-                first_line = False
-            else:
-                line = input("... ").rstrip()
+            line = input(line_prompt).rstrip()
+            line_prompt = "... "
 
             # Check for backslash continuation
-            if line.endswith("\\"):
+            if line[-1:] == "\\":
                 # Remove backslash and add line
-                lines.append(line[:-1].rstrip())
+                buf.write(line[:-1].rstrip())
+                buf.write("\n")
                 consecutive_blank_lines = 0
                 continue
 
@@ -66,35 +68,30 @@ def get_multiline_input(prompt: str = "> ") -> str:
                 consecutive_blank_lines += 1
 
                 # Two consecutive blank lines = submit (if we have content)
-                if consecutive_blank_lines >= 2 and lines:
-                    # Remove the last blank line we added
-                    if lines and lines[-1] == '':
-                        lines.pop()
+                if consecutive_blank_lines >= 2 and buf.tell():
                     break
 
                 # First blank line - add it to preserve formatting
-                if lines:  # Only add blank lines after we have content
-                    lines.append(line)
+                if buf.tell():  # Only add blank lines after we have content
+                    buf.write("\n")
                 continue
-            else:
-                # Non-blank line resets the counter
-                consecutive_blank_lines = 0
 
-            # Add the line
-            lines.append(line)
+            # Non-blank line resets the counter
+            consecutive_blank_lines = 0
+            buf.write(line)
+            buf.write("\n")
 
         except EOFError:
             # Ctrl+D pressed - submit what we have
             break
 
-    # Join all lines with newlines and sanitize
-    result = "\n".join(lines)
-    return sanitize_user_input(result)
+    # Trailing newlines (including the submitting blank line) are dropped
+    return sanitize_user_input(buf.getvalue().rstrip("\n"))
 
 
 def print_help():
     """Print available commands"""
-    print("""
+    sys.stdout.write("""
 Available Commands:
   task <description>  - Create and implement a new user story
   status             - Show current workspace status
@@ -138,32 +135,57 @@ Examples:
   Backslash continuation:
     > task Create user authentication with \\
     ... JWT tokens and bcrypt hashing
+
 """)
 
 
 def print_result_summary(result: WorkflowResult):
     """Print workflow result summary"""
-    print("\n" + "="*60)
-    print("📈 WORKFLOW SUMMARY")
-    print("="*60)
-    print(f"Status: {'✅ APPROVED' if result.approved else '❌ NOT APPROVED'}")
-    print(f"Revisions: {result.revision_count}")
-    print(f"Total Cost: ${result.total_cost:.4f}")
+    lines = [
+        "",
+        _BAR,
+        "📈 WORKFLOW SUMMARY",
+        _BAR,
+        f"Status: {'✅ APPROVED' if result.approved else '❌ NOT APPROVED'}",
+        f"Revisions: {result.revision_count}",
+        f"Total Cost: ${result.total_cost:.4f}",
+    ]
 
     if result.errors:
-        print(f"\nErrors:")
-        for error in result.errors:
-            print(f"  - {error}")
+        lines.append("\nErrors:")
+        lines.extend(f"  - {error}" for error in result.errors)
 
     if result.po_decision:
-        print(f"\nProduct Owner Decision:")
+        lines.append("\nProduct Owner Decision:")
         # Print first 300 chars of decision
         decision_preview = result.po_decision[:300]
         if len(result.po_decision) > 300:
             decision_preview += "..."
-        print(f"  {decision_preview}")
+        lines.append(f"  {decision_preview}")
+
+    lines.append(_BAR + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def print_workspace_status(status: dict):
+    """Print workspace status"""
+    lines = [
+        "",
+        _BAR,
+        "📊 WORKSPACE STATUS",
+        _BAR,
+        f"Workspace: {status['workspace']}",
+        f"Current Branch: {status['current_branch']}",
+        "\nRecent Commits:",
+    ]
 
-    print("="*60 + "\n")
+    for name, key in (("Main", "main_commits"), ("Architect", "architect_commits"),
+                      ("Security", "security_commits"), ("Tester", "tester_commits")):
+        lines.append(f"  {name} ({len(status[key])} commits):")
+        lines.extend(f"    {commit}" for commit in status[key][:3])
+
+    lines.append(_BAR + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -211,15 +233,16 @@ def main():
             verbose=cli_args.verbose
         )
     except Exception as e:
-        print(f"❌ Failed to initialize: {e}")
-        print("\nMake sure:")
-        print("  1. Claude Code is installed (claude --version)")
-        print("  2. ANTHROPIC_API_KEY is set in .env")
-        print("  3. You have write permissions to the workspace directory")
+        sys.stdout.write(
+            f"❌ Failed to initialize: {e}\n"
+            "\nMake sure:\n"
+            "  1. Claude Code is installed (claude --version)\n"
+            "  2. ANTHROPIC_API_KEY is set in .env\n"
+            "  3. You have write permissions to the workspace directory\n"
+        )
         sys.exit(1)
 
-    print(f"✅ AI Scrum Master v{VERSION} ready!")
-    print("Type 'help' for available commands\n")
+    sys.stdout.write(f"✅ AI Scrum Master v{VERSION} ready!\nType 'help' for available commands\n\n")
 
     # Main command loop
     while True:
@@ -268,31 +291,7 @@ def main():
                     traceback.print_exc()
 
             elif command == "status":
-                status = orchestrator.get_workspace_status()
-                print("\n" + "="*60)
-                print("📊 WORKSPACE STATUS")
-                print("="*60)
-                print(f"Workspace: {status['workspace']}")
-                print(f"Current Branch: {status['current_branch']}")
-
-                print(f"\nRecent Commits:")
-                print(f"  Main ({len(status['main_commits'])} commits):")
-                for commit in status['main_commits'][:3]:
-                    print(f"    {commit}")
-
-                print(f"  Architect ({len(status['architect_commits'])} commits):")
-                for commit in status['architect_commits'][:3]:
-                    print(f"    {commit}")
-
-                print(f"  Security ({len(status['security_commits'])} commits):")
-                for commit in status['security_commits'][:3]:
-                    print(f"    {commit}")
-
-                print(f"  Tester ({len(status['tester_commits'])} commits):")
-                for commit in status['tester_commits'][:3]:
-                    print(f"    {commit}")
-
-                print("="*60 + "\n")
+                print_workspace_status(orchestrator.get_workspace_status())
 
             else:
                 print(f"❌ Unknown command: {command}")
@@ -313,16 +312,18 @@ if __name__ == "__main__":
     validation = validate_config()
 
     if validation["errors"]:
-        print("❌ Configuration errors detected:")
-        for error in validation["errors"]:
-            print(f"   • {error}")
-        print("\nPlease fix these errors before running AI Scrum Master.")
+        sys.stdout.write(
+            "❌ Configuration errors detected:\n"
+            + "".join(f"   • {error}\n" for error in validation["errors"])
+            + "\nPlease fix these errors before running AI Scrum Master.\n"
+        )
         sys.exit(1)
 
     if validation["warnings"]:
-        print("⚠️  Configuration warnings:")
-        for warning in validation["warnings"]:
-            print(f"   • {warning}")
-        print()
+        sys.stdout.write(
+            "⚠️  Configuration warnings:\n"
+            + "".join(f"   • {warning}\n" for warning in validation["warnings"])
+            + "\n"
+        )
 
     main()
@@ -3,7 +3,15 @@ Orchestrator - Coordinates the AI Scrum Master workflow
 
 Manages the sequential execution of agents:
 Architect -> Security -> Tester -> Product Owner
+
+With WORKFLOW_CONFIG["parallel_review"], Security and Tester run at the
+same time in separate git worktrees, and Tester's commits are then
+rebased onto Security's.
 """
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Any, Optional, List
@@ -32,6 +40,76 @@ from github_integration import GitHubIntegration
 from cache_manager import WorkflowCache
 
 
+# Phrases with which Security/Tester explicitly approve without changes,
+# matched in one case-insensitive pass over the agent's response
+_APPROVAL_INDICATORS = [
+    'approve',
+    'approved',
+    'no changes needed',
+    'no changes required',
+    'no security issues',
+    'no vulnerabilities',
+    'no issues found',
+    'already secure',
+    'excellent security',
+    'passes security review',
+    'security review passed',
+    'no security improvements needed',
+    'implementation is secure',
+]
+_APPROVAL_RE = re.compile('|'.join(re.escape(indicator) for indicator in _APPROVAL_INDICATORS), re.IGNORECASE)
+
+# Common test/temp file patterns
+_SUSPICIOUS_PATTERNS = [
+    ('test.html', 'Test HTML file'),
+    ('temp.', 'Temporary file'),
+    ('debug.', 'Debug file'),
+    ('old_', 'Old version file'),
+    ('.tmp', 'Temporary file'),
+    ('scratch', 'Scratch file'),
+    ('hello', 'Test/demo file (like hello.html, hello.txt)'),
+]
+# A line of a newline-joined file list that contains any pattern (dotfiles ignored)
+_SUSPICIOUS_RE = re.compile(
+    r'^(?!\.).*(?:' + '|'.join(re.escape(pattern) for pattern, _ in _SUSPICIOUS_PATTERNS) + r').*$',
+    re.MULTILINE | re.IGNORECASE
+)
+
+# The PO's "DECISION: <verdict>" line; tolerates spacing and markdown bold
+_PO_DECISION_RE = re.compile(r'DECISION[\s*]*:[\s*]*(APPROVE|REVISE|REJECT)', re.IGNORECASE)
+
+
+def _po_decision(response: str) -> Optional[str]:
+    """Return the PO's APPROVE/REVISE/REJECT verdict, or None if there is none"""
+    match = _PO_DECISION_RE.search(response)
+    return match.group(1).upper() if match else None
+
+# How many existing files a revision prompt lists for the Architect
+_REVISION_FILE_LIMIT = 20
+
+
+def _format_files_context(files, limit: int = _REVISION_FILE_LIMIT) -> str:
+    """
+    Format the revision prompt's list of existing files
+
+    Works on any iterable of paths; files past the limit are only counted.
+
+    Args:
+        files: Iterable of file paths
+        limit: Maximum number of files to list
+
+    Returns:
+        Context block for the Architect's revision task
+    """
+    files = iter(files)
+    listed = "\n".join(["- " + f for f in islice(files, limit)])
+    context = "\n\nExisting files in your implementation:\n" + listed
+    remaining = sum(1 for _ in files)
+    if remaining:
+        context += f"\n... and {remaining} more files"
+    return context
+
+
 @dataclass
 class AgentResult:
     """Result from a single agent execution"""
@@ -47,7 +125,8 @@ class AgentResult:
 class WorkflowResult:
     """Result of a complete workflow execution"""
     user_story: str = ""
-    agents: List[AgentResult] = field(default_factory=list)
+    # Raw agent result dicts, in run order (read by the PR body)
+    agents: List[Dict[str, Any]] = field(default_factory=list)
     architect_result: Optional[Dict[str, Any]] = None
     security_result: Optional[Dict[str, Any]] = None
     tester_result: Optional[Dict[str, Any]] = None
@@ -60,6 +139,8 @@ class WorkflowResult:
     errors: List[str] = field(default_factory=list)
     pr_url: Optional[str] = None
     issue_number: Optional[int] = None
+    cache_hits: int = 0
+    cache_misses: int = 0
 
     def add_cost(self, cost: float) -> None:
         """Add to total cost"""
@@ -69,6 +150,12 @@ class WorkflowResult:
         """Add to total duration"""
         self.total_duration_ms += duration_ms
 
+    def record_agent(self, agent_result: Dict[str, Any]) -> None:
+        """Track an agent run and add its cost and duration to the totals"""
+        self.total_cost += agent_result.get('cost_usd', 0.0)
+        self.total_duration_ms += agent_result.get('duration_ms', 0)
+        self.agents.append(agent_result)
+
     def __repr__(self) -> str:
         status = "APPROVED" if self.approved else "IN PROGRESS"
         return f"WorkflowResult(status='{status}', cost=${self.total_cost:.4f}, revisions={self.revision_count})"
@@ -97,7 +184,6 @@ class Orchestrator:
             repository_url: Optional GitHub repository URL to clone (e.g., https://github.com/owner/repo.git)
         """
         self.verbose = verbose
-        self.github = github  # Store GitHub integration to prevent auto-merge
         self.repository_url = repository_url
 
         # Determine workspace and git root
@@ -127,8 +213,10 @@ class Orchestrator:
         # Logger will be initialized per workflow
         self.logger = None
 
-        # GitHub integration
-        self.github = GitHubIntegration(GITHUB_CONFIG) if GITHUB_CONFIG.get('enabled') else None
+        # GitHub integration: a caller-supplied one wins (it also prevents auto-merge)
+        self.github = github if github is not None else (
+            GitHubIntegration(GITHUB_CONFIG) if GITHUB_CONFIG.get('enabled') else None
+        )
 
         # UI protection integration
         self.ui_protector = UIProtectionOrchestrator(self.workspace)
@@ -137,6 +225,9 @@ class Orchestrator:
         cache_enabled = CACHE_CONFIG.get('enabled', True)
         self.cache = WorkflowCache() if cache_enabled else None
 
+        # Product Owner reviews by (tester tree, review task), for the current run
+        self._po_reviews: Dict[tuple, Dict[str, Any]] = {}
+
         # Initialize workspace (only creates git repo for external workspaces)
         self._initialize_workspace()
 
@@ -191,6 +282,7 @@ class Orchestrator:
 
         result = WorkflowResult()
         result.user_story = user_story
+        self._po_reviews.clear()
 
         # Clean up old workflow branches ONLY on first iteration (not on revisions)
         # This ensures each NEW task starts fresh from main
@@ -260,18 +352,18 @@ class Orchestrator:
 
                 # Merge to main if configured (deprecated in v2.2, use PR workflow instead)
                 # Only merge if we're NOT using GitHub integration (which requires PR workflow)
-                github_integration = hasattr(self, 'github') and self.github is not None
-
-                # DEBUG: Log the condition values
-                print(f"\n🔍 DEBUG - Auto-merge check:")
-                print(f"   auto_merge_on_approval: {WORKFLOW_CONFIG['auto_merge_on_approval']}")
-                print(f"   result.pr_url: {result.pr_url}")
-                print(f"   hasattr(self, 'github'): {hasattr(self, 'github')}")
-                print(f"   self.github is not None: {self.github is not None if hasattr(self, 'github') else 'N/A'}")
-                print(f"   github_integration: {github_integration}")
-                print(f"   Should auto-merge? {WORKFLOW_CONFIG['auto_merge_on_approval'] and not result.pr_url and not github_integration}")
-
-                if WORKFLOW_CONFIG['auto_merge_on_approval'] and not result.pr_url and not github_integration:
+                should_auto_merge = (
+                    WORKFLOW_CONFIG['auto_merge_on_approval']
+                    and not result.pr_url
+                    and self.github is None
+                )
+
+                if self.verbose:
+                    print(f"\n🔍 Auto-merge: {should_auto_merge} "
+                          f"(auto_merge_on_approval={WORKFLOW_CONFIG['auto_merge_on_approval']}, "
+                          f"pr_url={result.pr_url}, github={self.github is not None})")
+
+                if should_auto_merge:
                     print("\n🔀 Merging approved work to main branch...")
                     if self.git.merge_workflow_to_main():
                         print("✅ Successfully merged to main!")
@@ -313,7 +405,8 @@ class Orchestrator:
         task: str,
         agent_name: str,
         branch_name: str,
-        base_branch: str = None
+        base_branch: str = None,
+        git: Optional[GitManager] = None
     ) -> Dict[str, Any]:
         """
         Execute an agent with retry logic on transient failures
@@ -324,12 +417,14 @@ class Orchestrator:
             agent_name: Name of the agent for logging
             branch_name: Git branch for this agent
             base_branch: Base branch to reset from on retry (optional)
+            git: Checkout the agent works in (default: the main workspace)
 
         Returns:
             Agent execution result dict
         """
         import time
 
+        git = git or self.git
         max_retries = WORKFLOW_CONFIG.get('max_agent_retries', 2)
         backoff = WORKFLOW_CONFIG.get('retry_backoff_seconds', 5)
 
@@ -340,23 +435,23 @@ class Orchestrator:
                 time.sleep(wait_time)
 
                 # Reset branch to clean state for retry
-                if base_branch and self.git.branch_exists(branch_name):
+                if base_branch and git.branch_exists(branch_name):
                     print(f"🔄 Resetting '{branch_name}' to clean state...")
-                    # Checkout base branch before deleting target branch
-                    self.git.checkout_branch(base_branch)
-                    self.git.delete_branch(branch_name, force=True)
-                    self.git.create_branch(branch_name, from_branch=base_branch)
+                    git.reset_branch(branch_name, base_branch)
 
             # Ensure we're on the correct branch before executing agent
-            current_branch = self.git.get_current_branch()
+            current_branch = git.get_current_branch()
             if current_branch != branch_name:
                 print(f"🔄 Switching to branch '{branch_name}' for {agent_name}")
-                self.git.checkout_branch(branch_name)
+                git.checkout_branch(branch_name)
 
             # Execute agent
             self.logger.log_agent_start(agent_name, task)
             try:
-                agent_result = agent.execute_task(task)
+                agent_result = agent.execute_task(
+                    task,
+                    log_sink=lambda line: self.logger.logger.debug("[%s] %s", agent_name, line)
+                )
             except InsufficientCreditsError:
                 # Re-raise credit errors immediately - don't retry, let worker handle it
                 raise
@@ -413,11 +508,9 @@ class Orchestrator:
             else:
                 # Fallback: create from main if somehow missing
                 print(f"⚠️  Architect branch missing, creating from main")
-                self.git.checkout_branch(MAIN_BRANCH)
                 self.git.create_branch(ARCHITECT_BRANCH, from_branch=MAIN_BRANCH)
         else:
             # First iteration: create fresh from main
-            self.git.checkout_branch(MAIN_BRANCH)
             self.git.create_branch(ARCHITECT_BRANCH, from_branch=MAIN_BRANCH)
 
         architect = ClaudeCodeAgent("Architect", self.agent_workspace, ARCHITECT_PROMPT, verbose=self.verbose)
@@ -425,10 +518,7 @@ class Orchestrator:
         arch_task = user_story
         if is_revision and result.po_decision:
             # Get list of files for context
-            files = self.git.list_files()
-            files_context = f"\n\nExisting files in your implementation:\n" + "\n".join(f"- {f}" for f in files[:20])
-            if len(files) > 20:
-                files_context += f"\n... and {len(files) - 20} more files"
+            files_context = _format_files_context(self.git.list_files())
 
             arch_task = f"""REVISION REQUEST - IMPROVE YOUR EXISTING CODE
 
@@ -459,9 +549,7 @@ Please address the feedback and improve your implementation."""
             return False
 
         result.architect_result = arch_result
-        result.add_cost(arch_result.get('cost_usd', 0.0))
-        result.add_duration(arch_result.get('duration_ms', 0))
-        result.agents.append(arch_result)  # Track for PR body
+        result.record_agent(arch_result)  # Track for PR body
 
         # VALIDATION GATE: Ensure Architect completed work
         if not self.git.branch_has_commits(ARCHITECT_BRANCH, MAIN_BRANCH):
@@ -470,6 +558,9 @@ Please address the feedback and improve your implementation."""
             result.errors.append(error_msg)
             return False
 
+        if WORKFLOW_CONFIG.get('parallel_review'):
+            return self._run_review_phases_parallel(user_story, result)
+
         # Phase 2: Security Review
         print("\n🔒 PHASE 2: SECURITY")
         print("="*60)
@@ -477,9 +568,121 @@ Please address the feedback and improve your implementation."""
         # Create security branch from architect (inherits Architect's work)
         self.git.create_branch(SECURITY_BRANCH, from_branch=ARCHITECT_BRANCH)
 
-        security = ClaudeCodeAgent("Security", self.agent_workspace, SECURITY_PROMPT, verbose=self.verbose)
+        sec_result = self._execute_agent_with_retry(
+            agent=ClaudeCodeAgent("Security", self.agent_workspace, SECURITY_PROMPT, verbose=self.verbose),
+            task=self._security_task(user_story),
+            agent_name="Security",
+            branch_name=SECURITY_BRANCH,
+            base_branch=ARCHITECT_BRANCH
+        )
+        if not self._record_security_result(sec_result, result):
+            return False
+
+        # Phase 3: Testing
+        print("\n🧪 PHASE 3: TESTER")
+        print("="*60)
+
+        # Create tester branch from security (inherits Architect + Security's work)
+        self.git.create_branch(TESTER_BRANCH, from_branch=SECURITY_BRANCH)
+
+        test_result = self._execute_agent_with_retry(
+            agent=ClaudeCodeAgent("Tester", self.agent_workspace, TESTER_PROMPT, verbose=self.verbose),
+            task=self._tester_task(user_story),
+            agent_name="Tester",
+            branch_name=TESTER_BRANCH,
+            base_branch=SECURITY_BRANCH
+        )
+        return self._record_tester_result(test_result, result)
+
+    def _run_review_phases_parallel(self, user_story: str, result: WorkflowResult) -> bool:
+        """
+        Run Security and Tester at the same time, each in its own worktree
+
+        Both start from the Architect's commit. Agent calls are minutes of
+        waiting on the API, so overlapping them roughly halves this part of
+        the workflow. Afterwards Tester's commits are rebased onto Security's,
+        leaving the usual architect -> security -> tester branch chain. If
+        they conflict, Tester is re-run on top of Security as in the
+        sequential workflow. The worktrees hold tracked files only, so
+        untracked dependencies (node_modules, a venv, ...) are not there.
+
+        Args:
+            user_story: The user story being implemented
+            result: WorkflowResult to update
+
+        Returns:
+            True if both agents succeeded
+        """
+        print("\n🔒🧪 PHASES 2+3: SECURITY + TESTER (parallel)")
+        print("="*60)
+
+        with tempfile.TemporaryDirectory(prefix="ai-scrum-review-") as tmpdir:
+            # Only worktrees that were actually added get removed again, so a
+            # failed add never leaves a stale registration behind
+            worktrees = []
+            try:
+                sec_git = self.git.add_worktree(Path(tmpdir) / "security", SECURITY_BRANCH, ARCHITECT_BRANCH)
+                worktrees.append(sec_git)
+                test_git = self.git.add_worktree(Path(tmpdir) / "tester", TESTER_BRANCH, ARCHITECT_BRANCH)
+                worktrees.append(test_git)
+
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    sec_future = pool.submit(
+                        self._execute_agent_with_retry,
+                        agent=ClaudeCodeAgent("Security", sec_git.workspace, SECURITY_PROMPT, verbose=self.verbose),
+                        task=self._security_task(user_story),
+                        agent_name="Security",
+                        branch_name=SECURITY_BRANCH,
+                        base_branch=ARCHITECT_BRANCH,
+                        git=sec_git
+                    )
+                    test_future = pool.submit(
+                        self._execute_agent_with_retry,
+                        agent=ClaudeCodeAgent("Tester", test_git.workspace, TESTER_PROMPT, verbose=self.verbose),
+                        task=self._tester_task(user_story),
+                        agent_name="Tester",
+                        branch_name=TESTER_BRANCH,
+                        base_branch=ARCHITECT_BRANCH,
+                        git=test_git
+                    )
+                    sec_result = sec_future.result()
+                    test_result = test_future.result()
+
+                if not self._record_security_result(sec_result, result):
+                    return False
+
+                # Put Tester's commits on top of Security's
+                rebased = test_result['success'] and test_git.rebase_onto(SECURITY_BRANCH, ARCHITECT_BRANCH)
+            finally:
+                for git in worktrees:
+                    git.close()
+                    self.git.remove_worktree(git.workspace)
+
+        if rebased or not test_result['success']:
+            return self._record_tester_result(test_result, result)
+
+        # Tester's commits conflict with Security's: keep the sequential
+        # guarantee that tests run against the hardened code
+        print("\n⚠️  Tester's changes conflict with Security's, re-running Tester on security-branch")
+        # The discarded run still cost money, but only the re-run is an agent
+        # row of its own (the PR body pairs rows with agents by position)
+        result.add_cost(test_result.get('cost_usd', 0.0))
+        result.add_duration(test_result.get('duration_ms', 0))
 
-        sec_task = f"""ORIGINAL USER STORY:
+        self.git.reset_branch(TESTER_BRANCH, SECURITY_BRANCH)
+        test_result = self._execute_agent_with_retry(
+            agent=ClaudeCodeAgent("Tester", self.agent_workspace, TESTER_PROMPT, verbose=self.verbose),
+            task=self._tester_task(user_story),
+            agent_name="Tester",
+            branch_name=TESTER_BRANCH,
+            base_branch=SECURITY_BRANCH
+        )
+        return self._record_tester_result(test_result, result)
+
+    @staticmethod
+    def _security_task(user_story: str) -> str:
+        """Build the Security agent's task for a user story"""
+        return f"""ORIGINAL USER STORY:
 {user_story}
 
 ---
@@ -497,23 +700,38 @@ Identify and fix any security vulnerabilities:
 If this is an analysis-only task (see system prompt), create a security analysis document.
 Otherwise, edit files directly to add security improvements, then commit your changes."""
 
-        # Execute with retry logic
-        sec_result = self._execute_agent_with_retry(
-            agent=security,
-            task=sec_task,
-            agent_name="Security",
-            branch_name=SECURITY_BRANCH,
-            base_branch=ARCHITECT_BRANCH
-        )
+    @staticmethod
+    def _tester_task(user_story: str) -> str:
+        """Build the Tester agent's task for a user story"""
+        return f"""ORIGINAL USER STORY:
+{user_story}
 
+---
+
+Create comprehensive tests for the implementation.
+
+Write actual, runnable tests covering:
+- Happy path functionality
+- Edge cases
+- Error handling
+- Security validations
+
+If this is an analysis-only task (see system prompt), create a test plan document.
+Otherwise, create and RUN actual tests to verify they pass. Commit test files and results."""
+
+    def _record_security_result(self, sec_result: Dict[str, Any], result: WorkflowResult) -> bool:
+        """
+        Record the Security agent's result and apply its validation gate
+
+        Returns:
+            True if the workflow can proceed
+        """
         if not sec_result['success']:
             result.errors.append(f"Security failed: {sec_result.get('error')}")
             return False
 
         result.security_result = sec_result
-        result.add_cost(sec_result.get('cost_usd', 0.0))
-        result.add_duration(sec_result.get('duration_ms', 0))
-        result.agents.append(sec_result)  # Track for PR body
+        result.record_agent(sec_result)  # Track for PR body
 
         # VALIDATION GATE: Ensure Security completed work
         # Allow proceeding if Security explicitly approved without finding issues
@@ -527,48 +745,22 @@ Otherwise, edit files directly to add security improvements, then commit your ch
                 result.errors.append(error_msg)
                 return False
 
-        # Phase 3: Testing
-        print("\n🧪 PHASE 3: TESTER")
-        print("="*60)
-
-        # Create tester branch from security (inherits Architect + Security's work)
-        self.git.create_branch(TESTER_BRANCH, from_branch=SECURITY_BRANCH)
-
-        tester = ClaudeCodeAgent("Tester", self.agent_workspace, TESTER_PROMPT, verbose=self.verbose)
-
-        test_task = f"""ORIGINAL USER STORY:
-{user_story}
-
----
-
-Create comprehensive tests for the implementation.
-
-Write actual, runnable tests covering:
-- Happy path functionality
-- Edge cases
-- Error handling
-- Security validations
-
-If this is an analysis-only task (see system prompt), create a test plan document.
-Otherwise, create and RUN actual tests to verify they pass. Commit test files and results."""
+        return True
 
-        # Execute with retry logic
-        test_result = self._execute_agent_with_retry(
-            agent=tester,
-            task=test_task,
-            agent_name="Tester",
-            branch_name=TESTER_BRANCH,
-            base_branch=SECURITY_BRANCH
-        )
+    @staticmethod
+    def _record_tester_result(test_result: Dict[str, Any], result: WorkflowResult) -> bool:
+        """
+        Record the Tester agent's result
 
+        Returns:
+            True if the Tester succeeded
+        """
         if not test_result['success']:
             result.errors.append(f"Tester failed: {test_result.get('error')}")
             return False
 
         result.tester_result = test_result
-        result.add_cost(test_result.get('cost_usd', 0.0))
-        result.add_duration(test_result.get('duration_ms', 0))
-        result.agents.append(test_result)  # Track for PR body
+        result.record_agent(test_result)  # Track for PR body
 
         return True
 
@@ -587,53 +779,30 @@ Otherwise, create and RUN actual tests to verify they pass. Commit test files an
         if not agent_result.get('success'):
             return False
 
-        response = agent_result.get('result', '').lower()
-
-        # Keywords that indicate explicit approval without changes needed
-        approval_indicators = [
-            'approve',
-            'approved',
-            'no changes needed',
-            'no changes required',
-            'no security issues',
-            'no vulnerabilities',
-            'no issues found',
-            'already secure',
-            'excellent security',
-            'passes security review',
-            'security review passed',
-            'no security improvements needed',
-            'implementation is secure',
-        ]
-
         # Check if response contains approval indicators
-        return any(indicator in response for indicator in approval_indicators)
+        return _APPROVAL_RE.search(agent_result.get('result', '')) is not None
 
-    def _check_workspace_cleanliness(self) -> tuple[bool, list[str]]:
+    def _check_workspace_cleanliness(self, files: Optional[List[str]] = None) -> tuple[bool, list[str]]:
         """
         Check for common test artifacts and temporary files
 
+        Args:
+            files: Tracked files, if the caller already listed them
+
         Returns:
             (is_clean, list_of_issues)
         """
         issues = []
-        files = self.git.list_files()
+        if files is None:
+            files = self.git.list_files()
 
-        # Common test/temp file patterns
-        suspicious_patterns = [
-            ('test.html', 'Test HTML file'),
-            ('temp.', 'Temporary file'),
-            ('debug.', 'Debug file'),
-            ('old_', 'Old version file'),
-            ('.tmp', 'Temporary file'),
-            ('scratch', 'Scratch file'),
-            ('hello', 'Test/demo file (like hello.html, hello.txt)'),
-        ]
-
-        for file in files:
+        # One regex pass over the whole list finds the suspicious files;
+        # only those are checked pattern by pattern for the report
+        for match in _SUSPICIOUS_RE.finditer("\n".join(files)):
+            file = match.group()
             file_lower = file.lower()
-            for pattern, description in suspicious_patterns:
-                if pattern in file_lower and not file.startswith('.'):  # Ignore dotfiles
+            for pattern, description in _SUSPICIOUS_PATTERNS:
+                if pattern in file_lower:
                     issues.append(f"  - {file} (suspicious: {description})")
 
         return (len(issues) == 0, issues)
@@ -655,8 +824,12 @@ Otherwise, create and RUN actual tests to verify they pass. Commit test files an
         # Stay on tester branch for review
         self.git.checkout_branch(TESTER_BRANCH)
 
+        # Get list of tracked files (excludes node_modules, .git, etc.) once
+        # for both the cleanliness check and the review task
+        files = self.git.list_files()
+
         # Check for suspicious files before PO review
-        is_clean, issues = self._check_workspace_cleanliness()
+        is_clean, issues = self._check_workspace_cleanliness(files)
         if not is_clean:
             print("\n⚠️  WARNING: Suspicious files detected in workspace:")
             for issue in issues:
@@ -665,9 +838,6 @@ Otherwise, create and RUN actual tests to verify they pass. Commit test files an
 
         po = ClaudeCodeAgent("ProductOwner", self.agent_workspace, PRODUCT_OWNER_PROMPT, verbose=self.verbose)
 
-        # Get list of tracked files (excludes node_modules, .git, etc.)
-        files = self.git.list_files()
-
         # Safety check: If no files exist, reject immediately
         if not files:
             print("❌ No files to review - workflow failed to create any code")
@@ -693,37 +863,48 @@ Your response MUST start with: DECISION: [APPROVE|REVISE|REJECT]
 
 Provide detailed reasoning and specific feedback if requesting revisions."""
 
-        # Execute with retry logic (no base branch for PO - doesn't modify code)
-        po_result = self._execute_agent_with_retry(
-            agent=po,
-            task=review_task,
-            agent_name="ProductOwner",
-            branch_name=TESTER_BRANCH,
-            base_branch=None  # PO doesn't modify code, no need to reset
-        )
+        # The review depends only on the files under review and the task: an
+        # unchanged tester-branch tree gets the same review. Verdicts are LLM
+        # output, so they are only reused within this workflow run
+        review_key = None
+        if CACHE_CONFIG.get('enabled', True):
+            tree = self.git.tree_sha(TESTER_BRANCH)
+            if tree:
+                review_key = (tree, review_task)
+
+        cached = self._po_reviews.get(review_key) if review_key else None
+        if cached is not None:
+            print("♻️  Tester branch unchanged since an earlier review - reusing the Product Owner's decision")
+            self.logger.logger.info("♻️  Reused Product Owner review of an unchanged tree")
+            # Nothing was spent on this review
+            po_result = {**cached, "cost_usd": 0.0, "duration_ms": 0, "cached": True}
+            result.cache_hits += 1
+        else:
+            # Execute with retry logic (no base branch for PO - doesn't modify code)
+            po_result = self._execute_agent_with_retry(
+                agent=po,
+                task=review_task,
+                agent_name="ProductOwner",
+                branch_name=TESTER_BRANCH,
+                base_branch=None  # PO doesn't modify code, no need to reset
+            )
+            if review_key:
+                result.cache_misses += 1
+                # A rejection ends the run; never replay one, nor a failed review
+                if po_result['success'] and _po_decision(po_result['result']) != "REJECT":
+                    self._po_reviews[review_key] = po_result
 
         result.po_result = po_result
-        result.add_cost(po_result.get('cost_usd', 0.0))
-        result.add_duration(po_result.get('duration_ms', 0))
-        result.agents.append(po_result)  # Track for PR body
+        result.record_agent(po_result)  # Track for PR body
 
         # Parse decision from response
         if po_result['success']:
-            response = po_result['result'].upper()
-
-            if "DECISION: APPROVE" in response or "DECISION:APPROVE" in response:
-                result.po_decision = po_result['result']
-                return "APPROVE"
-            elif "DECISION: REVISE" in response or "DECISION:REVISE" in response:
-                result.po_decision = po_result['result']
-                return "REVISE"
-            elif "DECISION: REJECT" in response or "DECISION:REJECT" in response:
-                result.po_decision = po_result['result']
-                return "REJECT"
-            else:
-                print("⚠️  Could not parse PO decision, defaulting to REVISE")
-                result.po_decision = po_result['result']
-                return "REVISE"
+            result.po_decision = po_result['result']
+            decision = _po_decision(po_result['result'])
+            if decision:
+                return decision
+            print("⚠️  Could not parse PO decision, defaulting to REVISE")
+            return "REVISE"
         else:
             print("❌ Product Owner review failed")
             result.errors.append("PO review failed")
@@ -744,10 +925,8 @@ Provide detailed reasoning and specific feedback if requesting revisions."""
         # Ensure we're on main before deleting branches
         self.git.checkout_branch(MAIN_BRANCH)
 
-        # Delete branches in reverse order (tester -> security -> architect)
-        for branch in [TESTER_BRANCH, SECURITY_BRANCH, ARCHITECT_BRANCH]:
-            if self.git.branch_exists(branch):
-                self.git.delete_branch(branch, force=True)
+        # Delete whichever workflow branches exist, in one git call
+        self.git.delete_branches([TESTER_BRANCH, SECURITY_BRANCH, ARCHITECT_BRANCH], force=True)
 
         print("✅ Cleanup complete\n")
 
@@ -763,13 +942,15 @@ Provide detailed reasoning and specific feedback if requesting revisions."""
         """
         print("\n🧹 Cleaning downstream branches for revision...")
 
-        # Ensure we're on main before deleting branches
-        self.git.checkout_branch(MAIN_BRANCH)
+        # Step off the doomed branches onto architect-branch, where the
+        # revision resumes, rather than bouncing the working tree via main
+        if self.git.branch_exists(ARCHITECT_BRANCH):
+            self.git.checkout_branch(ARCHITECT_BRANCH)
+        else:
+            self.git.checkout_branch(MAIN_BRANCH)
 
         # Only delete security and tester - keep architect!
-        for branch in [TESTER_BRANCH, SECURITY_BRANCH]:
-            if self.git.branch_exists(branch):
-                self.git.delete_branch(branch, force=True)
+        self.git.delete_branches([TESTER_BRANCH, SECURITY_BRANCH], force=True)
 
         print("✅ Downstream branches cleared (architect-branch preserved)\n")
 
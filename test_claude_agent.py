@@ -7,6 +7,8 @@ Covers happy paths, edge cases, error handling, and security validations.
 import pytest
 import tempfile
 import json
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from claude_agent import ClaudeCodeAgent
@@ -525,6 +527,48 @@ class TestProgressMonitoring:
             assert result["success"] is True
 
 
+class TestStreamingOutput:
+    """Test line-by-line streaming of agent output"""
+
+    def test_stream_process_feeds_sink_line_by_line(self):
+        """Each stdout line reaches the sink, sanitized, as it is produced"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agent = ClaudeCodeAgent("TestAgent", Path(tmpdir), "Test prompt")
+            script = "import sys; print('one'); print('api_key=abc123'); sys.stderr.write('warn')"
+
+            seen = []
+            lines = []
+            result = agent._stream_process([sys.executable, "-c", script], 30, lines, seen.append)
+
+            assert result.returncode == 0
+            assert seen[0] == "one"
+            assert "abc123" not in seen[1]
+            assert result.stdout == "one\napi_key=abc123\n"
+            assert result.stderr == "warn"
+
+    def test_stream_process_timeout(self):
+        """A process outliving the timeout is killed"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agent = ClaudeCodeAgent("TestAgent", Path(tmpdir), "Test prompt")
+
+            with pytest.raises(subprocess.TimeoutExpired):
+                agent._stream_process([sys.executable, "-c", "import time; time.sleep(30)"], 1, [])
+
+    @patch('claude_agent.subprocess.run')
+    def test_execute_task_with_sink_streams(self, mock_run):
+        """Passing a log_sink streams output instead of capturing it"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agent = ClaudeCodeAgent("TestAgent", Path(tmpdir), "Test prompt")
+            completed = subprocess.CompletedProcess([], 0, stdout=json.dumps({"result": "Success"}), stderr="")
+
+            with patch.object(agent, "_stream_process", return_value=completed) as stream:
+                result = agent.execute_task("Test task", log_sink=lambda line: None)
+
+            assert result["success"] is True
+            stream.assert_called_once()
+            mock_run.assert_not_called()
+
+
 class TestCustomTimeout:
     """Test custom timeout functionality"""
 
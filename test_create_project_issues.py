@@ -0,0 +1,58 @@
+"""
+Test suite for create_project_issues.py
+
+Tests the Claude task breakdown loop with a mocked Anthropic client.
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from create_project_issues import call_claude_for_task_breakdown, TaskBreakdownError
+
+
+def _tool_use(block_id, title):
+    return SimpleNamespace(type="tool_use", id=block_id, name="create_issue", input={"title": title})
+
+
+def _response(stop_reason, *content):
+    return SimpleNamespace(stop_reason=stop_reason, content=list(content))
+
+
+def _breakdown(*responses):
+    client = Mock()
+    client.messages.create.side_effect = list(responses)
+    with patch("create_project_issues._get_client", return_value=client):
+        return call_claude_for_task_breakdown("Build a calculator"), client
+
+
+class TestTaskBreakdown:
+    """Test collecting tasks from create_issue tool calls"""
+
+    def test_collects_tasks_across_turns(self):
+        """Tool calls are answered and the loop runs until Claude stops calling tools"""
+        tasks, client = _breakdown(
+            _response("tool_use", _tool_use("a", "Setup")),
+            _response("tool_use", _tool_use("b", "Parser"), _tool_use("c", "UI")),
+            _response("end_turn", SimpleNamespace(type="text", text="Done")),
+        )
+
+        assert [task["title"] for task in tasks] == ["Setup", "Parser", "UI"]
+        assert client.messages.create.call_count == 3
+
+        # The last request answers both calls of the second turn
+        messages = client.messages.create.call_args[1]["messages"]
+        assert [r["tool_use_id"] for r in messages[-1]["content"]] == ["b", "c"]
+        assert all(r["type"] == "tool_result" for r in messages[-1]["content"])
+
+    def test_max_tokens_raises(self):
+        """A cut-off answer is reported instead of silently dropping tasks"""
+        with pytest.raises(TaskBreakdownError, match="token limit"):
+            _breakdown(_response("max_tokens", _tool_use("a", "Setup")))
+
+    def test_no_tasks_raises(self):
+        """An answer without any task is an error"""
+        with pytest.raises(TaskBreakdownError, match="no tasks"):
+            _breakdown(_response("end_turn", SimpleNamespace(type="text", text="Nothing to do")))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
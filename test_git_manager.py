@@ -7,7 +7,9 @@ Covers happy paths, edge cases, error handling, and security validations.
 import pytest
 import tempfile
 import shutil
+import subprocess
 from pathlib import Path
+from unittest.mock import patch
 from git_manager import GitManager
 
 
@@ -198,6 +200,23 @@ class TestGitRepositoryOperations:
 
             assert current_branch == "main"
 
+    def test_get_current_branch_tracks_switches(self):
+        """Test that the current branch follows checkouts, including external ones"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+
+            git_manager.create_branch("feature", from_branch="main")
+            assert git_manager.get_current_branch() == "feature"
+
+            git_manager.checkout_branch("main")
+            assert git_manager.get_current_branch() == "main"
+
+            # Switch behind GitManager's back
+            git_manager._run_git("checkout", "feature")
+            assert git_manager.get_current_branch() == "feature"
+
     def test_branch_exists(self):
         """Test checking if branch exists"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -211,6 +230,53 @@ class TestGitRepositoryOperations:
             # Non-existent branch should not exist
             assert git_manager.branch_exists("nonexistent-branch") is False
 
+    def test_branch_exists_sees_external_branches(self):
+        """Test that branches created outside GitManager are visible"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+
+            # Create a branch behind GitManager's back
+            assert git_manager.branch_exists("external") is False
+            git_manager._run_git("branch", "external")
+
+            assert git_manager.branch_exists("external") is True
+
+            git_manager.close()
+            assert git_manager._catfile is None
+
+    def test_batch_cat_file_answers_in_order(self):
+        """Test that several lookups share one round trip and keep their order"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+
+            lines = git_manager._batch_cat_file(["refs/heads/main", "refs/heads/nope", "main^{tree}"])
+
+            assert lines[0].endswith(" commit")
+            assert lines[1] == "refs/heads/nope missing"
+            assert lines[2].endswith(" tree")
+            assert git_manager._ref_shas(["main", "nope"]) == [lines[0].split()[0], None]
+
+            git_manager.close()
+
+    def test_branch_exists_reads_packed_refs(self):
+        """Test that packed branches are found and deletions are noticed"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+            git_manager._run_git("branch", "packed")
+            git_manager._run_git("pack-refs", "--all")
+
+            assert not (workspace / ".git" / "refs" / "heads" / "packed").exists()
+            assert git_manager.branch_exists("packed") is True
+
+            git_manager._run_git("branch", "-D", "packed")
+            assert git_manager.branch_exists("packed") is False
+
 
 class TestBranchOperations:
     """Test branch creation and management"""
@@ -279,6 +345,17 @@ class TestBranchOperations:
             git_manager.checkout_branch("test-branch")
             assert git_manager.get_current_branch() == "test-branch"
 
+    def test_checkout_current_branch_is_noop(self):
+        """Checking out the branch we are already on runs no git command"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+
+            with patch.object(git_manager, "_run_git_silent") as run:
+                git_manager.checkout_branch("main")
+            run.assert_not_called()
+
     def test_delete_branch(self):
         """Test deleting a branch"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -300,6 +377,41 @@ class TestBranchOperations:
             # Branch should not exist
             assert git_manager.branch_exists("test-branch") is False
 
+    def test_delete_branches(self):
+        """Test deleting several branches at once, skipping missing ones"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+            git_manager.create_branch("one", from_branch="main")
+            git_manager.create_branch("two", from_branch="main")
+            git_manager.checkout_branch("main")
+
+            deleted = git_manager.delete_branches(["two", "missing", "one"], force=True)
+
+            assert deleted == ["two", "one"]
+            assert git_manager.branch_exists("one") is False
+            assert git_manager.branch_exists("two") is False
+            assert git_manager.delete_branches(["one"]) == []
+
+    def test_delete_branches_partial_failure(self):
+        """An unmerged branch does not hide the deletion of a merged one"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+            git_manager.create_branch("merged", from_branch="main")
+            git_manager.create_branch("unmerged", from_branch="main")
+            (workspace / "new.txt").write_text("unmerged work")
+            git_manager.commit_changes("Unmerged work")
+            git_manager.checkout_branch("main")
+
+            deleted = git_manager.delete_branches(["merged", "unmerged"])
+
+            assert deleted == ["merged"]
+            assert git_manager.branch_exists("merged") is False
+            assert git_manager.branch_exists("unmerged") is True
+
     def test_delete_nonexistent_branch(self):
         """Test deleting a branch that doesn't exist"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -334,6 +446,31 @@ class TestCommitOperations:
             log = git_manager.get_branch_log("main", 5)
             assert len(log) >= 2  # Initial commit + test commit
 
+    def test_commit_changes_stages_everything(self):
+        """Test that new, modified and deleted files all end up in the commit"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+
+            (workspace / "keep.txt").write_text("v1")
+            (workspace / "gone.txt").write_text("bye")
+            git_manager.commit_changes("Add files")
+
+            (workspace / "keep.txt").write_text("v2")
+            (workspace / "gone.txt").unlink()
+            (workspace / "new.txt").write_text("hello")
+            assert git_manager.commit_changes("Update files") is True
+
+            status = subprocess.run(
+                ["git", "status", "--porcelain"],
+                cwd=workspace, capture_output=True, text=True, check=True
+            )
+            assert status.stdout == ""
+            files = git_manager.list_files()
+            assert "new.txt" in files
+            assert "gone.txt" not in files
+
     def test_commit_no_changes(self):
         """Test committing when there are no changes"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -399,6 +536,25 @@ class TestBranchInformation:
             assert "file1.txt" in files
             assert "file2.txt" in files
 
+    def test_list_files_follows_changes(self):
+        """Test that cached listings pick up new commits on both paths"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+
+            before_index = git_manager.list_files()
+            before_branch = git_manager.list_files("main")
+            assert git_manager.list_files("main") == before_branch
+
+            (workspace / "added.txt").write_text("New")
+            git_manager.commit_changes("Add file")
+
+            assert "added.txt" not in before_index
+            assert "added.txt" in git_manager.list_files()
+            assert "added.txt" in git_manager.list_files("main")
+            assert git_manager.list_files("missing-branch") == []
+
     def test_list_files_empty_repo(self):
         """Test listing files in repository with no tracked files"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -410,6 +566,25 @@ class TestBranchInformation:
             files = git_manager.list_files()
             assert isinstance(files, list)
 
+    def test_tree_sha_tracks_contents(self):
+        """Test that tree_sha changes with file contents, not with commits"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+
+            main_tree = git_manager.tree_sha("main")
+            assert main_tree is not None
+
+            git_manager.create_branch("same", from_branch="main")
+            git_manager.commit_changes("Empty commit", allow_empty=True)
+            assert git_manager.tree_sha("same") == main_tree
+
+            (workspace / "new.txt").write_text("new")
+            git_manager.commit_changes("Add file")
+            assert git_manager.tree_sha("same") != main_tree
+            assert git_manager.tree_sha("missing-branch") is None
+
     def test_get_branch_log(self):
         """Test getting branch commit log"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -428,6 +603,23 @@ class TestBranchInformation:
             # Should have at least 3 commits (plus initial)
             assert len(log) >= 3
 
+    def test_get_branch_log_follows_new_commits(self):
+        """Test that the memoized log refreshes when the branch tip moves"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+
+            first = git_manager.get_branch_log("main", 5)
+            assert git_manager.get_branch_log("main", 5) == first
+
+            (workspace / "new.txt").write_text("New")
+            git_manager.commit_changes("Add new file")
+
+            log = git_manager.get_branch_log("main", 5)
+            assert len(log) == len(first) + 1
+            assert "Add new file" in log[0]
+
     def test_branch_has_commits(self):
         """Test checking if branch has commits beyond base"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -448,6 +640,21 @@ class TestBranchInformation:
             # Should have commits now
             assert git_manager.branch_has_commits("feature-branch", "main") is True
 
+    def test_branch_has_commits_behind_base(self):
+        """Test that a branch the base has moved past has nothing new"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+            git_manager.create_branch("stale-branch")
+
+            git_manager.checkout_branch("main")
+            (workspace / "main.txt").write_text("Main moved on")
+            git_manager.commit_changes("Main commit")
+
+            assert git_manager.branch_has_commits("stale-branch", "main") is False
+            assert git_manager.branch_has_commits("main", "missing-base") is False
+
 
 class TestMergeOperations:
     """Test merge operations"""
@@ -497,6 +704,48 @@ class TestMergeOperations:
             assert result is True
 
 
+    def _make_conflict(self, workspace, git_manager):
+        """Create branches 'left' and 'right' that edit the same line"""
+        (workspace / "shared.txt").write_text("base")
+        git_manager.commit_changes("Add shared file")
+        git_manager.create_branch("left")
+        (workspace / "shared.txt").write_text("left")
+        git_manager.commit_changes("Left edit")
+        git_manager.checkout_branch("main")
+        git_manager.create_branch("right")
+        (workspace / "shared.txt").write_text("right")
+        git_manager.commit_changes("Right edit")
+
+    def test_merge_branch_conflict_leaves_worktree_alone(self):
+        """Test that a conflict is detected without starting a merge"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+            self._make_conflict(workspace, git_manager)
+            left_before = git_manager.get_branch_log("left", 1)
+
+            assert git_manager.merge_branch("right", "left") is False
+
+            # Never switched branches or entered MERGING state
+            assert git_manager.get_current_branch() == "right"
+            assert (workspace / "shared.txt").read_text() == "right"
+            assert not (workspace / ".git" / "MERGE_HEAD").exists()
+            assert git_manager.get_branch_log("left", 1) == left_before
+
+    def test_merge_branch_conflict_without_merge_tree(self):
+        """Test the working-tree merge path aborts and restores the branch"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+            self._make_conflict(workspace, git_manager)
+
+            assert git_manager.merge_branch("right", "left", use_merge_tree=False) is False
+
+            assert git_manager.get_current_branch() == "right"
+            assert not (workspace / ".git" / "MERGE_HEAD").exists()
+
 class TestWorkflowBranches:
     """Test workflow branch setup"""
 
@@ -515,6 +764,21 @@ class TestWorkflowBranches:
             assert git_manager.branch_exists("security-branch") is True
             assert git_manager.branch_exists("tester-branch") is True
 
+    def test_setup_workflow_branches_from_other_branch(self):
+        """Test setup from a non-main branch ends on main with branches at main"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+            git_manager.create_branch("feature", from_branch="main")
+
+            git_manager.setup_workflow_branches()
+
+            main_sha = git_manager._ref_sha("main")
+            assert git_manager.get_current_branch() == "main"
+            for branch in ["architect-branch", "security-branch", "tester-branch"]:
+                assert git_manager._ref_sha(branch) == main_sha
+
     def test_reset_workflow_branches(self):
         """Test resetting workflow branches"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -537,6 +801,157 @@ class TestWorkflowBranches:
             assert git_manager.branch_exists("architect-branch") is True
             assert git_manager.branch_has_commits("architect-branch", "main") is False
 
+    def test_merge_workflow_to_main_fast_forward(self):
+        """Test that a linear workflow fast-forwards every branch to tester"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+            git_manager.setup_workflow_branches()
+
+            git_manager.checkout_branch("tester-branch")
+            (workspace / "tests.txt").write_text("Tester work")
+            git_manager.commit_changes("Tester commit")
+
+            assert git_manager.merge_workflow_to_main() is True
+
+            tester_sha = git_manager._ref_sha("tester-branch")
+            for branch in ["main", "architect-branch", "security-branch"]:
+                assert git_manager._ref_sha(branch) == tester_sha
+            assert git_manager.get_current_branch() == "main"
+            assert (workspace / "tests.txt").exists()
+
+    def test_merge_workflow_to_main_diverged(self):
+        """Test that diverged branches fall back to real merges"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+            git_manager.setup_workflow_branches()
+
+            git_manager.checkout_branch("tester-branch")
+            (workspace / "tests.txt").write_text("Tester work")
+            git_manager.commit_changes("Tester commit")
+
+            # main moves on independently, so its merge can't fast-forward
+            git_manager.checkout_branch("main")
+            (workspace / "hotfix.txt").write_text("Hotfix")
+            git_manager.commit_changes("Hotfix on main")
+
+            assert git_manager.merge_workflow_to_main() is True
+
+            assert git_manager.get_current_branch() == "main"
+            assert (workspace / "tests.txt").exists()
+            assert (workspace / "hotfix.txt").exists()
+
+
+    def test_merge_workflow_to_main_conflict_moves_nothing(self):
+        """Test that a conflict anywhere in the chain leaves every branch as it was"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+            git_manager.setup_workflow_branches()
+
+            git_manager.checkout_branch("tester-branch")
+            (workspace / "shared.txt").write_text("tester")
+            git_manager.commit_changes("Tester edit")
+
+            git_manager.checkout_branch("main")
+            (workspace / "shared.txt").write_text("main")
+            git_manager.commit_changes("Main edit")
+
+            branches = ["main", "architect-branch", "security-branch", "tester-branch"]
+            before = {b: git_manager._ref_sha(b) for b in branches}
+
+            assert git_manager.merge_workflow_to_main() is False
+
+            assert {b: git_manager._ref_sha(b) for b in branches} == before
+            assert git_manager.get_current_branch() == "main"
+            assert (workspace / "shared.txt").read_text() == "main"
+            assert not (workspace / ".git" / "MERGE_HEAD").exists()
+
+class TestWorktrees:
+    """Test worktree-based parallel branch work"""
+
+    def test_parallel_worktrees_rebase_into_chain(self):
+        """Test that commits made in two worktrees end up chained on one branch"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+            git_manager.create_branch("architect-branch", from_branch="main")
+            (workspace / "app.py").write_text("print('app')\n")
+            git_manager.commit_changes("Architect commit")
+
+            sec = git_manager.add_worktree(Path(tmpdir) / "security", "security-branch", "architect-branch")
+            test = git_manager.add_worktree(Path(tmpdir) / "tester", "tester-branch", "architect-branch")
+
+            # Main checkout is untouched
+            assert git_manager.get_current_branch() == "architect-branch"
+            assert sec.get_current_branch() == "security-branch"
+
+            (sec.workspace / "app.py").write_text("print('secure app')\n")
+            sec.commit_changes("Security commit")
+            (test.workspace / "test_app.py").write_text("def test_app(): pass\n")
+            test.commit_changes("Tester commit")
+
+            assert test.rebase_onto("security-branch", "architect-branch") is True
+
+            for wt in (sec, test):
+                wt.close()
+                git_manager.remove_worktree(wt.workspace)
+
+            assert not (Path(tmpdir) / "tester").exists()
+            assert {"app.py", "test_app.py"} <= set(git_manager.list_files("tester-branch"))
+            log = git_manager.get_branch_log("tester-branch", 3)
+            assert "Tester commit" in log[0]
+            assert "Security commit" in log[1]
+
+    def test_rebase_onto_conflict_aborts(self):
+        """Test that a conflicting rebase is aborted and reported"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+            git_manager.create_branch("architect-branch", from_branch="main")
+
+            sec = git_manager.add_worktree(Path(tmpdir) / "security", "security-branch", "architect-branch")
+            test = git_manager.add_worktree(Path(tmpdir) / "tester", "tester-branch", "architect-branch")
+            (sec.workspace / "app.py").write_text("security\n")
+            sec.commit_changes("Security commit")
+            (test.workspace / "app.py").write_text("tester\n")
+            test.commit_changes("Tester commit")
+            tester_sha = test._ref_sha("tester-branch")
+
+            assert test.rebase_onto("security-branch", "architect-branch") is False
+            assert test._ref_sha("tester-branch") == tester_sha
+            assert test.get_current_branch() == "tester-branch"
+
+            for wt in (sec, test):
+                wt.close()
+                git_manager.remove_worktree(wt.workspace)
+
+    def test_reset_branch(self):
+        """Test resetting a checked-out and a non-checked-out branch"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir) / "git_workspace"
+            git_manager = GitManager(workspace)
+            git_manager.initialize_repository()
+            main_sha = git_manager._ref_sha("main")
+
+            git_manager.create_branch("work", from_branch="main")
+            (workspace / "work.txt").write_text("work")
+            git_manager.commit_changes("Work commit")
+            git_manager.create_branch("other")
+
+            git_manager.reset_branch("work", "main")
+            assert git_manager._ref_sha("work") == main_sha
+
+            git_manager.reset_branch("other", "main")
+            assert git_manager._ref_sha("other") == main_sha
+            assert not (workspace / "work.txt").exists()
+
 
 class TestEdgeCases:
     """Test edge cases and error handling"""
@@ -7,7 +7,7 @@ Covers happy paths, edge cases, error handling, and security validations.
 import pytest
 import json
 from unittest.mock import Mock, patch, MagicMock
-from github_integration import GitHubIntegration
+from github_integration import GitHubIntegration, _gh_logged_in_locally
 
 
 class TestGitHubIntegrationInitialization:
@@ -147,6 +147,12 @@ class TestSecurityValidations:
 class TestGitHubCliCheck:
     """Test GitHub CLI availability checking"""
 
+    @pytest.fixture(autouse=True)
+    def no_local_gh_login(self):
+        """Make the checks below go through `gh auth status`"""
+        with patch('github_integration._gh_logged_in_locally', return_value=False):
+            yield
+
     @patch('github_integration.subprocess.run')
     def test_check_gh_cli_installed_success(self, mock_run):
         """Test checking when gh CLI is installed and authenticated"""
@@ -202,6 +208,88 @@ class TestGitHubCliCheck:
         assert result is False
 
 
+    @patch('github_integration.subprocess.run')
+    def test_check_gh_cli_result_is_cached(self, mock_run):
+        """Test that gh auth status runs once until refresh()"""
+        config = {"enabled": True}
+        github = GitHubIntegration(config)
+
+        mock_run.return_value = Mock(returncode=0)
+
+        assert github.check_gh_cli_installed() is True
+        assert github.check_gh_cli_installed() is True
+        assert mock_run.call_count == 1
+
+        github.refresh()
+        assert github.check_gh_cli_installed() is True
+        assert mock_run.call_count == 2
+
+    @patch('github_integration.subprocess.run')
+    def test_check_gh_cli_timeout_not_cached(self, mock_run):
+        """Test that a timed-out check is retried on the next call"""
+        config = {"enabled": True}
+        github = GitHubIntegration(config)
+
+        import subprocess
+        mock_run.side_effect = [subprocess.TimeoutExpired("gh", 5), Mock(returncode=0)]
+
+        assert github.check_gh_cli_installed() is False
+        assert github.check_gh_cli_installed() is True
+
+    @patch('github_integration.time.monotonic')
+    @patch('github_integration.subprocess.run')
+    def test_check_gh_cli_rechecked_after_idle(self, mock_run, mock_monotonic):
+        """Test that a cached check is re-run only after a long idle period"""
+        config = {"enabled": True}
+        github = GitHubIntegration(config)
+
+        mock_run.return_value = Mock(returncode=0)
+        for now in (1000.0, 1200.0, 1400.0):
+            mock_monotonic.return_value = now
+            assert github.check_gh_cli_installed() is True
+        assert mock_run.call_count == 1
+
+        mock_monotonic.return_value = 1700.0
+        assert github.check_gh_cli_installed() is True
+        assert mock_run.call_count == 2
+
+    @patch('github_integration.time.monotonic')
+    @patch('github_integration.subprocess.run')
+    def test_session_rechecks_after_ttl(self, mock_run, mock_monotonic):
+        """Test that a session trusts the auth check until its TTL runs out"""
+        config = {"enabled": True}
+        github = GitHubIntegration(config)
+
+        mock_run.return_value = Mock(returncode=0)
+        mock_monotonic.return_value = 1000.0
+
+        assert github.begin_session(ttl_s=60) is True
+        mock_monotonic.return_value = 1059.0
+        assert github.check_gh_cli_installed() is True
+        assert mock_run.call_count == 1
+
+        mock_monotonic.return_value = 1061.0
+        assert github.check_gh_cli_installed() is True
+        assert mock_run.call_count == 2
+
+        github.end_session()
+        assert github.check_gh_cli_installed() is True
+        assert mock_run.call_count == 3
+
+    @patch('github_integration.subprocess.run')
+    def test_check_gh_cli_reads_hosts_file(self, mock_run, tmp_path, monkeypatch):
+        """Test that a gh login recorded in hosts.yml skips gh auth status"""
+        monkeypatch.setenv("GH_CONFIG_DIR", str(tmp_path))
+        monkeypatch.setattr("github_integration.shutil.which", lambda name: "/usr/bin/gh")
+        github = GitHubIntegration({"enabled": True})
+
+        assert _gh_logged_in_locally() is False
+
+        (tmp_path / "hosts.yml").write_text("github.com:\n    user: octocat\n    git_protocol: https\n")
+        with patch('github_integration._gh_logged_in_locally', side_effect=_gh_logged_in_locally):
+            assert github.check_gh_cli_installed() is True
+        mock_run.assert_not_called()
+
 class TestGetReadyIssues:
     """Test getting ready issues from GitHub"""
 
@@ -237,8 +325,27 @@ class TestGetReadyIssues:
         issues = github.get_ready_issues()
 
         assert len(issues) == 2
-        assert issues[0]["number"] == 1
-        assert issues[1]["number"] == 2
+        assert issues[0].number == 1
+        assert issues[1].number == 2
+        assert issues[0].labels == ("ready-for-dev",)
+
+    @patch('github_integration.GitHubIntegration.check_gh_cli_installed')
+    @patch('github_integration.subprocess.run')
+    def test_get_ready_issues_body_opt_in(self, mock_run, mock_check):
+        """Test that issue bodies are only fetched when asked for"""
+        config = {"enabled": True}
+        github = GitHubIntegration(config)
+
+        mock_check.return_value = True
+        mock_run.return_value = Mock(returncode=0, stdout=b"[]")
+
+        github.get_ready_issues()
+        call_args = mock_run.call_args[0][0]
+        assert call_args[call_args.index('--json') + 1] == "number,title,labels"
+
+        github.get_ready_issues(include_body=True)
+        call_args = mock_run.call_args[0][0]
+        assert call_args[call_args.index('--json') + 1] == "number,title,body,labels"
 
     @patch('github_integration.GitHubIntegration.check_gh_cli_installed')
     def test_get_ready_issues_gh_not_installed(self, mock_check):
@@ -308,6 +415,30 @@ class TestGetReadyIssues:
         call_args = mock_run.call_args[0][0]
         assert "custom-label" in call_args
 
+    @patch('github_integration.GitHubIntegration.check_gh_cli_installed')
+    @patch('github_integration.subprocess.run')
+    def test_list_ready_issues_skips_body(self, mock_run, mock_check):
+        """Test that list_ready_issues doesn't request issue bodies by default"""
+        config = {"enabled": True}
+        github = GitHubIntegration(config)
+
+        mock_check.return_value = True
+        mock_run.return_value = Mock(returncode=0, stdout=json.dumps([{"number": 1, "title": "Issue 1"}]).encode())
+
+        issues = github.list_ready_issues()
+
+        assert issues == [{"number": 1, "title": "Issue 1"}]
+        call_args = mock_run.call_args[0][0]
+        assert call_args[call_args.index('--json') + 1] == "number,title,labels"
+
+    def test_list_ready_issues_validates_fields(self):
+        """Security: Test that field names are validated"""
+        config = {"enabled": True}
+        github = GitHubIntegration(config)
+
+        with pytest.raises(ValueError, match="Security"):
+            github.list_ready_issues(fields=("number", "title;rm"))
+
     def test_get_ready_issues_validates_limit(self):
         """Security: Test that limit parameter is validated"""
         config = {"enabled": True}
@@ -343,6 +474,21 @@ class TestMarkIssueInProgress:
         # Should make multiple subprocess calls
         assert mock_run.call_count >= 2
 
+    @patch('github_integration.subprocess.run')
+    def test_mark_issue_in_progress_swaps_labels_in_one_call(self, mock_run):
+        """Test that both label changes go through a single gh issue edit"""
+        config = {"enabled": True}
+        github = GitHubIntegration(config)
+
+        mock_run.return_value = Mock(returncode=0)
+
+        github.mark_issue_in_progress(42)
+
+        edits = [c[0][0] for c in mock_run.call_args_list if c[0][0][1:3] == ['issue', 'edit']]
+        assert len(edits) == 1
+        assert '--remove-label' in edits[0]
+        assert '--add-label' in edits[0]
+
     @patch('github_integration.subprocess.run')
     def test_mark_issue_in_progress_timeout(self, mock_run):
         """Test handling of timeout"""
@@ -405,6 +551,66 @@ class TestCreatePullRequest:
 
         assert pr_url == "https://github.com/user/repo/pull/1"
 
+    @patch('github_integration.GitHubIntegration.check_gh_cli_installed')
+    @patch('github_integration.subprocess.run')
+    def test_create_pr_existing_url_from_error(self, mock_run, mock_check):
+        """Test that an existing PR's URL is taken from gh's error, with no second call"""
+        config = {"enabled": True}
+        github = GitHubIntegration(config)
+        mock_check.return_value = True
+
+        workflow_result = Mock()
+        workflow_result.user_story = "Add new feature"
+        workflow_result.total_cost = 0.15
+        workflow_result.total_duration_ms = 120000
+        workflow_result.revision_count = 0
+        workflow_result.agents = [{"cost_usd": 0.01, "duration_ms": 1000}] * 4
+
+        def fake_run(cmd, **kwargs):
+            if cmd[:3] == ['gh', 'pr', 'create']:
+                return Mock(returncode=1, stdout="", stderr=(
+                    'a pull request for branch "feature" into branch "staging" already exists:\n'
+                    'https://github.com/user/repo/pull/7\n'
+                ))
+            if cmd[:3] == ['git', 'branch', '--show-current']:
+                return Mock(returncode=0, stdout="feature\n")
+            return Mock(returncode=0, stdout="")
+
+        mock_run.side_effect = fake_run
+
+        assert github.create_pr(workflow_result) == "https://github.com/user/repo/pull/7"
+        assert not any(c[0][0][:3] == ['gh', 'pr', 'list'] for c in mock_run.call_args_list)
+
+    @patch('github_integration.GitHubIntegration.check_gh_cli_installed')
+    @patch('github_integration.subprocess.run')
+    def test_create_pr_existing_url_from_pr_list(self, mock_run, mock_check):
+        """Test falling back to gh pr list when the error has no URL"""
+        config = {"enabled": True}
+        github = GitHubIntegration(config)
+        mock_check.return_value = True
+
+        workflow_result = Mock()
+        workflow_result.user_story = "Add new feature"
+        workflow_result.total_cost = 0.15
+        workflow_result.total_duration_ms = 120000
+        workflow_result.revision_count = 0
+        workflow_result.agents = [{"cost_usd": 0.01, "duration_ms": 1000}] * 4
+
+        def fake_run(cmd, **kwargs):
+            if cmd[:3] == ['gh', 'pr', 'create']:
+                return Mock(returncode=1, stdout="", stderr="pull request already exists")
+            if cmd[:3] == ['gh', 'pr', 'list']:
+                return Mock(returncode=0, stdout="https://github.com/user/repo/pull/8\n")
+            if cmd[:3] == ['git', 'branch', '--show-current']:
+                return Mock(returncode=0, stdout="feature\n")
+            return Mock(returncode=0, stdout="")
+
+        mock_run.side_effect = fake_run
+
+        assert github.create_pr(workflow_result) == "https://github.com/user/repo/pull/8"
+        pr_list = next(c[0][0] for c in mock_run.call_args_list if c[0][0][:3] == ['gh', 'pr', 'list'])
+        assert '--jq' in pr_list
+
     @patch('github_integration.GitHubIntegration.check_gh_cli_installed')
     def test_create_pr_gh_not_installed(self, mock_check):
         """Test PR creation when gh CLI not installed"""
@@ -497,6 +703,34 @@ class TestCreatePullRequest:
             github.create_pr(workflow_result, issue_number=-1)
 
 
+    @patch('github_integration.subprocess.run')
+    def test_get_head_branch(self, mock_run):
+        """Test reading the current branch for the PR head"""
+        config = {"enabled": True}
+        github = GitHubIntegration(config)
+
+        mock_run.return_value = Mock(returncode=0, stdout="feature-branch\n")
+        assert github._get_head_branch() == "feature-branch"
+
+        import subprocess
+        mock_run.side_effect = subprocess.TimeoutExpired("git", 5)
+        assert github._get_head_branch() == "HEAD"
+
+    @patch('github_integration.subprocess.run')
+    def test_ensure_base_branch_lists_refs_once(self, mock_run):
+        """Test base branch resolution from a single branch listing"""
+        config = {"enabled": True, "pr_target_branch": "staging"}
+        github = GitHubIntegration(config)
+
+        mock_run.return_value = Mock(returncode=0, stdout="main\nstaging\n")
+        assert github._ensure_base_branch_exists() == "staging"
+
+        mock_run.return_value = Mock(returncode=0, stdout="main\nfeature\n")
+        assert github._ensure_base_branch_exists() == "main"
+
+        assert mock_run.call_count == 2
+        assert mock_run.call_args[0][0][:2] == ['git', 'for-each-ref']
+
 class TestGeneratePRBody:
     """Test PR body generation"""
 
@@ -576,6 +810,43 @@ class TestGeneratePRBody:
 
         assert "#42" in body
 
+    def test_generate_pr_body_sanitizes_story(self):
+        """Security: Test that the user story is sanitized in the body too"""
+        config = {"enabled": True}
+        github = GitHubIntegration(config)
+
+        workflow_result = Mock()
+        workflow_result.user_story = "Add\x00 feature\x07"
+        workflow_result.total_cost = 0.15
+        workflow_result.total_duration_ms = 120000
+        workflow_result.revision_count = 0
+        workflow_result.agents = []
+
+        with patch('github_integration.subprocess.run') as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="")
+            body = github._generate_pr_body(workflow_result, None)
+
+        assert "### What Changed\nAdd feature\n" in body
+
+    @patch('github_integration.subprocess.run')
+    def test_changed_files_cached_per_commit_pair(self, mock_run):
+        """Test that the tree diff only runs once per (HEAD, base) pair"""
+        config = {"enabled": True}
+        github = GitHubIntegration(config)
+
+        revs = Mock(returncode=0, stdout="aaa\nbbb\n")
+        diff = Mock(returncode=0, stdout="M\0file.py\0A\0new file.py\0")
+        mock_run.side_effect = [revs, diff, revs]
+
+        assert github._changed_files("staging") == "M\tfile.py\nA\tnew file.py"
+        assert github._changed_files("staging") == "M\tfile.py\nA\tnew file.py"
+        assert mock_run.call_count == 3
+
+        # A new commit on HEAD means a new diff
+        mock_run.side_effect = [Mock(returncode=0, stdout="ccc\nbbb\n"), diff]
+        github._changed_files("staging")
+        assert mock_run.call_args[0][0][:2] == ['git', 'diff']
+
 
 class TestGetIssueDetails:
     """Test getting issue details"""
@@ -596,7 +867,7 @@ class TestGetIssueDetails:
 
         mock_result = Mock()
         mock_result.returncode = 0
-        mock_result.stdout = json.dumps(issue_data)
+        mock_result.stdout = json.dumps(issue_data).encode()  # gh output is read as bytes
         mock_run.return_value = mock_result
 
         issue = github.get_issue_details(42)
@@ -628,5 +899,143 @@ class TestGetIssueDetails:
             github.get_issue_details(-1)
 
 
+
+class TestRestApiClient:
+    """Test the REST API path used when a token and repository are configured"""
+
+    def _github(self):
+        github = GitHubIntegration({"enabled": True, "repository": "owner/repo", "token": "t0ken"})
+        github._http = Mock()
+        return github
+
+    def test_session_only_with_token_and_repository(self):
+        """Test that the HTTP client is only set up when it can be used"""
+        assert GitHubIntegration({"enabled": True, "token": "t0ken"})._http is None
+        github = GitHubIntegration({"enabled": True, "repository": "owner/repo", "token": "t0ken"})
+        assert github._http is not None
+        assert github._http.headers["Authorization"] == "token t0ken"
+
+    def test_session_pools_and_retries_gateway_errors(self):
+        """Test that the HTTP client pools connections and retries 502/503/504"""
+        github = GitHubIntegration({"enabled": True, "repository": "owner/repo", "token": "t0ken"})
+        adapter = github._http.get_adapter("https://api.github.com/repos/owner/repo")
+        assert adapter._pool_maxsize == 8
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+        assert "POST" not in adapter.max_retries.allowed_methods
+
+    def test_invalid_repository_rejected(self):
+        """Security: Test that the repository name is validated"""
+        with pytest.raises(ValueError, match="Security"):
+            GitHubIntegration({"enabled": True, "repository": "owner/repo; rm -rf /"})
+
+    @patch('github_integration.subprocess.run')
+    def test_list_ready_issues_over_http(self, mock_run):
+        """Test listing issues without spawning gh, skipping pull requests"""
+        github = self._github()
+        github._http.request.return_value = Mock(status_code=200, json=lambda: [
+            {"number": 1, "title": "Issue", "body": "Body", "state": "open",
+             "labels": [{"name": "ready-for-dev", "color": "0e8a16", "description": None}]},
+            {"number": 2, "title": "A PR", "state": "open", "labels": [], "pull_request": {}},
+        ])
+
+        issues = github.list_ready_issues()
+
+        assert issues == [{"number": 1, "title": "Issue",
+                           "labels": [{"name": "ready-for-dev", "description": "", "color": "0e8a16"}]}]
+        method, url = github._http.request.call_args[0]
+        assert method == "GET"
+        assert url == "https://api.github.com/repos/owner/repo/issues"
+        mock_run.assert_not_called()
+
+    @patch('github_integration.subprocess.run')
+    def test_mark_issue_in_progress_over_http(self, mock_run):
+        """Test label swap and comment go through the session"""
+        github = self._github()
+        github._http.request.return_value = Mock(status_code=200)
+
+        assert github.mark_issue_in_progress(42) is True
+
+        calls = sorted(c[0] for c in github._http.request.call_args_list)
+        assert calls == [
+            ("DELETE", "https://api.github.com/repos/owner/repo/issues/42/labels/ready-for-dev"),
+            ("POST", "https://api.github.com/repos/owner/repo/issues/42/comments"),
+            ("POST", "https://api.github.com/repos/owner/repo/issues/42/labels"),
+        ]
+        mock_run.assert_not_called()
+
+    def test_get_issue_details_over_http(self):
+        """Test that issue details come back in the gh --json shape"""
+        github = self._github()
+        github._http.request.return_value = Mock(status_code=200, json=lambda: {
+            "number": 42, "title": "Feature", "body": None, "state": "open", "labels": []
+        })
+
+        issue = github.get_issue_details(42)
+
+        assert issue == {"number": 42, "title": "Feature", "body": "", "labels": [], "state": "OPEN"}
+
+    def test_get_issue_details_revalidates_with_etag(self):
+        """Test that a 304 reuses the previous payload"""
+        github = self._github()
+        item = {"number": 42, "title": "Feature", "body": "Body", "state": "open", "labels": []}
+        github._http.request.side_effect = [
+            Mock(status_code=200, json=lambda: item, headers={"ETag": '"abc"'}),
+            Mock(status_code=304, headers={}),
+        ]
+
+        first = github.get_issue_details(42)
+        second = github.get_issue_details(42)
+
+        assert first == second
+        assert second["title"] == "Feature"
+        assert github._http.request.call_args_list[0][1]["headers"] == {}
+        assert github._http.request.call_args_list[1][1]["headers"] == {"If-None-Match": '"abc"'}
+
+    def test_create_pr_links_issue_in_one_mutation(self):
+        """Test that labelling and linking a new PR takes a single GraphQL request"""
+        github = self._github()
+        pr = {"number": 7, "node_id": "PR_7", "html_url": "https://github.com/owner/repo/pull/7"}
+        ids = {"repository": {"issue": {"id": "I_42"}, "needsReview": {"id": "L_nr"}, "inProgress": {"id": "L_ip"}}}
+
+        def respond(method, url, **kwargs):
+            if url.endswith("/pulls"):
+                return Mock(status_code=201, json=lambda: pr)
+            if "query(" in kwargs["json"]["query"]:
+                return Mock(status_code=200, json=lambda: {"data": ids})
+            return Mock(status_code=200, json=lambda: {"data": {}})
+
+        github._http.request.side_effect = respond
+
+        url = github._create_pr_api("Title", "Body", "staging", "feature", 42)
+
+        assert url == pr["html_url"]
+        calls = github._http.request.call_args_list
+        assert len(calls) == 3
+        mutation = calls[-1][1]["json"]
+        assert mutation["variables"]["pr"] == "PR_7"
+        assert mutation["variables"]["inProgress"] == ["L_ip"]
+        assert pr["html_url"] in mutation["variables"]["body"]
+
+    @patch('github_integration.GitHubIntegration._link_pr_to_issue')
+    def test_create_pr_falls_back_to_rest_link(self, mock_link):
+        """Test the REST link path when the labels don't exist"""
+        github = self._github()
+        pr = {"number": 7, "node_id": "PR_7", "html_url": "https://github.com/owner/repo/pull/7"}
+
+        def respond(method, url, **kwargs):
+            if url.endswith("/pulls"):
+                return Mock(status_code=201, json=lambda: pr)
+            if url.endswith("/graphql"):
+                return Mock(status_code=200, json=lambda: {"data": {"repository": {
+                    "issue": {"id": "I_42"}, "needsReview": None, "inProgress": None}}})
+            return Mock(status_code=200)
+
+        github._http.request.side_effect = respond
+
+        github._create_pr_api("Title", "Body", "staging", "feature", 42)
+
+        mock_link.assert_called_once_with(42, pr["html_url"])
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
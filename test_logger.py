@@ -5,11 +5,12 @@ Tests WorkflowLogger functionality including logging, file operations, and metri
 Covers happy paths, edge cases, and error handling.
 """
 import pytest
+import gzip
 import json
 import tempfile
 from pathlib import Path
 from datetime import datetime
-from logger import WorkflowLogger, create_logger
+from logger import WorkflowLogger, create_logger, load_workflow
 
 
 class TestWorkflowLoggerInitialization:
@@ -56,12 +57,16 @@ class TestWorkflowLoggerInitialization:
             assert len(parts) == 2
 
     def test_init_creates_json_log_file(self):
-        """Test that JSON log file is created"""
+        """Test that the gzipped JSON summary is written when the logger closes"""
         with tempfile.TemporaryDirectory() as tmpdir:
             logger = WorkflowLogger(log_dir=Path(tmpdir))
+            assert logger.json_log_file.suffixes == [".json", ".gz"]
+
+            logger.close()
 
             assert logger.json_log_file.exists()
-            assert logger.json_log_file.suffix == ".json"
+            with gzip.open(logger.json_log_file, "rt") as f:
+                assert json.load(f)["workflow_id"] == logger.workflow_id
 
     def test_init_workflow_data_structure(self):
         """Test that workflow data has correct initial structure"""
@@ -75,6 +80,28 @@ class TestWorkflowLoggerInitialization:
             assert "status" in logger.workflow_data
             assert logger.workflow_data["status"] == "running"
 
+    def test_init_console_disabled(self, capsys):
+        """Test that console=False keeps log lines off the console but in the file"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = WorkflowLogger(log_dir=Path(tmpdir), workflow_id="no_console", console=False)
+
+            logger.log_user_story("Quiet story")
+            logger.close()
+
+            assert "Quiet story" not in capsys.readouterr().err
+            assert "Quiet story" in logger.log_file.read_text()
+
+    def test_init_console_disabled_by_env(self, capsys, monkeypatch):
+        """Test that AI_SCRUM_NO_CONSOLE disables the console by default"""
+        monkeypatch.setenv("AI_SCRUM_NO_CONSOLE", "1")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = WorkflowLogger(log_dir=Path(tmpdir), workflow_id="env_no_console")
+
+            logger.log_user_story("Quiet story")
+            logger.close()
+
+            assert "Quiet story" not in capsys.readouterr().err
+
 
 class TestLoggingUserStory:
     """Test logging user stories"""
@@ -89,19 +116,20 @@ class TestLoggingUserStory:
 
             assert logger.workflow_data["user_story"] == user_story
 
-    def test_log_user_story_saves_to_json(self):
-        """Test that logging user story saves to JSON file"""
+    def test_log_user_story_saves_to_event_log(self):
+        """Test that logging user story appends an event"""
         with tempfile.TemporaryDirectory() as tmpdir:
             logger = WorkflowLogger(log_dir=Path(tmpdir))
 
             user_story = "Add authentication feature"
             logger.log_user_story(user_story)
+            logger.flush()
 
-            # Read JSON file
-            with open(logger.json_log_file) as f:
-                data = json.load(f)
+            # Read JSONL event log
+            events = [json.loads(line) for line in logger.events_log_file.read_text().splitlines()]
 
-            assert data["user_story"] == user_story
+            assert events[-1]["event"] == "user_story"
+            assert events[-1]["user_story"] == user_story
 
     def test_log_long_user_story(self):
         """Test logging a very long user story"""
@@ -324,7 +352,7 @@ class TestWorkflowCompletion:
             logger.log_workflow_complete("approved")
 
             # Read JSON file
-            with open(logger.json_log_file) as f:
+            with gzip.open(logger.json_log_file, "rt") as f:
                 data = json.load(f)
 
             assert data["status"] == "approved"
@@ -382,25 +410,34 @@ class TestGetSummary:
 class TestJSONPersistence:
     """Test JSON file persistence"""
 
-    def test_json_file_created_on_init(self):
-        """Test that JSON file is created on initialization"""
+    def test_json_file_created_on_close(self):
+        """Test that the JSON summary is created once the logger closes"""
         with tempfile.TemporaryDirectory() as tmpdir:
             logger = WorkflowLogger(log_dir=Path(tmpdir))
+            logger.log_user_story("Test story")
+
+            logger.close()
 
             assert logger.json_log_file.exists()
+            assert load_workflow(logger.json_log_file)["user_story"] == "Test story"
 
-    def test_json_file_updated_on_changes(self):
-        """Test that JSON file is updated with each change"""
+    def test_event_log_appended_on_changes(self):
+        """Test that each change appends one event line"""
         with tempfile.TemporaryDirectory() as tmpdir:
             logger = WorkflowLogger(log_dir=Path(tmpdir))
 
             logger.log_user_story("Test story")
+            logger.log_agent_start("Architect", "Build")
+            logger.log_agent_end("Architect", {"success": True, "cost_usd": 0.05, "duration_ms": 5000, "num_turns": 3})
+            logger.flush()
 
-            # Read JSON file
-            with open(logger.json_log_file) as f:
-                data = json.load(f)
+            # Every line should be a complete JSON object
+            events = [json.loads(line) for line in logger.events_log_file.read_text().splitlines()]
 
-            assert data["user_story"] == "Test story"
+            assert [e["event"] for e in events] == ["workflow_start", "user_story", "agent_start", "agent_end"]
+            assert events[-1]["agent"] == "Architect"
+            assert events[-1]["cost_usd"] == 0.05
+            assert all("ts" in e for e in events)
 
     def test_json_file_valid_format(self):
         """Test that JSON file maintains valid format"""
@@ -410,9 +447,10 @@ class TestJSONPersistence:
             logger.log_user_story("Test story")
             logger.log_agent_start("Architect", "Build")
             logger.log_agent_end("Architect", {"success": True, "cost_usd": 0.05, "duration_ms": 5000, "num_turns": 3})
+            logger.log_workflow_complete("approved")
 
             # Should be able to read as valid JSON
-            with open(logger.json_log_file) as f:
+            with gzip.open(logger.json_log_file, "rt") as f:
                 data = json.load(f)
 
             # Check structure
@@ -421,6 +459,67 @@ class TestJSONPersistence:
             assert "agents" in data
             assert isinstance(data["agents"], list)
 
+    def test_json_file_timestamps_iso_formatted(self):
+        """Test that timestamps are written to the JSON summary as ISO strings"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = WorkflowLogger(log_dir=Path(tmpdir))
+
+            logger.log_agent_start("Architect", "Build")
+            logger.log_agent_end("Architect", {"success": True, "cost_usd": 0.05, "duration_ms": 5000, "num_turns": 3})
+            logger.log_workflow_complete("approved")
+
+            with gzip.open(logger.json_log_file, "rt") as f:
+                data = json.load(f)
+
+            start = datetime.fromisoformat(data["start_time"])
+            end = datetime.fromisoformat(data["end_time"])
+            assert start <= end
+            assert datetime.fromisoformat(data["agents"][0]["end_time"]) <= end
+
+
+    def test_json_saved_on_close_without_complete(self):
+        """Test that an unfinished workflow still gets its summary on close"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = WorkflowLogger(log_dir=Path(tmpdir))
+
+            logger.log_user_story("Test story")
+            assert not logger.json_log_file.exists()
+
+            logger.close()
+
+            data = load_workflow(logger.json_log_file)
+            assert data["status"] == "running"
+            assert data["end_time"] is None
+            assert data["user_story"] == "Test story"
+
+    def test_json_save_leaves_no_temp_files(self):
+        """Test that the summary is written in place via an atomic rename"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = WorkflowLogger(log_dir=Path(tmpdir))
+
+            logger.log_workflow_complete("approved")
+
+            assert sorted(p.name for p in Path(tmpdir).iterdir()) == sorted(
+                [logger.log_file.name, logger.json_log_file.name, logger.events_log_file.name]
+            )
+
+    def test_load_workflow_round_trip(self):
+        """Test that load_workflow reads back the saved summary"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = WorkflowLogger(log_dir=Path(tmpdir))
+
+            logger.log_user_story("Test story")
+            logger.log_agent_start("Architect", "Build")
+            logger.log_agent_end("Architect", {"success": True, "cost_usd": 0.05, "duration_ms": 5000, "num_turns": 3})
+            logger.log_workflow_complete("approved")
+
+            data = load_workflow(logger.json_log_file)
+
+            assert data["workflow_id"] == logger.workflow_id
+            assert data["status"] == "approved"
+            assert data["user_story"] == "Test story"
+            assert data["agents"][0]["num_turns"] == 3
+
 
 class TestLogFile:
     """Test text log file"""
@@ -438,6 +537,7 @@ class TestLogFile:
             logger = WorkflowLogger(log_dir=Path(tmpdir))
 
             logger.log_user_story("Test story")
+            logger.flush()
 
             # Read log file
             content = logger.log_file.read_text()
@@ -445,6 +545,36 @@ class TestLogFile:
             assert "Test story" in content
 
 
+    def test_log_file_written_once_idle(self):
+        """Test that buffered log lines reach the file when logging goes quiet"""
+        import time
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = WorkflowLogger(log_dir=Path(tmpdir))
+
+            logger.log_user_story("Test story")
+
+            # No flush(): the listener flushes by itself once its queue is empty
+            deadline = time.monotonic() + 5
+            while "Test story" not in logger.log_file.read_text() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert "Test story" in logger.log_file.read_text()
+            logger.close()
+
+    def test_log_file_written_on_complete(self):
+        """Test that completing the workflow writes out queued log lines"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = WorkflowLogger(log_dir=Path(tmpdir))
+
+            logger.log_user_story("Test story")
+            logger.log_workflow_complete("approved")
+
+            content = logger.log_file.read_text()
+
+            assert "Test story" in content
+            assert "WORKFLOW COMPLETE" in content
+
+
 class TestCreateLogger:
     """Test create_logger helper function"""
 
@@ -477,6 +607,25 @@ class TestEdgeCases:
             # Should not update anything since no matching start
             assert len(logger.workflow_data["agents"]) == 0
 
+    def test_log_agent_end_matches_most_recent_open_run(self):
+        """Test that agent end closes the latest unfinished run of that agent"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = WorkflowLogger(log_dir=Path(tmpdir))
+
+            logger.log_agent_start("Architect", "First")
+            logger.log_agent_start("Security", "Review")
+            logger.log_agent_start("Architect", "Second")
+            logger.log_agent_end("Architect", {"success": True, "cost_usd": 0.05, "duration_ms": 1000, "num_turns": 1})
+            logger.log_agent_end("Architect", {"success": True, "cost_usd": 0.05, "duration_ms": 1000, "num_turns": 1})
+            logger.log_agent_end("Architect", {"success": True, "cost_usd": 0.05, "duration_ms": 1000, "num_turns": 1})
+
+            agents = logger.workflow_data["agents"]
+            assert agents[0]["end_time"] is not None
+            assert agents[1]["end_time"] is None
+            assert agents[2]["end_time"] is not None
+            assert agents[2]["end_time"] <= agents[0]["end_time"]
+            assert logger.workflow_data["total_cost"] == pytest.approx(0.10)
+
     def test_log_empty_strings(self):
         """Test logging empty strings"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,125 @@
+"""
+Test suite for orchestrator.py
+
+Tests workflow-level decisions that do not need a live Claude Code agent.
+"""
+import pytest
+from unittest.mock import Mock, patch
+from orchestrator import Orchestrator, WorkflowResult
+from github_integration import GitHubIntegration
+
+
+class TestGitHubIntegrationSetup:
+    """Test how the orchestrator picks its GitHub integration"""
+
+    @patch.dict('orchestrator.GITHUB_CONFIG', {'enabled': False, 'auto_create_pr': False})
+    @patch.dict('orchestrator.WORKFLOW_CONFIG', {'auto_merge_on_approval': True, 'max_revisions': 0})
+    def test_supplied_github_prevents_auto_merge(self, tmp_path, monkeypatch):
+        """A caller-supplied integration survives a disabled GITHUB_CONFIG and blocks auto-merge"""
+        monkeypatch.chdir(tmp_path)
+        github = Mock()
+        orchestrator = Orchestrator(workspace_dir=tmp_path / "ws", github=github)
+        assert orchestrator.github is github
+
+        with patch.object(orchestrator, '_cleanup_workflow_branches'), \
+             patch.object(orchestrator, '_execute_workflow_sequence', return_value=True), \
+             patch.object(orchestrator, '_verify_ui_protection', return_value=True), \
+             patch.object(orchestrator, '_product_owner_review', return_value="APPROVE"), \
+             patch.object(orchestrator.git, 'merge_workflow_to_main') as merge:
+            result = orchestrator.process_user_story("As a user I want a test")
+
+        assert result.approved is True
+        merge.assert_not_called()
+
+    @patch.dict('orchestrator.GITHUB_CONFIG', {'enabled': False})
+    def test_no_github_when_disabled_and_not_supplied(self, tmp_path, monkeypatch):
+        """Without a supplied integration and with GitHub disabled there is none"""
+        monkeypatch.chdir(tmp_path)
+        orchestrator = Orchestrator(workspace_dir=tmp_path / "ws")
+        assert orchestrator.github is None
+
+
+class TestParallelReview:
+    """Test worktree bookkeeping of the parallel Security/Tester phase"""
+
+    def test_failed_worktree_add_removes_only_added_ones(self, tmp_path, monkeypatch):
+        """If the second worktree cannot be added, only the first is removed"""
+        monkeypatch.chdir(tmp_path)
+        orchestrator = Orchestrator(workspace_dir=tmp_path / "ws")
+        first = Mock(workspace=tmp_path / "security")
+
+        with patch.object(orchestrator.git, 'add_worktree', side_effect=[first, RuntimeError("boom")]), \
+             patch.object(orchestrator.git, 'remove_worktree') as remove:
+            with pytest.raises(RuntimeError):
+                orchestrator._run_review_phases_parallel("story", Mock())
+
+        first.close.assert_called_once()
+        remove.assert_called_once_with(first.workspace)
+
+    def test_conflict_fallback_keeps_pr_rows_aligned(self, tmp_path, monkeypatch):
+        """A discarded Tester run counts toward the totals but gets no PR table row"""
+        monkeypatch.chdir(tmp_path)
+        orchestrator = Orchestrator(workspace_dir=tmp_path / "ws")
+        orchestrator.logger = Mock()
+
+        def run(cost):
+            return {"success": True, "result": "done", "cost_usd": cost, "duration_ms": 1000}
+
+        result = WorkflowResult(user_story="story")
+        result.record_agent(run(0.1))  # Architect
+        tester_git = Mock(workspace=tmp_path / "tester")
+        tester_git.rebase_onto.return_value = False  # Conflict with Security
+
+        with patch.object(orchestrator.git, 'add_worktree', side_effect=[Mock(workspace=tmp_path / "security"), tester_git]), \
+             patch.object(orchestrator.git, 'remove_worktree'), \
+             patch.object(orchestrator.git, 'reset_branch'), \
+             patch.object(orchestrator.git, 'branch_has_commits', return_value=True), \
+             patch.object(orchestrator, '_execute_agent_with_retry',
+                          side_effect=[run(0.2), run(0.5), run(0.3)]):
+            assert orchestrator._run_review_phases_parallel("story", result) is True
+        result.record_agent(run(0.4))  # Product Owner
+
+        assert [agent["cost_usd"] for agent in result.agents] == [0.1, 0.2, 0.3, 0.4]
+        assert result.total_cost == pytest.approx(1.5)
+
+        github = GitHubIntegration({"enabled": True})
+        with patch.object(github, '_changed_files', return_value=""):
+            body = github._generate_pr_body(result, issue_number=None, base_branch="staging")
+        assert "| Tester | $0.300 |" in body
+        assert "| Product Owner | $0.400 |" in body
+
+
+class TestProductOwnerReviewReuse:
+    """Test reuse of Product Owner verdicts for an unchanged tester tree"""
+
+    def _review_twice(self, tmp_path, monkeypatch, verdict):
+        monkeypatch.chdir(tmp_path)
+        orchestrator = Orchestrator(workspace_dir=tmp_path / "ws")
+        orchestrator.logger = Mock()
+        po_result = {"success": True, "result": f"DECISION: {verdict}", "cost_usd": 0.1, "duration_ms": 5}
+
+        with patch.object(orchestrator.git, 'checkout_branch'), \
+             patch.object(orchestrator.git, 'list_files', return_value=["app.py"]), \
+             patch.object(orchestrator.git, 'tree_sha', return_value="abc123"), \
+             patch.object(orchestrator, '_execute_agent_with_retry', return_value=po_result) as run:
+            decisions = [orchestrator._product_owner_review("story", WorkflowResult()) for _ in range(2)]
+        return orchestrator, decisions, run
+
+    def test_unchanged_tree_reuses_verdict_within_run(self, tmp_path, monkeypatch):
+        """A second review of the same tree in one run costs no agent call"""
+        _, decisions, run = self._review_twice(tmp_path, monkeypatch, "REVISE")
+
+        assert decisions == ["REVISE", "REVISE"]
+        assert run.call_count == 1
+
+    def test_reject_is_never_reused(self, tmp_path, monkeypatch):
+        """A REJECT verdict is not remembered"""
+        orchestrator, decisions, run = self._review_twice(tmp_path, monkeypatch, "REJECT")
+
+        assert decisions == ["REJECT", "REJECT"]
+        assert run.call_count == 2
+        assert orchestrator._po_reviews == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
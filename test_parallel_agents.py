@@ -36,12 +36,14 @@ from typing import List, Dict, Any
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 import multiprocessing
+from unittest.mock import Mock
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from orchestrator import Orchestrator, WorkflowResult
 from deploy_parallel_agents import ParallelAgentManager
+from github_integration import Issue
 
 
 # Global functions for multiprocessing (can't use local functions)
@@ -457,6 +459,29 @@ class ParallelIntegrationTests(unittest.TestCase):
             if workspace.exists():
                 shutil.rmtree(workspace)
 
+    def test_dispatch_ready_issues(self):
+        """Test that ready GitHub issues are queued round-robin for the workers"""
+        workspace = Path(tempfile.mkdtemp(prefix="dispatch_test_"))
+
+        try:
+            manager = ParallelAgentManager(num_workers=2, mode="test", workspace_base=workspace)
+            github = Mock()
+            github.get_ready_issues.return_value = [
+                Issue(number=n, title=f"Feature {n}", labels=("ready-for-dev",), body="")
+                for n in (1, 2, 3)
+            ]
+
+            self.assertEqual(manager.dispatch_ready_issues(github, limit=3), 3)
+            github.get_ready_issues.assert_called_once_with('ready-for-dev', 3, include_body=True)
+
+            self.assertEqual(manager._queues[0].get(timeout=1)['number'], 1)
+            self.assertEqual(manager._queues[1].get(timeout=1)['number'], 2)
+            self.assertEqual(manager._queues[0].get(timeout=1)['number'], 3)
+
+        finally:
+            if workspace.exists():
+                shutil.rmtree(workspace)
+
 
 def _benchmark_task_1s(task_id):
     """Simulated 1-second task for benchmark suite"""
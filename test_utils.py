@@ -100,6 +100,10 @@ class TestSanitizeGithubText:
         result = sanitize_github_text("")
         assert result == ""
 
+    def test_clean_text_only_stripped(self):
+        result = sanitize_github_text("  Add login page\n")
+        assert result == "Add login page"
+
 
 class TestValidateBranchName:
     """Test validate_branch_name function"""
@@ -8,6 +8,9 @@ particularly for input sanitization and validation.
 import re
 from typing import Optional
 
+# Control characters other than tab and newline (includes the null byte)
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b-\x0c\x0e-\x1f]')
+
 
 def sanitize_user_input(text: str, max_length: int = 50000) -> str:
     """
@@ -65,7 +68,7 @@ def sanitize_commit_message(message: str) -> str:
     message = message.replace('\0', '')
 
     # Security: Remove control characters except newlines
-    message = re.sub(r'[\x00-\x08\x0b-\x0c\x0e-\x1f]', '', message)
+    message = _CONTROL_CHARS_RE.sub('', message)
 
     # Security: Limit message length to prevent DoS
     max_length = 5000
@@ -95,6 +98,10 @@ def sanitize_github_text(text: str, max_length: int = 10000) -> str:
     if not text:
         return ""
 
+    # Already-clean text that fits (the common case) needs no rewriting
+    if len(text) <= max_length and not _CONTROL_CHARS_RE.search(text):
+        return text.strip()
+
     # Security: Remove null bytes
     text = text.replace('\0', '')
 
@@ -103,7 +110,7 @@ def sanitize_github_text(text: str, max_length: int = 10000) -> str:
         text = text[:max_length] + "... (truncated for security)"
 
     # Security: Remove control characters except newlines and tabs
-    text = re.sub(r'[\x00-\x08\x0b-\x0c\x0e-\x1f]', '', text)
+    text = _CONTROL_CHARS_RE.sub('', text)
 
     return text.strip()
 